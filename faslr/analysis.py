@@ -1,3 +1,8 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
 from chainladder import Triangle
 
 from faslr.base_table import (
@@ -12,8 +17,17 @@ from faslr.constants import (
     VALUE_TYPES_COMBO_BOX_WIDTH
 )
 
+from faslr.results import (
+    cached_result,
+    ViewResultCache
+)
+
 from faslr.utilities.accessors import get_column
 
+from faslr.utilities.cache import LRUCache
+
+from functools import partial
+
 from PyQt6.QtCore import (
     Qt
 )
@@ -50,15 +64,30 @@ starting_value_lookup = {
 
 
 class AnalysisTab(QWidget):
+    """
+    Displays the values, link ratios and diagnostics of each column of a triangle.
+
+    Parameters
+    ----------
+    triangle: Triangle
+        The triangle to analyze.
+    lob: str
+        The line of business to select from the triangle, if it has more than one.
+    results: ViewResultCache
+        Where the diagnostics are stored, when the triangle is built from a project view. If None, the diagnostics
+        are calculated each time.
+    """
     # should eventually contain the TriangleColumnTab
     def __init__(
             self, triangle: Triangle,
-            lob: str = None
+            lob: str = None,
+            results: ViewResultCache = None
     ):
         super().__init__()
 
         self.triangle = triangle
         self.lob = lob
+        self.results = results
 
         self.layout = QVBoxLayout()
 
@@ -75,6 +104,10 @@ class AnalysisTab(QWidget):
         # Each view is identified by the column name.
         self.triangle_views = {}
 
+        # Triangle models already built for each column and value type, so that switching the value type back and
+        # forth doesn't rebuild them.
+        self.triangle_models = LRUCache(maxsize=len(VALUE_TYPES) * len(self.column_list))
+
         self.analysis_containers = {}
 
         self.diagnostic_containers = {}
@@ -114,13 +147,17 @@ class AnalysisTab(QWidget):
             self.mack_valuation_groupboxes[i] = MackAllYearGroupBox(
                 title="Mack Valuation Correlation Test - All Years",
                 triangle=triangle_column,
-                test_type="valuation correlation"
+                test_type="valuation correlation",
+                results=self.results,
+                column=i
             )
             self.diagnostic_containers[i].addWidget(self.mack_valuation_groupboxes[i])
 
             self.mack_valuation_individual_groupboxes[i] = MackIndividualGroupBox(
                 title="Mack Valuation Correlation Test - Individual Years",
-                triangle=triangle_column
+                triangle=triangle_column,
+                results=self.results,
+                column=i
             )
 
             self.diagnostic_containers[i].addWidget(self.mack_valuation_individual_groupboxes[i])
@@ -128,7 +165,9 @@ class AnalysisTab(QWidget):
             self.mack_development_groupboxes[i] = MackAllYearGroupBox(
                 title="Mack Development Correlation Test",
                 triangle=triangle_column,
-                test_type="development correlation"
+                test_type="development correlation",
+                results=self.results,
+                column=i
             )
 
             self.diagnostic_containers[i].addWidget(
@@ -149,6 +188,7 @@ class AnalysisTab(QWidget):
             self.analysis_containers[i].addWidget(self.diagnostic_widgets[i])
 
             triangle_model = TriangleModel(triangle_column, 'value')
+            self.triangle_models.put((i, 'value'), triangle_model)
             self.triangle_views[i].setModel(triangle_model)
 
             # self.analysis_containers[i].setStyleSheet(
@@ -239,35 +279,57 @@ class AnalysisTab(QWidget):
 
         if self.value_box.currentText() == "Link Ratios":
             value_type = 'ratio'
-            triangle = self.triangle.link_ratio
 
         elif self.value_box.currentText() == "Values":
             value_type = 'value'
-            triangle = self.triangle
 
         else:
             value_type = "diagnostics"
-            triangle = self.triangle
 
         for i in range(len(self.column_list)):
             index = i
             tab_name = self.column_tab.tabText(index)
 
             if value_type != "diagnostics":
-                triangle_column = triangle[self.column_list[index]]
+                triangle_model = self.triangle_models.get(
+                    key=(self.column_list[index], value_type),
+                    compute=partial(
+                        self.make_triangle_model,
+                        column=self.column_list[index],
+                        value_type=value_type
+                    )
+                )
 
-                triangle_model = TriangleModel(triangle_column, value_type)
                 self.triangle_views[tab_name].setModel(triangle_model)
                 self.analysis_containers[tab_name].setCurrentIndex(0)
             else:
                 self.analysis_containers[tab_name].setCurrentIndex(1)
 
+    def make_triangle_model(
+            self,
+            column: str,
+            value_type: str
+    ) -> TriangleModel:
+
+        triangle_column = get_column(
+            triangle=self.triangle,
+            column=column,
+            lob=self.lob
+        )
+
+        if value_type == 'ratio':
+            triangle_column = triangle_column.link_ratio
+
+        return TriangleModel(triangle_column, value_type)
+
 
 class MackValuationModel(FAbstractTableModel):
     def __init__(
         self,
         triangle: Triangle,
-        critical: QDoubleSpinBox
+        critical: QDoubleSpinBox,
+        results: ViewResultCache = None,
+        column: str = None
     ):
         super(
             MackValuationModel,
@@ -276,6 +338,8 @@ class MackValuationModel(FAbstractTableModel):
 
         self.triangle = triangle
         self.spin_box = critical
+        self.results = results
+        self.column = column
         self.critical_value = self.spin_box.value()
         self._data = None
 
@@ -327,16 +391,41 @@ class MackValuationModel(FAbstractTableModel):
 
     def calculate(self):
         self.critical_value = self.spin_box.value()
+
+        result = cached_result(
+            results=self.results,
+            key=("valuation correlation", "individual years", self.column, self.critical_value),
+            compute=self.test_individual_years
+        )
+
+        self._data = pd.DataFrame(
+            data=result['values'],
+            index=result['index'],
+            columns=result['columns']
+        )
+
+    def test_individual_years(self) -> dict:
+        """
+        Runs the valuation correlation test for each year, returning the results as arrays so that they can be
+        stored in a ViewResultCache.
+        """
+
         corr = self.triangle.valuation_correlation(
             p_critical=self.critical_value,
             total=False
         ).z_critical
 
-        self._data = corr.to_frame(
+        frame = corr.to_frame(
             origin_as_datetime=False
         )
 
-        self._data = self._data.rename(index={min(self._data.index): 'Status'})
+        frame = frame.rename(index={min(frame.index): 'Status'})
+
+        return {
+            'values': frame.to_numpy(dtype=bool),
+            'index': frame.index.astype(str).to_numpy(),
+            'columns': frame.columns.astype(str).to_numpy()
+        }
 
     def recalculate(self):
 
@@ -365,13 +454,17 @@ class MackResultLabel(QLabel):
             self,
             spin: QDoubleSpinBox,
             triangle: Triangle,
-            test_type: str
+            test_type: str,
+            results: ViewResultCache = None,
+            column: str = None
     ):
         super().__init__()
 
         self.spin = spin
         self.triangle = triangle
         self.test_type = test_type
+        self.results = results
+        self.column = column
         self.test_bool = None
 
         self.update_result()
@@ -380,21 +473,38 @@ class MackResultLabel(QLabel):
 
     def update_result(self):
 
+        if self.test_type not in starting_value_lookup:
+            raise ValueError("Invalid test-type indicated.")
+
+        p_critical = self.spin.value()
+
+        result = cached_result(
+            results=self.results,
+            key=(self.test_type, "all years", self.column, p_critical),
+            compute=lambda: {'status': self.test_all_years(p_critical=p_critical)}
+        )
+
+        self.test_bool = bool(result['status'])
+
+        self.setText("Status: " + pass_alias[self.test_bool])
+
+    def test_all_years(
+            self,
+            p_critical: float
+    ) -> np.ndarray:
+
         if self.test_type == "valuation correlation":
-            self.test_bool = self.triangle.valuation_correlation(
-                p_critical=self.spin.value(),
+            test_bool = self.triangle.valuation_correlation(
+                p_critical=p_critical,
                 total=True
             ).z_critical.values[0][0]
 
-        elif self.test_type == "development correlation":
-            self.test_bool = self.triangle.development_correlation(
-                p_critical=self.spin.value()
-            ).t_critical.values[0][0]
-
         else:
-            raise ValueError("Invalid test-type indicated.")
+            test_bool = self.triangle.development_correlation(
+                p_critical=p_critical
+            ).t_critical.values[0][0]
 
-        self.setText("Status: " + pass_alias[self.test_bool])
+        return np.array(test_bool, dtype=bool)
 
 
 class MackCriticalSpinBox(QDoubleSpinBox):
@@ -420,7 +530,9 @@ class MackAllYearGroupBox(QGroupBox):
             self,
             title: str,
             triangle: Triangle,
-            test_type: str
+            test_type: str,
+            results: ViewResultCache = None,
+            column: str = None
     ):
         super().__init__()
 
@@ -443,7 +555,9 @@ class MackAllYearGroupBox(QGroupBox):
         self.test_result_label = MackResultLabel(
             spin=self.spin_box,
             triangle=triangle,
-            test_type=self.test_type
+            test_type=self.test_type,
+            results=results,
+            column=column
         )
 
         self.critical_layout.addRow(
@@ -474,7 +588,9 @@ class MackIndividualGroupBox(QGroupBox):
     def __init__(
         self,
         title: str,
-        triangle: Triangle
+        triangle: Triangle,
+        results: ViewResultCache = None,
+        column: str = None
     ):
         super().__init__()
 
@@ -533,7 +649,9 @@ class MackIndividualGroupBox(QGroupBox):
 
         self.individual_model = MackValuationModel(
             triangle=self.triangle,
-            critical=self.spin_box
+            critical=self.spin_box,
+            results=results,
+            column=column
         )
 
         self.individual_view = MackValuationView()
@@ -1,16 +1,25 @@
 """
 Contains base table classes.
 """
+from __future__ import annotations
+
 import csv
 import io
 
+import numpy as np
 import pandas as pd
 
 from faslr.common.table import make_corner_button
 
+from typing import (
+    Any,
+    Callable
+)
+
 from PyQt6.QtCore import (
     QAbstractTableModel,
-    QEvent
+    QEvent,
+    Qt
 )
 
 from PyQt6.QtWidgets import (
@@ -26,12 +35,181 @@ from PyQt6.QtWidgets import (
 class FAbstractTableModel(QAbstractTableModel):
     """
     Base table model class for (almost) all tables in FASLR.
+
+    Looking up a cell of a DataFrame with iloc takes several microseconds, which adds up since Qt calls data() for
+    every visible cell on each repaint. The model therefore keeps a snapshot of _data as a NumPy array, along with
+    its row and column labels and the formatter for each column. Subclasses can opt in by using value(),
+    column_name(), column_label(), index_label() and format_value() in place of _data.iloc and friends.
+
+    The snapshot is rebuilt on first use after _data is assigned, or after the model emits dataChanged,
+    layoutChanged or modelReset. Subclasses that modify _data in place must emit one of these before the next
+    lookup, which the models in FASLR already do so that their views refresh.
+
+    Models that recalculate their data should hand the result to update_data() rather than emitting layoutChanged,
+    so that the views only repaint the cells that actually changed.
+
+    Attributes
+    ----------
+
+    formatters: dict
+        Maps column names to callables that turn a value of that column into display text. Columns without
+        an entry are displayed with default_formatter.
     """
     def __init__(self):
         super().__init__()
 
+        self._snapshot = None
+        self._frame = None
+
+        self.formatters = {}
+        self.default_formatter = str
+
         self._data = pd.DataFrame()
 
+        for signal in [
+            self.dataChanged,
+            self.layoutChanged,
+            self.modelReset,
+            self.rowsInserted,
+            self.rowsRemoved,
+            self.columnsInserted,
+            self.columnsRemoved
+        ]:
+            signal.connect(self.invalidate_snapshot) # noqa
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        return self._frame
+
+    @_data.setter
+    def _data(
+            self,
+            data: pd.DataFrame
+    ) -> None:
+
+        self._frame = data
+        self._snapshot = None
+
+    def invalidate_snapshot(self, *args) -> None:
+        self._snapshot = None
+
+    def update_data(
+            self,
+            data: pd.DataFrame
+    ) -> None:
+        """
+        Replaces _data and notifies the views of what changed. If the shape is the same, dataChanged is emitted for
+        each block of consecutive rows that contain changed values, and headerDataChanged for any relabelled rows or
+        columns. Otherwise, the layout has changed and the views have to query the whole table again.
+
+        Parameters
+        ----------
+        data: DataFrame
+            The new data. Must not share memory with the current _data, otherwise in-place changes made to it have
+            already been made to the current data and won't be detected. Make a copy before modifying it.
+        """
+
+        previous = self._frame
+
+        if previous is None or previous.shape != data.shape:
+            # noinspection PyUnresolvedReferences
+            self.layoutAboutToBeChanged.emit()
+            self._data = data
+            # noinspection PyUnresolvedReferences
+            self.layoutChanged.emit()
+            return
+
+        blocks = changed_blocks(
+            previous=previous.to_numpy(dtype=object),
+            current=data.to_numpy(dtype=object)
+        )
+
+        self._data = data
+
+        for orientation, old_labels, new_labels in [
+            (Qt.Orientation.Horizontal, previous.columns, data.columns),
+            (Qt.Orientation.Vertical, previous.index, data.index)
+        ]:
+            relabelled = np.flatnonzero(old_labels.to_numpy(dtype=object) != new_labels.to_numpy(dtype=object))
+            if relabelled.size:
+                # noinspection PyUnresolvedReferences
+                self.headerDataChanged.emit(
+                    orientation,
+                    int(relabelled[0]),
+                    int(relabelled[-1])
+                )
+
+        for top, left, bottom, right in blocks:
+            # noinspection PyUnresolvedReferences
+            self.dataChanged.emit(
+                self.index(top, left),
+                self.index(bottom, right)
+            )
+
+    @property
+    def snapshot(self) -> TableSnapshot:
+
+        if self._snapshot is None:
+            self._snapshot = TableSnapshot(
+                data=self._frame,
+                formatters=self.formatters,
+                default_formatter=self.default_formatter
+            )
+
+        return self._snapshot
+
+    def value(
+            self,
+            row: int,
+            column: int
+    ) -> Any:
+        """
+        Equivalent to self._data.iloc[row, column].
+        """
+
+        return self.snapshot.values[row, column]
+
+    def column_name(
+            self,
+            column: int
+    ) -> Any:
+        """
+        Equivalent to self._data.columns[column].
+        """
+
+        return self.snapshot.columns[column]
+
+    def column_label(
+            self,
+            column: int
+    ) -> str:
+        """
+        Equivalent to str(self._data.columns[column]).
+        """
+
+        return self.snapshot.column_labels[column]
+
+    def index_label(
+            self,
+            row: int
+    ) -> str:
+        """
+        Equivalent to str(self._data.index[row]).
+        """
+
+        return self.snapshot.index_labels[row]
+
+    def format_value(
+            self,
+            row: int,
+            column: int
+    ) -> str:
+        """
+        Applies the column's formatter to the value at the given position.
+        """
+
+        return self.snapshot.column_formatters[column](self.snapshot.values[row, column])
+
     def rowCount(
             self,
             parent=None,
@@ -51,6 +229,62 @@ class FAbstractTableModel(QAbstractTableModel):
         return self._data.shape[1]
 
 
+def changed_blocks(
+        previous: np.ndarray,
+        current: np.ndarray
+) -> list:
+    """
+    Compares two 2-D arrays of the same shape and returns the regions containing the values that differ, as a list of
+    (top, left, bottom, right) tuples, one for each run of consecutive changed rows. Each region spans the columns
+    from the first to the last changed column within its rows. Missing values are considered equal to each other.
+    """
+
+    changed = ~((previous == current) | (pd.isna(previous) & pd.isna(current)))
+
+    rows = np.flatnonzero(changed.any(axis=1))
+
+    if rows.size == 0:
+        return []
+
+    # Split the changed rows wherever there is a gap between them.
+    runs = np.split(rows, np.flatnonzero(np.diff(rows) > 1) + 1)
+
+    blocks = []
+    for run in runs:
+        columns = np.flatnonzero(changed[run[0]:run[-1] + 1].any(axis=0))
+        blocks += [(int(run[0]), int(columns[0]), int(run[-1]), int(columns[-1]))]
+
+    return blocks
+
+
+class TableSnapshot:
+    """
+    Copy of a DataFrame's values and labels in plain NumPy arrays and lists, used by FAbstractTableModel.
+
+    Parameters
+    ----------
+
+    data: DataFrame
+        The DataFrame to copy.
+    formatters: dict
+        Maps column names to callables that format a value of that column for display.
+    default_formatter: Callable
+        The formatter used for columns that are not in formatters.
+    """
+    def __init__(
+            self,
+            data: pd.DataFrame,
+            formatters: dict,
+            default_formatter: Callable
+    ):
+
+        self.values = data.to_numpy(dtype=object)
+        self.columns = list(data.columns)
+        self.column_labels = [str(column) for column in self.columns]
+        self.index_labels = [str(label) for label in data.index]
+        self.column_formatters = [formatters.get(column, default_formatter) for column in self.columns]
+
+
 class FTableView(QTableView):
     """
     Base class for displaying tables in FASLR.
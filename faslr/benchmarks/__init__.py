@@ -0,0 +1,4 @@
+"""
+Scripts for timing the parts of FASLR that scale with the size of a triangle. Run each module directly, e.g.,
+python -m faslr.benchmarks.factor_benchmark
+"""
@@ -0,0 +1,127 @@
+"""
+Times saving the data behind a project view, comparing the ORM objects that DataPane.save_to_db used to build for
+each row against bulk_insert. Each run writes to a new database in a temporary directory.
+
+- ORM (add_all): one ProjectViewData object per row, added to a session and committed
+- Bulk insert: bulk_insert inside sqlite_pragmas with BULK_INSERT_PRAGMAS
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import faslr.schema as schema
+
+from faslr.connection import (
+    dispose_engine,
+    get_engine
+)
+
+from faslr.constants import BULK_INSERT_PRAGMAS
+
+from faslr.schema import (
+    ProjectViewData,
+    ProjectViewTable
+)
+
+from faslr.utilities.queries import (
+    bulk_insert,
+    sqlite_pragmas
+)
+
+from sqlalchemy.orm import Session
+
+SIZES = [10000, 100000, 500000]
+
+
+def claim_data(n_rows: int) -> pd.DataFrame:
+    """
+    Random claim-level records for a single project view.
+    """
+
+    rng = np.random.default_rng(0)
+
+    accident_year = rng.integers(1990, 2020, size=n_rows)
+
+    return pd.DataFrame(
+        {
+            'view_id': 1,
+            'accident_year': accident_year,
+            'calendar_year': accident_year + rng.integers(0, 10, size=n_rows),
+            'paid_loss': rng.gamma(2, 5000, size=n_rows),
+            'reported_loss': rng.gamma(2, 6000, size=n_rows)
+        }
+    )
+
+
+def new_database(directory: str, name: str) -> str:
+
+    db_path = os.path.join(directory, name)
+
+    engine = get_engine(db_path=db_path, create=True)
+    schema.Base.metadata.create_all(engine)
+
+    with Session(bind=engine) as session:
+        session.add(ProjectViewTable(view_id=1, name='Benchmark'))
+        session.commit()
+
+    return db_path
+
+
+def orm_insert(db_path: str, data: pd.DataFrame) -> None:
+
+    with Session(bind=get_engine(db_path=db_path)) as session:
+        session.add_all([ProjectViewData(**record) for record in data.to_dict('records')])
+        session.commit()
+
+
+def fast_insert(db_path: str, data: pd.DataFrame) -> None:
+
+    with get_engine(db_path=db_path).connect() as connection, \
+            sqlite_pragmas(connection=connection, pragmas=BULK_INSERT_PRAGMAS):
+        bulk_insert(
+            connection=connection,
+            table=ProjectViewData.__table__,
+            data=data
+        )
+
+
+def benchmark(n_rows: int) -> dict:
+
+    data = claim_data(n_rows=n_rows)
+
+    results = {"Rows": n_rows}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, insert in [
+            ("ORM (add_all)", orm_insert),
+            ("Bulk insert", fast_insert)
+        ]:
+            db_path = new_database(directory=directory, name=label + '.db')
+
+            start = time.perf_counter()
+            insert(db_path, data)
+            results[label + " (rows/sec)"] = n_rows / (time.perf_counter() - start)
+
+            dispose_engine(db_path=db_path)
+
+    return results
+
+
+def main() -> None:
+
+    results = [benchmark(n_rows=n_rows) for n_rows in SIZES]
+
+    headers = list(results[0].keys())
+    print("  ".join("{0:>28}".format(header) for header in headers))
+
+    for result in results:
+        print("  ".join(
+            "{0:>28,.0f}".format(value) for value in result.values()
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Times the recalculation of the LDF averages in FactorModel against the size of the triangle.
+
+For each triangle size, a random 5% of the link ratios are struck out, and the following are timed:
+
+- Drop list (iloc scan): building the drop list for cl.Development by scanning excl_frame one cell at a time, as
+  FactorModel did before it kept an exclusion mask
+- Drop list (mask): building the same drop list from the exclusion mask
+- Column update: recalculating the averages of a single column after a link ratio is struck out
+- Full refit: refitting every average over the whole triangle
+"""
+import sys
+import timeit
+
+import numpy as np
+
+from faslr.benchmarks.triangles import synthetic_triangle
+
+from faslr.factor import FactorModel
+
+from PyQt6.QtWidgets import QApplication
+
+SIZES = [10, 30, 60, 120, 240]
+
+
+def iloc_drop_list(factor_model: FactorModel) -> list:
+    """
+    The per-cell scan of excl_frame that FactorModel used to build its drop list with, kept for comparison.
+    """
+    drop_list = []
+    for i in range(factor_model.link_frame.shape[0]):
+        for j in range(factor_model.link_frame.shape[1]):
+
+            exclude = factor_model.excl_frame.iloc[[i], [j]].squeeze()
+
+            if exclude:
+                row_drop = str(factor_model.link_frame.iloc[i].name)
+                col_drop = int(str(factor_model.link_frame.columns[j]).split('-')[0])
+
+                drop_list.append((row_drop, col_drop))
+
+    return drop_list
+
+
+def mask_drop_list(factor_model: FactorModel) -> list:
+    """
+    Builds the same drop list from the exclusion mask, as FactorModel did before it stopped fitting cl.Development.
+    """
+    rows, columns = np.nonzero(factor_model.excl_mask)
+
+    origins = factor_model.link_frame.index.astype(str).to_numpy()
+    ages = np.array([int(str(col).split('-')[0]) for col in factor_model.link_frame.columns])
+
+    return list(zip(origins[rows], ages[columns].tolist()))
+
+
+def best_of(
+        statement,
+        repeat: int
+) -> float:
+    """
+    Returns the fastest of several runs in milliseconds.
+    """
+    return min(timeit.repeat(statement, number=1, repeat=repeat)) * 1000
+
+
+def benchmark(n_periods: int) -> dict:
+
+    factor_model = FactorModel(triangle=synthetic_triangle(n_periods=n_periods))
+
+    rng = np.random.default_rng(0)
+
+    # Strike out a random 5% of the observed link ratios.
+    rows, columns = np.nonzero(~np.isnan(factor_model.link_frame.to_numpy(dtype=float)))
+    n_exclude = max(len(rows) // 20, 1)
+    for k in rng.choice(len(rows), size=n_exclude, replace=False):
+        factor_model.toggle_exclude(index=factor_model.index(rows[k], columns[k]))
+
+    assert iloc_drop_list(factor_model) == mask_drop_list(factor_model)
+
+    # Fewer repetitions for the slowest operations on the largest triangles.
+    repeat = 3 if n_periods > 60 else 10
+
+    results = {
+        "Size": "{0}x{0}".format(n_periods),
+        "Excluded": n_exclude,
+        "Drop list (iloc scan) (ms)": best_of(lambda: iloc_drop_list(factor_model), repeat=1),
+        "Drop list (mask) (ms)": best_of(lambda: mask_drop_list(factor_model), repeat=repeat),
+        "Column update (ms)": best_of(lambda: factor_model.recalculate_column(column=0), repeat=repeat),
+        "Full refit (ms)": best_of(factor_model.recalculate_factors, repeat=repeat)
+    }
+
+    # The column update should agree with the full refit.
+    assert np.allclose(
+        factor_model.calculate_column_factors(column=0),
+        factor_model.factor_frame.iloc[:, 0].to_numpy(dtype=float),
+        equal_nan=True
+    )
+
+    return results
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv) # noqa
+
+    results = [benchmark(n_periods=n_periods) for n_periods in SIZES]
+
+    headers = list(results[0].keys())
+    print("  ".join("{0:>24}".format(header) for header in headers))
+
+    for result in results:
+        print("  ".join(
+            "{0:>24,.2f}".format(value) if isinstance(value, float) else "{0:>24}".format(value)
+            for value in result.values()
+        ))
+
+
+if __name__ == "__main__":
+    main()
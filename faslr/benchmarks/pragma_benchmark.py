@@ -0,0 +1,175 @@
+"""
+Times an import into a project database while other processes keep reading from it, under each of the PRAGMA
+profiles in DB_PRAGMA_PROFILES. Each run writes to a new database in a temporary directory, with the import either
+saved in one transaction, as DataPane imports do, or committed every COMMIT_SIZE rows, as a long-running feed would.
+
+- Import (rows/sec): rows written per second by bulk_insert
+- Reads/sec: queries completed by the reading processes while the import runs
+- Max read (ms): the longest any query took, e.g., while waiting for the import to release its lock
+- Failed reads: queries that gave up with "database is locked"
+"""
+import multiprocessing
+import tempfile
+import time
+
+import faslr.core as core
+
+from faslr.benchmarks.bulk_insert_benchmark import (
+    claim_data,
+    new_database
+)
+
+from faslr.connection import (
+    dispose_engine,
+    get_engine,
+    set_journal_mode
+)
+
+from faslr.constants import (
+    BULK_INSERT_PRAGMAS,
+    DB_PRAGMA_PROFILES
+)
+
+from faslr.schema import ProjectViewData
+
+from faslr.utilities.queries import (
+    bulk_insert,
+    sqlite_pragmas
+)
+
+from sqlalchemy.exc import OperationalError
+
+N_ROWS = 200000
+
+COMMIT_SIZE = 1000
+
+N_READERS = 3
+
+READ_QUERY = "SELECT accident_year, SUM(paid_loss) FROM project_view_data WHERE view_id = 1 GROUP BY accident_year"
+
+
+def read(
+        db_path: str,
+        profile: str,
+        ready: multiprocessing.Barrier,
+        stop: multiprocessing.Event,
+        results: multiprocessing.Queue
+) -> None:
+    """
+    Runs READ_QUERY until stopped, then reports the number of reads, the longest read and the number of failures.
+    """
+
+    core.set_pragma_profile(profile)
+    engine = get_engine(db_path=db_path)
+
+    n_reads = 0
+    n_failures = 0
+    max_latency = 0
+
+    ready.wait()
+
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            with engine.connect() as connection:
+                connection.exec_driver_sql(READ_QUERY).all()
+        except OperationalError:
+            n_failures += 1
+        else:
+            n_reads += 1
+        max_latency = max(max_latency, time.perf_counter() - start)
+
+    engine.dispose()
+    results.put((n_reads, max_latency, n_failures))
+
+
+def write(
+        db_path: str,
+        commit_size: int
+) -> None:
+
+    data = claim_data(n_rows=N_ROWS)
+
+    with get_engine(db_path=db_path).connect() as connection, \
+            sqlite_pragmas(connection=connection, pragmas=BULK_INSERT_PRAGMAS):
+
+        for start in range(0, N_ROWS, commit_size):
+            with connection.begin():
+                bulk_insert(
+                    connection=connection,
+                    table=ProjectViewData.__table__,
+                    data=data.iloc[start:start + commit_size]
+                )
+
+
+def benchmark(
+        profile: str,
+        commit_size: int
+) -> dict:
+
+    core.set_pragma_profile(profile)
+
+    with tempfile.TemporaryDirectory() as directory:
+
+        db_path = new_database(directory=directory, name=profile + '.db')
+        set_journal_mode(db_path=db_path)
+
+        # Give the readers something to read before the import starts.
+        write(db_path=db_path, commit_size=N_ROWS)
+
+        ready = multiprocessing.Barrier(N_READERS + 1)
+        stop = multiprocessing.Event()
+        results = multiprocessing.Queue()
+
+        readers = [
+            multiprocessing.Process(target=read, args=(db_path, profile, ready, stop, results))
+            for _ in range(N_READERS)
+        ]
+
+        for reader in readers:
+            reader.start()
+
+        ready.wait()
+
+        start = time.perf_counter()
+        write(db_path=db_path, commit_size=commit_size)
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        reader_results = [results.get() for _ in readers]
+
+        for reader in readers:
+            reader.join()
+
+        dispose_engine(db_path=db_path)
+
+    return {
+        "Profile": profile,
+        "Rows per commit": commit_size,
+        "Import (rows/sec)": N_ROWS / elapsed,
+        "Reads/sec": sum(n_reads for n_reads, _, _ in reader_results) / elapsed,
+        "Max read (ms)": 1000 * max(latency for _, latency, _ in reader_results),
+        "Failed reads": sum(n_failures for _, _, n_failures in reader_results)
+    }
+
+
+def main() -> None:
+
+    results = [
+        benchmark(profile=profile, commit_size=commit_size)
+        for commit_size in [N_ROWS, COMMIT_SIZE]
+        for profile in DB_PRAGMA_PROFILES
+    ]
+
+    headers = list(results[0].keys())
+    print("  ".join("{0:>18}".format(header) for header in headers))
+
+    for result in results:
+        print("  ".join(
+            "{0:>18}".format(value) if isinstance(value, str) else "{0:>18,.0f}".format(value)
+            for value in result.values()
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Times how long it takes to paint a TriangleModel in a TriangleView, comparing the precomputed display strings in
+TriangleModel.data against formatting each value as it is painted.
+
+The view is sized so that every cell of a 240x240 triangle, 57,600 cells in all, is visible, and the whole view is
+rendered with QWidget.grab, which calls data() for each cell and role just like an on-screen repaint.
+"""
+import sys
+import timeit
+
+from faslr.benchmarks.triangles import synthetic_triangle
+
+from faslr.style.triangle import (
+    BLANK_TEXT,
+    LOWER_DIAG_COLOR,
+    RATIO_STYLE,
+    VALUE_STYLE
+)
+
+from faslr.triangle_model import (
+    TriangleModel,
+    TriangleView
+)
+
+from PyQt6.QtCore import (
+    Qt,
+    QVariant
+)
+
+from PyQt6.QtWidgets import QApplication
+
+N_PERIODS = 240
+CELL_WIDTH = 20
+CELL_HEIGHT = 10
+
+
+class LegacyTriangleModel(TriangleModel):
+    """
+    TriangleModel with the data() method it had before the display strings were precomputed, kept for comparison.
+    """
+    def data(
+            self,
+            index,
+            role=None
+    ):
+
+        if role == Qt.ItemDataRole.DisplayRole:
+
+            value = self._data.iloc[index.row(), index.column()]
+
+            if str(value) == "nan":
+
+                display_value = BLANK_TEXT
+            else:
+                if self.value_type == "value":
+
+                    display_value = VALUE_STYLE.format(value)
+
+                else:
+
+                    display_value = RATIO_STYLE.format(value)
+
+                display_value = str(display_value)
+
+            self.setData(
+                self.index(
+                    index.row(),
+                    index.column()
+                ),
+                QVariant(Qt.AlignmentFlag.AlignRight),
+                Qt.ItemDataRole.TextAlignmentRole
+            )
+
+            return display_value
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight
+
+        if role == Qt.ItemDataRole.BackgroundRole and (index.column() >= self.n_rows - index.row()):
+
+            return LOWER_DIAG_COLOR
+
+
+def query_all(model: TriangleModel) -> None:
+    """
+    Requests the roles a view asks for when painting, for every cell, without doing any painting.
+    """
+
+    roles = [
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.TextAlignmentRole,
+        Qt.ItemDataRole.BackgroundRole
+    ]
+
+    for row in range(model.rowCount()):
+        for column in range(model.columnCount()):
+            index = model.index(row, column)
+            for role in roles:
+                model.data(index, role)
+
+
+def make_view(model: TriangleModel) -> TriangleView:
+
+    view = TriangleView()
+    view.setModel(model)
+
+    view.horizontalHeader().setMinimumSectionSize(CELL_WIDTH)
+    view.horizontalHeader().setDefaultSectionSize(CELL_WIDTH)
+    view.verticalHeader().setMinimumSectionSize(CELL_HEIGHT)
+    view.verticalHeader().setDefaultSectionSize(CELL_HEIGHT)
+
+    view.resize(
+        view.verticalHeader().width() + CELL_WIDTH * (model.columnCount() + 2),
+        view.horizontalHeader().height() + CELL_HEIGHT * (model.rowCount() + 2)
+    )
+
+    return view
+
+
+def main() -> None:
+
+    app = QApplication(sys.argv) # noqa
+
+    triangle = synthetic_triangle(n_periods=N_PERIODS)
+
+    print("{0:,} visible cells".format(N_PERIODS * N_PERIODS))
+    print("{0:>28}{1:>16}{2:>16}{3:>16}".format("", "Build (ms)", "data() (ms)", "Paint (ms)"))
+
+    for label, model_class in [("Format on paint", LegacyTriangleModel), ("Precomputed strings", TriangleModel)]:
+
+        build = min(timeit.repeat(lambda: model_class(triangle, 'value'), number=1, repeat=3)) * 1000
+
+        model = model_class(triangle, 'value')
+
+        query = min(timeit.repeat(lambda: query_all(model), number=1, repeat=3)) * 1000
+
+        view = make_view(model)
+
+        paint = min(timeit.repeat(view.grab, number=1, repeat=3)) * 1000
+
+        print("{0:>28}{1:>16,.1f}{2:>16,.1f}{3:>16,.1f}".format(label, build, query, paint))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Synthetic triangles of arbitrary size for benchmarking.
+"""
+import chainladder as cl
+import numpy as np
+import pandas as pd
+
+from chainladder import Triangle
+
+
+def synthetic_triangle(
+        n_periods: int,
+        seed: int = 42
+) -> Triangle:
+    """
+    Generates a square, cumulative triangle of monthly origin and development periods.
+
+    :param n_periods: The number of origin and development periods.
+    :param seed: Seed for the random number generator, so that benchmarks are repeatable.
+    :return: A triangle with a single column named "Paid Claims".
+    """
+
+    rng = np.random.default_rng(seed)
+
+    origins = pd.date_range(
+        start="2000-01-01",
+        periods=n_periods,
+        freq="MS"
+    )
+
+    # Incremental payments that decay with age, scaled by a random exposure for each origin period.
+    exposure = rng.uniform(5e5, 1.5e6, size=n_periods)
+    decay = np.exp(-np.arange(n_periods) / max(n_periods / 6, 1))
+    noise = rng.uniform(0.8, 1.2, size=(n_periods, n_periods))
+    cumulative = np.cumsum(exposure[:, None] * decay[None, :] * noise, axis=1)
+
+    # Keep only the upper-left portion of the square, i.e., the valuations that have already happened.
+    origin_index, dev_index = np.indices((n_periods, n_periods))
+    observed = origin_index + dev_index < n_periods
+
+    valuations = origins.to_period("M")[origin_index[observed]] + dev_index[observed]
+
+    df = pd.DataFrame({
+        "origin": origins[origin_index[observed]],
+        "valuation": valuations.to_timestamp(how="e"),
+        "Paid Claims": cumulative[observed]
+    })
+
+    return cl.Triangle(
+        data=df,
+        origin="origin",
+        development="valuation",
+        columns=["Paid Claims"],
+        cumulative=True
+    )
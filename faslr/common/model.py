@@ -123,7 +123,7 @@ class FSelectionModel(FAbstractTableModel):
         """
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
+            value = self.value(index.row(), index.column())
 
             # If value is nan, display blank. Otherwise, display the string representation.
             if np.isnan(value):
@@ -141,10 +141,10 @@ class FSelectionModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_label(p_int)
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.index_label(p_int)
 
     def setData(self, index: QModelIndex, value: Any, role = ...) -> bool:
         """
@@ -183,17 +183,16 @@ class FSelectionModel(FAbstractTableModel):
             self.selected_ratios_row = self.selected_ratios_row.set_index(self.df_ratio.index.name)
 
         # Combine ratios, averages and spacer rows into a single DataFrame.
-        self._data = pd.concat([
-            self.df_ratio,
-            spacer_row,
-            section_header_row,
-            self.average_frame,
-            spacer_row,
-            self.selected_ratios_row
-        ])
-
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+        self.update_data(
+            pd.concat([
+                self.df_ratio,
+                spacer_row,
+                section_header_row,
+                self.average_frame,
+                spacer_row,
+                self.selected_ratios_row
+            ])
+        )
 
         return True
 
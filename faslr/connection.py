@@ -2,34 +2,30 @@ from __future__ import annotations
 import configparser
 import logging
 import os
+import threading
 import faslr.schema as schema
 import sqlalchemy as sa
 
+from contextlib import contextmanager
+
 from faslr.constants import (
     CONFIG_PATH,
+    DB_ECHO,
+    DB_JOURNAL_MODE_TIMEOUT,
+    DB_JOURNAL_MODES,
+    DB_MAX_OVERFLOW,
     DB_NOT_FOUND_TEXT,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PRAGMA_PROFILES,
     DEFAULT_DIALOG_PATH,
     QT_FILEPATH_OPTION
 )
 
 import faslr.core as core
 
-from faslr.schema import (
-    CountryTable,
-    LOBTable,
-    LocationTable,
-    StateTable,
-)
-
-from faslr.project_item import ProjectItem
-
 from PyQt6.QtCore import QEvent
 
-from PyQt6.QtGui import (
-    QColor,
-    QStandardItem
-)
-
 from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -39,13 +35,16 @@ from PyQt6.QtWidgets import (
 
 )
 
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import Engine
 from sqlalchemy import event
 from sqlalchemy.orm.session import Session
 from sqlalchemy.engine.base import Connection
+from sqlalchemy.pool import QueuePool
 
-from typing import TYPE_CHECKING
+from typing import (
+    Iterator,
+    TYPE_CHECKING
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from faslr.__main__ import MainWindow
@@ -139,17 +138,17 @@ class ConnectionDialog(QDialog):
         db_filename = filename[0]
 
         if os.path.isfile(db_filename):
+            dispose_engine(db_path=db_filename)
             os.remove(db_filename)
 
         if not db_filename == "":
-            engine = sa.create_engine(
-                'sqlite:///' + filename[0],
-                echo=True
+            engine = get_engine(
+                db_path=db_filename,
+                create=True
             )
 
             schema.Base.metadata.create_all(engine)
-            connection = engine.connect()
-            connection.close()
+            set_journal_mode(db_path=db_filename)
 
             self.close()
 
@@ -218,115 +217,257 @@ def populate_project_tree(
     main window based on what projects have been saved to the database.
     """
 
-    # Open up the connection to the database
-    session, connection = connect_db(db_path=db_filename)
+    # Databases created by earlier versions may be missing tables, such as project_view_blob, and indexes that the
+    # queries below rely on. Existing tables are left alone.
+    with get_engine(db_path=db_filename).begin() as connection:
+        schema.Base.metadata.create_all(connection)
+        created = schema.create_missing_indexes(connection=connection)
 
-    # Query all the countries
-    countries = session.query(
-        CountryTable.country_id,
-        CountryTable.country_name,
-        CountryTable.project_id
-    ).all()
+    if created:
+        logging.info("Created missing indexes: " + ", ".join(created))
 
-    # Append each row one at a time, brute force method. For each country, add state rows, and
-    # for each state, add LOB rows.
+    set_journal_mode(db_path=db_filename)
 
-    for country_id, country, country_uuid in countries:
+    # The countries, states and LOBs are fetched as the tree is expanded.
+    main_window.project_model.load_projects(db_path=db_filename)
 
-        country_item = ProjectItem(
-            text=country,
-            segment_level='country',
-            set_bold=True
-        )
+    main_window.connection_established = True
+    main_window.db = db_filename
+    main_window.menu_bar.toggle_project_actions()
 
-        country_row = [
-            country_item,
-            QStandardItem(country_uuid)
-        ]
-
-        states = session.query(
-            StateTable.state_id,
-            StateTable.state_name,
-            StateTable.project_id
-        ).filter(
-            StateTable.country_id == country_id
-        )
 
-        for state_id, state, state_uuid in states:
+class FaslrConnection:
+    """
+    Bundles a session and connections to a database, drawn from the engine returned by get_engine. The connections
+    are only checked out of the pool when first used, and are returned to it by close(), which is called
+    automatically when the object is used as a context manager.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    """
+    def __init__(
+            self,
+            db_path: str
+    ):
 
-            state_item = ProjectItem(
-                text=state,
-                segment_level='state'
-            )
+        self.engine = get_engine(db_path=db_path)
+
+        self._raw_connection = None
+        self._session = None
+        self._connection = None
+
+    @property
+    def raw_connection(self):
+        if self._raw_connection is None:
+            self._raw_connection = self.engine.raw_connection()
+        return self._raw_connection
+
+    @property
+    def session(self) -> Session:
+        if self._session is None:
+            self._session = Session(bind=self.engine)
+        return self._session
+
+    @property
+    def connection(self) -> Connection:
+        if self._connection is None:
+            self._connection = self.engine.connect()
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Closes the session and returns the connections to the pool.
+        """
+
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+        if self._raw_connection is not None:
+            self._raw_connection.close()
+            self._raw_connection = None
+
+    def __enter__(self) -> FaslrConnection:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+# Engines by database path. Each engine keeps its own pool of connections, so creating one engine per database
+# and sharing it is what allows connections to be reused.
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(
+        db_path: str,
+        create: bool = False
+) -> Engine:
+    """
+    Returns the engine for the database at db_path, creating it on first use. Subsequent calls for the same database
+    return the same engine. If the file has since been replaced, e.g., by a new database of the same name, the old
+    engine is disposed of and a new one created.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    create: bool
+        Whether a database that does not exist yet may be created. Otherwise, raises FileNotFoundError.
+    """
+
+    if not create and not os.path.isfile(db_path):
+        raise FileNotFoundError(DB_NOT_FOUND_TEXT)
 
-            state_row = [state_item, QStandardItem(state_uuid)]
+    db_path = os.path.abspath(db_path)
+    inode = os.stat(db_path).st_ino if os.path.isfile(db_path) else None
 
-            lobs = session.query(
-                LOBTable.lob_type, LOBTable.project_id
-            ).join(
-                LocationTable
-            ).join(
-                StateTable
-            ).filter(
-                StateTable.state_id == state_id
+    with _engines_lock:
+
+        engine, engine_inode = _engines.get(db_path, (None, None))
+
+        if engine is not None and engine_inode not in (inode, None):
+            engine.dispose()
+            engine = None
+
+        if engine is None:
+            engine = sa.create_engine(
+                'sqlite:///' + db_path,
+                echo=DB_ECHO,
+                poolclass=QueuePool,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT
             )
 
-            for lob, lob_uuid in lobs:
-                lob_item = ProjectItem(
-                    lob,
-                    segment_level='lob',
-                    text_color=QColor(0, 77, 122)
-                )
+            event.listen(engine, 'connect', apply_pragma_profile)
 
-                lob_row = [lob_item, QStandardItem(lob_uuid)]
+        _engines[db_path] = (engine, inode)
 
-                state_item.appendRow(lob_row)
+    return engine
 
-            country_item.appendRow(state_row)
 
-        main_window.project_model.project_root.appendRow(country_row)
+def apply_pragma_profile(
+        dbapi_connection,
+        connection_record # noqa
+) -> None:
+    """
+    Applies the PRAGMAs of the profile selected in the settings to a new connection, see DB_PRAGMA_PROFILES. Connects
+    to every engine made by get_engine. The journal mode is stored in the database rather than the connection, and is
+    set by set_journal_mode instead.
+    """
 
-    main_window.project_pane.expandAll()
+    cursor = dbapi_connection.cursor()
 
-    connection.close()
+    for name, value in DB_PRAGMA_PROFILES[core.pragma_profile].items():
+        cursor.execute("PRAGMA {0} = {1}".format(name, value))
 
-    main_window.connection_established = True
-    main_window.db = db_filename
-    main_window.menu_bar.toggle_project_actions()
+    cursor.close()
 
 
-class FaslrConnection:
-    def __init__(
-            self,
-            db_path: str
-    ):
+def set_journal_mode(db_path: str) -> str:
+    """
+    Sets the journal mode of the database at db_path to that of the profile selected in the settings, see
+    DB_JOURNAL_MODES. Should be called when a database is opened or the profile changes. Leaving WAL needs exclusive
+    access to the database, so if another connection, window or process is using it, the current journal mode is
+    kept.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+
+    Returns
+    -------
+    The journal mode of the database afterwards, in lower case. Differs from the selected one if it could not be
+    changed.
+    """
+
+    journal_mode = DB_JOURNAL_MODES[core.pragma_profile]
+
+    with get_engine(db_path=db_path).connect() as connection:
+
+        connection.exec_driver_sql("PRAGMA busy_timeout = {0}".format(DB_JOURNAL_MODE_TIMEOUT))
+
+        try:
+            connection.exec_driver_sql("PRAGMA journal_mode = {0}".format(journal_mode))
+        except sa.exc.OperationalError as e:
+            logging.warning("Could not change the journal mode to {0}: {1}".format(journal_mode, e.orig))
 
-        if not os.path.isfile(db_path):
-            raise FileNotFoundError(DB_NOT_FOUND_TEXT)
+        current = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
 
-        self.engine = sa.create_engine(
-            'sqlite:///' + db_path,
-            echo=True
+        # Restore the busy timeout of the profile, since the connection goes back to the pool.
+        connection.exec_driver_sql(
+            "PRAGMA busy_timeout = {0}".format(DB_PRAGMA_PROFILES[core.pragma_profile].get('busy_timeout', 0))
         )
-        self.raw_connection = self.engine.raw_connection()
 
-        self.session = sessionmaker(bind=self.engine)()
-        self.connection = self.engine.connect()
+    return current
+
+
+def dispose_engine(db_path: str) -> None:
+    """
+    Closes the pooled connections to the database at db_path and removes its engine from the registry. Should be
+    called before the database file is deleted or replaced.
+    """
+
+    with _engines_lock:
+        engine, _ = _engines.pop(os.path.abspath(db_path), (None, None))
+
+    if engine is not None:
+        engine.dispose()
+
+
+def dispose_engines() -> None:
+    """
+    Closes the pooled connections to every database and empties the registry, e.g., so that new connections pick up
+    a change to the PRAGMA profile. Connections that are checked out are closed when they are returned.
+    """
+
+    with _engines_lock:
+        engines = [engine for engine, _ in _engines.values()]
+        _engines.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+
+@contextmanager
+def session_scope(db_path: str) -> Iterator[Session]:
+    """
+    Provides a session on the database at db_path that is always closed, returning its connection to the pool.
+    Uncommitted changes are rolled back if an exception is raised. Changes must be committed explicitly.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    """
+
+    session = Session(bind=get_engine(db_path=db_path))
+
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
 
 
 def connect_db(db_path: str) -> (Session, Connection):
     """
-    Connects the db. Shortens amount of code required to do so.
+    Connects the db. Shortens amount of code required to do so. The caller is responsible for closing both the
+    session and the connection, prefer session_scope for new code.
     """
-    print(db_path)
-    if not os.path.isfile(db_path):
-        raise FileNotFoundError(DB_NOT_FOUND_TEXT)
 
-    engine = sa.create_engine(
-        'sqlite:///' + db_path,
-        echo=True
-    )
-    session = sessionmaker(bind=engine)()
+    engine = get_engine(db_path=db_path)
+    session = Session(bind=engine)
     connection = engine.connect()
     return session, connection
-
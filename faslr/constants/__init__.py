@@ -4,11 +4,25 @@ from faslr.constants.analysis import (
 )
 
 from faslr.constants.connection import (
-    DB_NOT_FOUND_TEXT
+    BULK_INSERT_CHUNK_SIZE,
+    BULK_INSERT_PRAGMAS,
+    DB_ECHO,
+    DB_JOURNAL_MODE_TIMEOUT,
+    DB_JOURNAL_MODES,
+    DB_MAX_OVERFLOW,
+    DB_NOT_FOUND_TEXT,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_PROFILES,
+    PROJECT_VIEW_PAGE_SIZE,
+    PROJECT_VIEW_STORAGE,
+    PROJECT_VIEW_STORAGES
 )
 
 from faslr.constants.development import (
     LDF_AVERAGES,
+    REFIT_DELAY,
     TEMP_LDF_LIST
 )
 
@@ -21,6 +35,10 @@ from faslr.constants.settings import (
     SETTINGS_LIST
 )
 
+from faslr.constants.expected_loss import (
+    TREND_SIDES
+)
+
 from faslr.constants.general import (
     BRANCH_SHA,
     BUILD_VERSION,
@@ -45,10 +63,18 @@ from faslr.constants.general import (
     TEMPLATES_PATH
 )
 
+from faslr.constants.index import (
+    INDEX_GRAINS
+)
+
 from faslr.constants.model import (
     BASE_MODEL_AVERAGES
 )
 
+from faslr.constants.project import (
+    PROJECT_FETCH_SIZE
+)
+
 from faslr.constants.role import (
     ColumnSpanRole,
     RowSpanRole,
@@ -70,6 +96,9 @@ from faslr.constants.role import (
 from faslr.constants.triangle import (
     DEVELOPMENT_FIELDS,
     GRAINS,
+    IMPORT_CHUNK_SIZE,
+    IMPORT_SAMPLE_ROWS,
+    IMPORT_STAGES,
     LOSS_FIELDS,
     ORIGIN_FIELDS,
     TIME_FIELDS
@@ -1 +1,64 @@
 DB_NOT_FOUND_TEXT = "Invalid database path specified. File does not exist."
+
+# Whether the database engines log every SQL statement they issue.
+DB_ECHO = False
+
+# Bounds on the connections kept open to each database, see sqlalchemy.pool.QueuePool.
+DB_POOL_SIZE = 5
+DB_MAX_OVERFLOW = 5
+
+# Seconds to wait for a connection to be returned to the pool before giving up.
+DB_POOL_TIMEOUT = 30
+
+# PRAGMAs applied to every new connection, by the profile selected in the settings. 'Concurrent' only syncs to disk
+# at checkpoints, memory-maps up to 256 MB of the database, keeps up to 64 MB of pages in the cache, and keeps
+# temporary structures in memory. 'Default' uses SQLite's default settings. Both wait up to 5 seconds for a lock
+# rather than failing.
+DB_PRAGMA_PROFILES = {
+    'Concurrent': {
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456,
+        'cache_size': -65536,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000
+    },
+    'Default': {
+        'synchronous': 'FULL',
+        'busy_timeout': 5000
+    }
+}
+
+# Journal mode of the database, by profile. Unlike the PRAGMAs above, the journal mode is stored in the database file,
+# so it is set once when the database is opened or the profile changes, see set_journal_mode. 'Concurrent' writes
+# through a write-ahead log, so that windows and processes reading a database are not locked out while an import
+# writes to it. 'Default' uses a rollback journal.
+DB_JOURNAL_MODES = {
+    'Concurrent': 'WAL',
+    'Default': 'DELETE'
+}
+
+# Milliseconds to wait for other connections to the database to finish before giving up on changing its journal mode.
+# Leaving WAL needs exclusive access to the database.
+DB_JOURNAL_MODE_TIMEOUT = 1000
+
+# Profile used when none has been selected in the settings.
+DB_PRAGMA_PROFILE = 'Concurrent'
+
+# Number of rows sent to the database per executemany when bulk loading data.
+BULK_INSERT_CHUNK_SIZE = 50000
+
+# PRAGMAs applied to the connection while bulk loading data. Keeps more pages in memory and spills temporary
+# structures to memory rather than disk. Adding 'synchronous': 'OFF' speeds up the load further, at the risk of
+# corrupting the database if the machine loses power midway.
+BULK_INSERT_PRAGMAS = {
+    'cache_size': -65536,
+    'temp_store': 'MEMORY'
+}
+
+# How the data of new project views are saved. 'columnar' saves each view as a single compressed blob of column
+# arrays in project_view_blob, 'rows' saves one row per cell in project_view_data.
+PROJECT_VIEW_STORAGE = 'columnar'
+PROJECT_VIEW_STORAGES = ['columnar', 'rows']
+
+# Number of data views the data pane reads from the database at a time, as the view list is scrolled.
+PROJECT_VIEW_PAGE_SIZE = 200
@@ -1,13 +1,16 @@
 import pandas as pd
 
 LDF_AVERAGES = {
-            # 'Geometric': 'geometric',
-            # 'Medial': 'medial',
+            'Geometric': 'geometric',
+            'Medial': 'medial',
             'Regression': 'regression',
             'Straight': 'simple',
             'Volume': 'volume'
 }
 
+# Milliseconds to wait after the last edit to the selected LDFs before recalculating the CDFs and ultimates.
+REFIT_DELAY = 250
+
 TEMP_LDF_LIST = pd.DataFrame(
     data=[
         [True, "All-year volume-weighted", "Volume", "9"],
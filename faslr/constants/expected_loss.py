@@ -4,4 +4,6 @@ EXPECTED_LOSS_RATIO_AVERAGES = {
             'Regression': 'regression',
             'Straight': 'simple',
             'Volume': 'volume'
-}
\ No newline at end of file
+}
+# The sides of an expected loss ratio to which indexes are applied, as passed to update_indexes.
+TREND_SIDES = ['premium', 'loss']
@@ -0,0 +1,6 @@
+# Grains of the periods of an index, from coarsest to finest, by pandas frequency code.
+INDEX_GRAINS = {
+    'Y': 'Annual',
+    'Q': 'Quarterly',
+    'M': 'Monthly'
+}
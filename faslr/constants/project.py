@@ -0,0 +1,2 @@
+# Maximum number of rows the project tree fetches from the database at a time, when a node is expanded or scrolled.
+PROJECT_FETCH_SIZE = 500
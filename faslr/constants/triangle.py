@@ -28,3 +28,19 @@ GRAINS = [
     'Quarterly',
     'Monthly'
 ]
+
+# Number of rows read from a file to fill in the header mapping and infer the column types, before the whole file is
+# imported.
+IMPORT_SAMPLE_ROWS = 1000
+
+# Number of rows read from a file at a time when it is imported. The rows are aggregated to one per origin and
+# development period as they are read, so memory use is bounded by the size of the triangle and this chunk size.
+IMPORT_CHUNK_SIZE = 100000
+
+# Stages of an import, in order, with the labels shown in the progress dialog.
+IMPORT_STAGES = {
+    'read': "Reading file...",
+    'aggregate': "Aggregating by origin and development period...",
+    'validate': "Building triangle...",
+    'write': "Saving to database..."
+}
@@ -1,6 +1,10 @@
 import configparser
 import os
-from faslr.constants import CONFIG_PATH
+from faslr.constants import (
+    CONFIG_PATH,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_PROFILES
+)
 
 
 def get_startup_db_path(
@@ -17,6 +21,23 @@ def get_startup_db_path(
     return startup_db
 
 
+def get_pragma_profile(
+        config_path: str = CONFIG_PATH
+) -> str:
+    """
+    Extracts the name of the PRAGMA profile applied to database connections, falling back to DB_PRAGMA_PROFILE for
+    config files written before the setting existed.
+    """
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    pragma_profile = config.get('DATABASE', 'pragma_profile', fallback=DB_PRAGMA_PROFILE)
+
+    if pragma_profile not in DB_PRAGMA_PROFILES:
+        pragma_profile = DB_PRAGMA_PROFILE
+
+    return pragma_profile
+
+
 config_path: str = CONFIG_PATH
 
 use_sample = False
@@ -37,8 +58,17 @@ if os.path.isfile(config_path):
 else:
     startup_db: None = None
 
+# Name of the PRAGMA profile applied to new database connections, see DB_PRAGMA_PROFILES.
+if os.path.isfile(config_path):
+    pragma_profile: str = get_pragma_profile(config_path=config_path)
+else:
+    pragma_profile: str = DB_PRAGMA_PROFILE
+
 def set_db(path: str) -> None:
     global db
     db = path
 
 
+def set_pragma_profile(name: str) -> None:
+    global pragma_profile
+    pragma_profile = name
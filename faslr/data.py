@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from chainladder import Triangle
 import datetime as dt
+import logging
 import numpy as np
 import pandas as pd
 
@@ -13,30 +14,66 @@ from faslr.base_table import (
 )
 
 from faslr.connection import (
-    FaslrConnection
+    FaslrConnection,
+    get_engine,
+    session_scope
 )
 
 import faslr.core as core
 
 from faslr.constants import (
+    BULK_INSERT_CHUNK_SIZE,
+    BULK_INSERT_PRAGMAS,
     DEVELOPMENT_FIELDS,
     GRAINS,
     ICONS_PATH,
+    IMPORT_STAGES,
     LOSS_FIELDS,
     ORIGIN_FIELDS,
+    PROJECT_VIEW_PAGE_SIZE,
+    PROJECT_VIEW_STORAGE,
+    PROJECT_VIEW_STORAGES,
     QT_FILEPATH_OPTION,
     SAMPLE_DIALOG_PATH
 )
 
+from faslr.results import ViewResultCache
+
 from faslr.utilities import open_item_tab
 
+from faslr.utilities.queries import (
+    bulk_insert,
+    sqlite_pragmas
+)
+
+from faslr.utilities.importing import (
+    check_cancelled,
+    ignore_progress,
+    read_csv_aggregated,
+    read_csv_sample
+)
+
+from faslr.utilities.storage import (
+    pack_frame,
+    unpack_frame
+)
+
 from faslr.schema import (
+    ProjectViewBlob,
     ProjectViewTable,
     ProjectViewData
 )
 
+from faslr.worker import Worker
+
+from sqlalchemy.orm import (
+    Query,
+    Session
+)
+
 from PyQt6.QtCore import (
     QModelIndex,
+    QThreadPool,
     Qt
 )
 
@@ -56,6 +93,8 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QMenu,
+    QMessageBox,
+    QProgressDialog,
     QPushButton,
     QRadioButton,
     QTabWidget,
@@ -66,6 +105,8 @@ from PyQt6.QtWidgets import (
 
 from typing import (
     Any,
+    Callable,
+    Iterator,
     TYPE_CHECKING
 )
 
@@ -121,6 +162,13 @@ class DataPane(QWidget):
         self.triangle = None  # for testing purposes, will store triangle data in db later so remove once that is done
         self.data = None
 
+        # Imports run on the thread pool, see start_import. The workers and progress dialogs are kept by job id
+        # until the import ends.
+        self.thread_pool = QThreadPool.globalInstance()
+        self.import_job = 0
+        self.import_workers = {}
+        self.import_dialogs = {}
+
         self.layout = QVBoxLayout()
         self.upload_btn = QPushButton("Upload")
         self.setLayout(self.layout)
@@ -153,103 +201,469 @@ class DataPane(QWidget):
         self.wizard = DataImportWizard(parent=self)
         self.wizard.show()
 
-    def add_record(
+    def start_import(
             self,
+            file_path: str,
             name: str,
-            desc: str,
-            triangle: Triangle
-    ) -> None:
+            description: str,
+            origin: str,
+            development: str,
+            columns: list,
+            cumulative: bool,
+            data: DataFrame = None
+    ) -> Worker:
         """
-        Adds a data view record and saves data to the database.
-
-        :param name: A human-readable label to identify the data view.
-        :param desc: A longer description of the data view contents.
-        :param triangle: A ChainLadder triangle.
-        :return: None
+        Imports a file as a new data view on the thread pool, showing the progress of the import in a dialog that
+        can be used to cancel it. The view is added to the data view table once it has been saved.
+
+        Parameters
+        ----------
+        file_path: str
+            The path to the file to import.
+        name: str
+            A human-readable label to identify the data view.
+        description: str
+            A longer description of the data view contents.
+        origin: str
+            The name of the origin column.
+        development: str
+            The name of the development column.
+        columns: list
+            The names of the value columns.
+        cumulative: bool
+            Whether the values are cumulative.
+        data: DataFrame
+            The file data already aggregated by origin and development period, e.g., for the preview. The file is
+            read again if None.
+
+        Returns
+        -------
+        The worker running the import.
         """
 
-        created = dt.datetime.today()
-        modified = dt.datetime.today()
-
-        self.triangle = triangle
-        self.data = self.wizard.args_tab.data
+        self.import_job += 1
 
-        view_id = self.save_to_db(
+        worker = Worker(
+            self.import_job,
+            import_view,
+            db_path=core.db,
+            file_path=file_path,
             name=name,
-            description=desc,
-            created=created,
-            modified=modified
+            description=description,
+            origin=origin,
+            development=development,
+            columns=columns,
+            cumulative=cumulative,
+            project_id=self.project_id,
+            data=data
         )
 
-        test_record = [
-            view_id,
-            name,
-            desc,
-            created,
-            modified
-        ]
+        # The import reports its progress and checks for cancellation through the worker.
+        worker.kwargs.update(
+            progress=worker.report_progress,
+            cancelled=worker.is_cancelled
+        )
+
+        worker.signals.progress.connect(self.update_import_progress) # noqa
+        worker.signals.finished.connect(self.finish_import) # noqa
+        worker.signals.cancelled.connect(self.cancel_import) # noqa
+        worker.signals.error.connect(self.fail_import) # noqa
+
+        progress_dialog = QProgressDialog(
+            IMPORT_STAGES['read'],
+            "Cancel",
+            0,
+            100,
+            self
+        )
+        progress_dialog.setWindowTitle("Importing " + name)
+        progress_dialog.canceled.connect(worker.cancel) # noqa
+
+        self.import_workers[self.import_job] = worker
+        self.import_dialogs[self.import_job] = progress_dialog
+
+        self.thread_pool.start(worker)
 
-        self.data_model.add_record(record=test_record)
+        return worker
 
-    def save_to_db(
+    def update_import_progress(
             self,
-            name: str,
-            description: str,
-            created,
-            modified,
-    ):
+            job_id: int,
+            stage: str,
+            fraction: float
+    ) -> None:
 
-        faslr_conn = FaslrConnection(db_path=core.db)
+        progress_dialog = self.import_dialogs.get(job_id)
 
-        project_view = ProjectViewTable(
-            name=name,
-            description=description,
-            created=created,
-            modified=modified,
-            origin=self.wizard.args_tab.dropdowns['origin'].currentText(),
-            development=self.wizard.args_tab.dropdowns['development'].currentText(),
-            columns=';'.join(self.wizard.preview_tab.columns),
-            cumulative=self.wizard.preview_tab.cumulative,
-            project_id=self.project_id
+        if progress_dialog is None:
+            return
+
+        stages = list(IMPORT_STAGES)
+
+        progress_dialog.setLabelText(IMPORT_STAGES[stage])
+        progress_dialog.setValue(int(100 * (stages.index(stage) + fraction) / len(stages)))
+
+    def finish_import(
+            self,
+            job_id: int,
+            result: dict
+    ) -> None:
+
+        self.end_import(job_id=job_id)
+
+        self.triangle = result['triangle']
+
+        self.data_model.add_record(
+            record=[
+                result['view_id'],
+                result['name'],
+                result['description'],
+                result['created'],
+                result['modified']
+            ]
         )
 
-        faslr_conn.session.add(project_view)
+    def cancel_import(
+            self,
+            job_id: int
+    ) -> None:
 
-        faslr_conn.session.flush()
-        view_id = project_view.view_id
+        self.end_import(job_id=job_id)
 
-        data = self.data.copy()
+        logging.info("Import cancelled, no data were saved.")
 
-        data.columns = [
-            'accident_year',
-            'calendar_year',
-            'paid_loss',
-            'reported_loss'
-        ]
+    def fail_import(
+            self,
+            job_id: int,
+            error: Exception
+    ) -> None:
+
+        self.end_import(job_id=job_id)
+
+        logging.error("Import failed, no data were saved.", exc_info=error)
+
+        # The wizard has already closed, so the user would otherwise not know that the import failed.
+        QMessageBox.critical(
+            self,
+            "Import Failed",
+            "The import failed and no data were saved:\n\n" + str(error)
+        )
+
+    def end_import(
+            self,
+            job_id: int
+    ) -> None:
+        """
+        Closes the progress dialog of an import and drops the reference to its worker.
+        """
+
+        progress_dialog = self.import_dialogs.pop(job_id, None)
+
+        if progress_dialog is not None:
+            progress_dialog.canceled.disconnect() # noqa
+            progress_dialog.reset()
+            progress_dialog.deleteLater()
+
+        self.import_workers.pop(job_id, None)
+
+
+def import_view(
+        db_path: str,
+        file_path: str,
+        name: str,
+        description: str,
+        origin: str,
+        development: str,
+        columns: list,
+        cumulative: bool,
+        project_id: str = None,
+        data: DataFrame = None,
+        storage: str = PROJECT_VIEW_STORAGE,
+        progress: Callable[[str, float], None] = None,
+        cancelled: Callable[[], bool] = None
+) -> dict:
+    """
+    Imports a file as a new data view, going through the stages in IMPORT_STAGES: the file is read and aggregated by
+    origin and development period, the triangle is built to check the data, and the view is saved to the database.
+    Touches no Qt objects, so that it can run on a worker thread.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    file_path: str
+        The path to the file to import.
+    name: str
+        A human-readable label to identify the data view.
+    description: str
+        A longer description of the data view contents.
+    origin: str
+        The name of the origin column.
+    development: str
+        The name of the development column.
+    columns: list
+        The names of the value columns.
+    cumulative: bool
+        Whether the values are cumulative.
+    project_id: str
+        The project the view belongs to.
+    data: DataFrame
+        The file data already aggregated by origin and development period. The file is read if None.
+    storage: str
+        How the data are saved, one of PROJECT_VIEW_STORAGES.
+    progress: Callable[[str, float], None]
+        Called with the name of the current stage and the fraction of it that is done.
+    cancelled: Callable[[], bool]
+        Checked between stages and chunks. If it returns True, ImportCancelled is raised and nothing is saved.
+
+    Returns
+    -------
+    A dictionary with the view_id, name, description, created and modified fields of the new view, along with its
+    triangle.
+    """
+
+    if progress is None:
+        progress = ignore_progress
+
+    if data is None:
+        data = read_csv_aggregated(
+            file_path=file_path,
+            origin=origin,
+            development=development,
+            columns=columns,
+            progress=progress,
+            cancelled=cancelled
+        )
+    else:
+        progress('read', 1)
+        progress('aggregate', 1)
+
+    check_cancelled(cancelled=cancelled)
+    progress('validate', 0)
+
+    if data.empty:
+        raise ValueError("The file has no rows to import.")
+
+    triangle = Triangle(
+        data=data,
+        origin=origin,
+        development=development,
+        columns=columns,
+        cumulative=cumulative
+    )
+
+    progress('validate', 1)
+    check_cancelled(cancelled=cancelled)
+
+    created = dt.datetime.today()
+    modified = created
+
+    view_id = save_view(
+        db_path=db_path,
+        data=data,
+        name=name,
+        description=description,
+        created=created,
+        modified=modified,
+        origin=origin,
+        development=development,
+        columns=columns,
+        cumulative=cumulative,
+        project_id=project_id,
+        storage=storage,
+        progress=progress,
+        cancelled=cancelled
+    )
+
+    return {
+        'view_id': view_id,
+        'name': name,
+        'description': description,
+        'created': created,
+        'modified': modified,
+        'triangle': triangle
+    }
+
+
+def save_view(
+        db_path: str,
+        data: DataFrame,
+        name: str,
+        description: str,
+        created: dt.datetime,
+        modified: dt.datetime,
+        origin: str,
+        development: str,
+        columns: list,
+        cumulative: bool,
+        project_id: str = None,
+        storage: str = PROJECT_VIEW_STORAGE,
+        progress: Callable[[str, float], None] = None,
+        cancelled: Callable[[], bool] = None
+) -> int:
+    """
+    Saves data as a new project view, in a single transaction that is rolled back if the import is cancelled or
+    fails, so that nothing is left behind.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    data: DataFrame
+        The origin, development and value columns to save.
+    name: str
+        A human-readable label to identify the data view.
+    description: str
+        A longer description of the data view contents.
+    created: dt.datetime
+        When the view was created.
+    modified: dt.datetime
+        When the view was last modified.
+    origin: str
+        The name of the origin column.
+    development: str
+        The name of the development column.
+    columns: list
+        The names of the value columns.
+    cumulative: bool
+        Whether the values are cumulative.
+    project_id: str
+        The project the view belongs to.
+    storage: str
+        How the data are saved, one of PROJECT_VIEW_STORAGES. 'columnar' saves the origin, development and value
+        columns as a single compressed blob, 'rows' saves one row of paid and reported losses per cell.
+    progress: Callable[[str, float], None]
+        Called with 'write' and the fraction of the data written.
+    cancelled: Callable[[], bool]
+        Checked before the transaction is committed, and between chunks of rows.
+
+    Returns
+    -------
+    The id of the new view.
+    """
+
+    if storage not in PROJECT_VIEW_STORAGES:
+        raise ValueError("Invalid storage specified: " + str(storage))
+
+    if progress is None:
+        progress = ignore_progress
+
+    progress('write', 0)
+
+    with get_engine(db_path=db_path).connect() as connection, \
+            sqlite_pragmas(connection=connection, pragmas=BULK_INSERT_PRAGMAS):
 
-        data['view_id'] = view_id
-        #
-        # data.to_sql(
-        #     name='project_view_data',
-        #     con=connection,
-        #     index=False,
-        #     if_exists='append'
-        # )
+        with connection.begin():
 
-        data_list = data.to_dict('records')
+            view_id = connection.execute(
+                ProjectViewTable.__table__.insert().values(
+                    name=name,
+                    description=description,
+                    created=created,
+                    modified=modified,
+                    origin=origin,
+                    development=development,
+                    columns=';'.join(columns),
+                    cumulative=cumulative,
+                    project_id=project_id
+                )
+            ).inserted_primary_key[0]
 
-        obj_list = []
-        for record in data_list:
-            data_obj = ProjectViewData(**record)
-            obj_list.append(data_obj)
+            if storage == 'columnar':
 
-        faslr_conn.session.add_all(obj_list)
+                connection.execute(
+                    ProjectViewBlob.__table__.insert().values(
+                        view_id=view_id,
+                        data=pack_frame(frame=data[[origin, development] + columns])
+                    )
+                )
+
+            else:
+
+                data = data.copy()
+
+                data.columns = [
+                    'accident_year',
+                    'calendar_year',
+                    'paid_loss',
+                    'reported_loss'
+                ]
 
-        faslr_conn.session.commit()
+                data['view_id'] = view_id
 
-        faslr_conn.connection.close()
+                def chunks() -> Iterator[DataFrame]:
 
-        return view_id
+                    for start in range(0, len(data), BULK_INSERT_CHUNK_SIZE):
+                        check_cancelled(cancelled=cancelled)
+                        progress('write', start / len(data))
+                        yield data.iloc[start:start + BULK_INSERT_CHUNK_SIZE]
+
+                bulk_insert(
+                    connection=connection,
+                    table=ProjectViewData.__table__,
+                    data=chunks()
+                )
+
+            # Raising here rolls back the transaction.
+            check_cancelled(cancelled=cancelled)
+
+    progress('write', 1)
+
+    return view_id
+
+
+def preview_triangle(
+        file_path: str,
+        origin: str,
+        development: str,
+        columns: list,
+        cumulative: bool,
+        data: DataFrame = None
+) -> dict:
+    """
+    Builds the triangle shown in the preview tab of the import wizard. Touches no Qt objects, so that it can run on
+    a worker thread.
+
+    Parameters
+    ----------
+    file_path: str
+        The path to the file to preview.
+    origin: str
+        The name of the origin column.
+    development: str
+        The name of the development column.
+    columns: list
+        The names of the value columns.
+    cumulative: bool
+        Whether the values are cumulative.
+    data: DataFrame
+        The file data already aggregated by origin and development period. The file is read if None.
+
+    Returns
+    -------
+    A dictionary with the aggregated data and the triangle built from them.
+    """
+
+    if data is None:
+        data = read_csv_aggregated(
+            file_path=file_path,
+            origin=origin,
+            development=development,
+            columns=columns
+        )
+
+    triangle = Triangle(
+        data=data,
+        origin=origin,
+        development=development,
+        columns=columns,
+        cumulative=cumulative
+    )
+
+    return {
+        'data': data,
+        'triangle': triangle
+    }
 
 
 class DataImportWizard(QWidget):
@@ -309,19 +723,33 @@ class DataImportWizard(QWidget):
 
     def accept_import(self) -> None:
         """
-        Accept the configuration, import the triangle into the data store, and exit.
+        Accept the configuration, import the triangle into the data store in the background, and exit.
         """
 
-        if self.parent:
-            # Add metadata to data pane view
-            self.preview_tab.generate_triangle()
-            triangle = self.triangle
-            self.parent.add_record(
+        if self.parent and self.args_tab.file_name:
+
+            dropdowns = self.args_tab.dropdowns
+            origin = dropdowns['origin'].currentText()
+            development = dropdowns['development'].currentText()
+            columns = self.preview_tab.get_columns()
+
+            # Reuse the aggregated data if the file has already been read for the preview.
+            data = self.args_tab.cached_aggregate(
+                origin=origin,
+                development=development,
+                columns=columns
+            )
+
+            self.parent.start_import(
+                file_path=self.args_tab.file_name,
                 name=self.args_tab.name_line.text(),
-                desc=self.args_tab.desc_edit.toPlainText(),
-                triangle=triangle
+                description=self.args_tab.desc_edit.toPlainText(),
+                origin=origin,
+                development=development,
+                columns=columns,
+                cumulative=self.args_tab.cumulative_btn.isChecked(),
+                data=data
             )
-            self.close()
 
         self.close()
 
@@ -347,9 +775,14 @@ class ImportArgumentsTab(QWidget):
         self.setWindowTitle("Import Wizard")
         self.parent = parent
 
-        # Holds the uploaded dataframe
+        # Holds the first rows of the uploaded file, the whole file is only read when previewing or importing it.
         self.data = None
         self.triangle = None
+        self.file_name = None
+
+        # The arguments that the file was last aggregated with for the preview, and the aggregated data.
+        self.aggregate_key = None
+        self.aggregate = None
 
         self.layout = QVBoxLayout()
         self.setLayout(self.layout)
@@ -554,15 +987,29 @@ class ImportArgumentsTab(QWidget):
         if filename == '':
             return
 
+        self.open_file(filename=filename)
+
+    def open_file(
+            self,
+            filename: str
+    ) -> None:
+        """
+        Reads the header and the first rows of a file to fill in the header mapping and the file data sample.
+        """
+
         self.file_path.setText(filename)
+        self.file_name = filename
+        self.aggregate_key = None
+        self.aggregate = None
+
+        self.data = read_csv_sample(file_path=filename)
 
         self.upload_sample_model.read_header(
-            file_path=filename
+            data=self.data
         )
 
         self.upload_sample_view.resizeColumnsToContents()
 
-        self.data = pd.read_csv(filename)
         columns = self.data.columns
 
         # Resize mapping dropdowns to fit contents
@@ -628,6 +1075,31 @@ class ImportArgumentsTab(QWidget):
         values_key = n_row - 2
         del self.dropdowns['values_' + str(values_key)]
 
+    def cached_aggregate(
+            self,
+            origin: str,
+            development: str,
+            columns: list
+    ) -> DataFrame | None:
+        """
+        Returns the file data aggregated for the preview if they were aggregated with the same arguments, so that
+        switching between the tabs does not read the file again, and None otherwise.
+
+        Parameters
+        ----------
+        origin: str
+            The name of the origin column.
+        development: str
+            The name of the development column.
+        columns: list
+            The names of the value columns.
+        """
+
+        if self.aggregate_key == (self.file_name, origin, development, tuple(columns)):
+            return self.aggregate
+
+        return None
+
     def smart_match(self):
         """
         Tries to set the starting mapping value to the most likely value.
@@ -650,6 +1122,9 @@ class ImportArgumentsTab(QWidget):
 
         self.file_path.clear()
         self.data = None
+        self.file_name = None
+        self.aggregate_key = None
+        self.aggregate = None
         self.upload_sample_model._data = dummy_df
         index = QModelIndex()
         self.upload_sample_model.setData(
@@ -716,11 +1191,13 @@ class UploadSampleModel(FAbstractTableModel):
 
     def read_header(
             self,
-            file_path: str
+            data: DataFrame
     ):
-        df = pd.read_csv(file_path)
+        """
+        Displays the header and first rows of a sample of the uploaded file.
+        """
 
-        self._data = df.head()
+        self._data = data.head()
 
         index = QModelIndex()
 
@@ -778,6 +1255,23 @@ class TrianglePreviewTab(QWidget):
         self.columns = None
         self.cumulative = None
 
+        # The aggregated file data that the triangle is built from.
+        self.data = None
+
+        # The arguments that the displayed triangle was built from.
+        self.triangle_key = None
+
+        # The triangle is built on the thread pool, see generate_triangle. The workers are kept by job id until they
+        # are done, and only the result of the latest job is shown.
+        self.thread_pool = QThreadPool.globalInstance()
+        self.preview_job = 0
+        self.preview_key = None
+        self.preview_workers = {}
+
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
     def refresh_triangle(self) -> None:
 
         """
@@ -793,6 +1287,14 @@ class TrianglePreviewTab(QWidget):
 
         if (self.sibling.data is None) or self.sibling.data.equals(dummy_df):
             self.clear_layout()
+            self.triangle_key = None
+            self.preview_key = None
+            return
+
+        # Keep the displayed triangle if the arguments haven't changed, or wait for it if it is being built.
+        key = self.current_key()
+
+        if (self.analysis_tab is not None and self.triangle_key == key) or self.preview_key == key:
             return
 
         # Removes the previous triangle when arguments are changed
@@ -800,15 +1302,17 @@ class TrianglePreviewTab(QWidget):
 
         self.generate_triangle()
 
-        self.analysis_tab = AnalysisTab(
-            triangle=self.parent.triangle
-        )
-
-        self.analysis_layout.addWidget(self.analysis_tab)
-
     def generate_triangle(
             self,
-    ) -> None:
+    ) -> Worker:
+        """
+        Starts building the triangle from the uploaded file on the thread pool, so that reading a large file does not
+        block the wizard. The triangle is shown by finish_preview once it has been built.
+
+        Returns
+        -------
+        The worker building the triangle.
+        """
 
         self.dropdowns = self.sibling.dropdowns
         self.columns = self.get_columns()
@@ -818,12 +1322,114 @@ class TrianglePreviewTab(QWidget):
         else:
             self.cumulative = False
 
-        self.parent.triangle = Triangle(
-            data=self.sibling.data,
-            origin=self.dropdowns['origin'].currentText(),
-            development=self.sibling.dropdowns['development'].currentText(),
+        origin = self.dropdowns['origin'].currentText()
+        development = self.dropdowns['development'].currentText()
+
+        self.preview_job += 1
+        self.preview_key = self.current_key()
+
+        worker = Worker(
+            self.preview_job,
+            preview_triangle,
+            file_path=self.sibling.file_name,
+            origin=origin,
+            development=development,
             columns=self.columns,
-            cumulative=self.cumulative
+            cumulative=self.cumulative,
+            data=self.sibling.cached_aggregate(
+                origin=origin,
+                development=development,
+                columns=self.columns
+            )
+        )
+
+        worker.signals.finished.connect(self.finish_preview) # noqa
+        worker.signals.error.connect(self.fail_preview) # noqa
+
+        self.show_status(text="Reading " + str(self.sibling.file_name) + "...")
+
+        self.preview_workers[self.preview_job] = worker
+        self.thread_pool.start(worker)
+
+        return worker
+
+    def finish_preview(
+            self,
+            job_id: int,
+            result: dict
+    ) -> None:
+
+        self.preview_workers.pop(job_id, None)
+
+        if job_id != self.preview_job:
+            return
+
+        key = self.preview_key
+        self.preview_key = None
+
+        # The file or the arguments have changed since the job started.
+        if key != self.current_key():
+            self.clear_layout()
+            return
+
+        self.data = result['data']
+        self.sibling.aggregate = self.data
+        self.sibling.aggregate_key = key[:4]
+        self.parent.triangle = result['triangle']
+        self.triangle_key = key
+
+        self.clear_layout()
+
+        self.analysis_tab = AnalysisTab(
+            triangle=self.parent.triangle
+        )
+
+        self.analysis_layout.addWidget(self.analysis_tab)
+
+    def fail_preview(
+            self,
+            job_id: int,
+            error: Exception
+    ) -> None:
+
+        self.preview_workers.pop(job_id, None)
+
+        if job_id != self.preview_job:
+            return
+
+        self.preview_key = None
+        self.triangle_key = None
+
+        logging.error("Could not build the preview triangle.", exc_info=error)
+
+        self.show_status(text="Could not build the triangle from the file: " + str(error))
+
+    def show_status(
+            self,
+            text: str
+    ) -> None:
+        """
+        Replaces the preview with a message, e.g., while the file is being read or if it could not be read.
+        """
+
+        self.clear_layout()
+        self.status_label.setText(text)
+        self.analysis_layout.addWidget(self.status_label)
+        self.status_label.show()
+
+    def current_key(self) -> tuple:
+        """
+        Returns the file and arguments that the triangle would currently be built from.
+        """
+
+        dropdowns = self.sibling.dropdowns
+
+        return (
+            self.sibling.file_name,
+            dropdowns['origin'].currentText(),
+            dropdowns['development'].currentText(),
+            tuple(dropdowns[key].currentText() for key in dropdowns if 'values' in key),
+            self.sibling.cumulative_btn.isChecked()
         )
 
     def get_columns(self) -> list:
@@ -832,7 +1438,7 @@ class TrianglePreviewTab(QWidget):
         for key in self.sibling.dropdowns:
 
             if 'values' in key:
-                columns.append(self.dropdowns[key].currentText())
+                columns.append(self.sibling.dropdowns[key].currentText())
 
         return columns
 
@@ -841,13 +1447,22 @@ class TrianglePreviewTab(QWidget):
             while self.analysis_layout.count():
                 item = self.analysis_layout.takeAt(0)
                 widget = item.widget()
-                if widget is not None:
+                if widget is self.status_label:
+                    widget.hide()
+                elif widget is not None:
                     widget.deleteLater()
                 else:
                     self.clear_layout()
 
+        self.analysis_tab = None
+
 
 class ProjectDataModel(FAbstractTableModel):
+    """
+    Lists the data views of the project that the data pane belongs to, or of every project if the pane has none.
+    Only the number of views and the first page of PROJECT_VIEW_PAGE_SIZE views are read up front, the rest are read
+    a page at a time through fetchMore as the list is scrolled.
+    """
     def __init__(
             self,
             parent: DataPane = None,
@@ -856,7 +1471,7 @@ class ProjectDataModel(FAbstractTableModel):
 
         self.parent = parent
 
-        column_list = [
+        self.column_list = [
             'View Id',
             'Name',
             'Description',
@@ -864,48 +1479,99 @@ class ProjectDataModel(FAbstractTableModel):
             'Modified'
         ]
 
-        def read_sql(fc: FaslrConnection) -> DataFrame:
+        self.db_path = core.db
+        self.project_id = self.parent.project_id if self.parent else None
 
-            df_res = pd.read_sql_table(
-                table_name='project_view',
-                con=fc.connection
-            )
+        # Number of views in the database, of which the first rowCount() have been read.
+        self.n_views = 0
 
-            df_res = df_res[
-                [
-                    'view_id',
-                    'name',
-                    'description',
-                    'created',
-                    'modified'
-                ]
-            ]
-            df_res.columns = column_list
+        self._data = pd.DataFrame(columns=self.column_list)
 
-            return df_res
+        # Return blank if running in standalone demo mode, without a database.
+        if self.db_path is not None:
+            self.load_views()
 
-        # If running from main application, read project views from the database. Otherwise, return blank if
-        # running in standalone demo mode.
-        if self.parent.main_window:
+    def view_query(
+            self,
+            session: Session
+    ) -> Query:
+        """
+        Returns the query for the columns of the list, filtered to the views of the project.
+        """
 
-            faslr_connection = FaslrConnection(
-                db_path=core.db
-            )
+        query = session.query(
+            ProjectViewTable.view_id,
+            ProjectViewTable.name,
+            ProjectViewTable.description,
+            ProjectViewTable.created,
+            ProjectViewTable.modified
+        )
 
-            df = read_sql(fc=faslr_connection)
+        if self.project_id is not None:
+            query = query.filter(ProjectViewTable.project_id == self.project_id)
 
-        elif core:
+        return query
 
-            faslr_connection = FaslrConnection(
-                db_path=core.db
-            )
+    def load_views(self) -> None:
+        """
+        Counts the views and reads the first page of them.
+        """
 
-            df = read_sql(fc=faslr_connection)
+        with session_scope(db_path=self.db_path) as session:
+            n_views = self.view_query(session=session).count()
 
+        self.beginResetModel()
+        self._data = pd.DataFrame(columns=self.column_list)
+        self.n_views = n_views
+        self.endResetModel()
+
+        self.fetchMore(QModelIndex())
+
+    def canFetchMore(
+            self,
+            parent: QModelIndex
+    ) -> bool:
+
+        return not parent.isValid() and self.rowCount() < self.n_views
+
+    def fetchMore(
+            self,
+            parent: QModelIndex
+    ) -> None:
+        """
+        Reads the next page of views.
+        """
+
+        if not self.canFetchMore(parent):
+            return
+
+        row = self.rowCount()
+
+        with session_scope(db_path=self.db_path) as session:
+            page = self.view_query(
+                session=session
+            ).order_by(
+                ProjectViewTable.view_id
+            ).offset(row).limit(PROJECT_VIEW_PAGE_SIZE).all()
+
+        if not page:
+            # Views were deleted since they were counted.
+            self.n_views = row
+            return
+
+        page = pd.DataFrame(
+            [tuple(view) for view in page],
+            columns=self.column_list
+        )
+
+        self.beginInsertRows(QModelIndex(), row, row + len(page) - 1)
+
+        if row:
+            self._data = pd.concat([self._data, page], ignore_index=True)
         else:
-            df = pd.DataFrame(columns=column_list)
+            self._data = page
 
-        self._data = df
+        self.endInsertRows()
 
     def data(
             self,
@@ -915,9 +1581,7 @@ class ProjectDataModel(FAbstractTableModel):
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-
-            value = str(value)
+            value = self.format_value(index.row(), index.column())
 
             if value == "nan":
                 value = ""
@@ -934,20 +1598,27 @@ class ProjectDataModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_label(p_int)
 
             # if qt_orientation == Qt.Orientation.Vertical:
             #     return str(self._data.index[p_int])
 
     def add_record(self, record: list):
+        """
+        Adds a view that has just been saved to the database. If there are views yet to be read, it is left to be
+        read along with them.
+        """
+
+        row = self.rowCount()
+
+        self.n_views += 1
+
+        if row < self.n_views - 1:
+            return
+
+        self.beginInsertRows(QModelIndex(), row, row)
         self._data.loc[len(self._data.index)] = record
-        index = QModelIndex()
-        self.setData(
-            index=index,
-            value=None,
-            role=Qt.ItemDataRole.DisplayRole,
-            refresh=True
-        )
+        self.endInsertRows()
 
     def setData(
             self,
@@ -980,45 +1651,103 @@ class ProjectDataView(FTableView):
             val: QModelIndex
     ) -> None:
 
-        fc = FaslrConnection(db_path=core.db)
-
         view_id = self.model().sibling(val.row(), 0, val).data()
-        query = fc.session.query(
-            ProjectViewData.accident_year,
-            ProjectViewData.calendar_year,
-            ProjectViewData.paid_loss,
-            ProjectViewData.reported_loss
-        ).filter(
-            ProjectViewData.view_id == view_id
-        )
-
-        df = pd.read_sql(query.statement, con=fc.connection)
 
-        df.columns = [
-            'Accident Year',
-            'Calendar Year',
-            'Paid Loss',
-            'Reported Loss'
-        ]
+        triangle = load_view_triangle(
+            db_path=core.db,
+            view_id=view_id
+        )
 
-        triangle = Triangle(
-            data=df,
-            origin='Accident Year',
-            development='Calendar Year',
-            columns=['Paid Loss', 'Reported Loss'],
-            cumulative=True
+        # Diagnostics calculated the last time the view was opened are read back rather than recalculated.
+        results = ViewResultCache.from_triangle(
+            db_path=core.db,
+            view_id=view_id,
+            triangle=triangle
         )
 
         open_item_tab(
             title="Test Triangle",
             tab_widget=self.parent.parent,
-            item_widget=AnalysisTab(triangle=triangle)
+            item_widget=AnalysisTab(
+                triangle=triangle,
+                results=results
+            )
         )
 
-        fc.connection.close()
-
     def contextMenuEvent(self, event):
 
         menu = QMenu()
         menu.addAction(self.open_action)
         menu.exec(self.viewport().mapToGlobal(event))
+
+
+def load_view_triangle(
+        db_path: str,
+        view_id: int
+) -> Triangle:
+    """
+    Reads the data of a project view and builds its triangle. Views saved in columnar storage are read in a single
+    fetch of their blob, and keep the origin, development and value columns they were imported with. Views saved
+    as rows have their paid and reported losses read from project_view_data.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database.
+    view_id: int
+        The id of the view.
+
+    Returns
+    -------
+    The triangle of the view.
+    """
+
+    with FaslrConnection(db_path=db_path) as fc:
+
+        blob = fc.session.query(
+            ProjectViewBlob.data
+        ).filter(
+            ProjectViewBlob.view_id == view_id
+        ).scalar()
+
+        if blob is not None:
+
+            view = fc.session.query(
+                ProjectViewTable
+            ).filter(
+                ProjectViewTable.view_id == view_id
+            ).one()
+
+            return Triangle(
+                data=unpack_frame(blob=blob),
+                origin=view.origin,
+                development=view.development,
+                columns=view.columns.split(';'),
+                cumulative=view.cumulative
+            )
+
+        query = fc.session.query(
+            ProjectViewData.accident_year,
+            ProjectViewData.calendar_year,
+            ProjectViewData.paid_loss,
+            ProjectViewData.reported_loss
+        ).filter(
+            ProjectViewData.view_id == view_id
+        )
+
+        df = pd.read_sql(query.statement, con=fc.connection)
+
+    df.columns = [
+        'Accident Year',
+        'Calendar Year',
+        'Paid Loss',
+        'Reported Loss'
+    ]
+
+    return Triangle(
+        data=df,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Loss', 'Reported Loss'],
+        cumulative=True
+    )
@@ -94,37 +94,28 @@ class ExhibitModel(FAbstractTableModel):
 
         self._data = pd.DataFrame()
 
+        # Financial figures displayed with thousands separator, rounded to main unit.
+        # Development factors displayed with decimal points.
+        self.formatters = {
+            'Paid Claims': VALUE_STYLE.format,
+            'Reported Claims': VALUE_STYLE.format,
+            'Ultimate Paid Claims': VALUE_STYLE.format,
+            'Ultimate Reported Claims': VALUE_STYLE.format,
+            'Paid Claims CDF': RATIO_STYLE.format,
+            'Reported Claims CDF': RATIO_STYLE.format
+        }
+
     def data(
             self,
             index: QModelIndex,
             role: int = None
     ) -> typing.Any:
 
-        colname = self._data.columns[index.column()]
+        colname = self.column_name(index.column())
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-
-            # Financial figures displayed with thousands separator, rounded to main unit.
-            if colname in [
-                'Paid Claims',
-                'Reported Claims',
-                'Ultimate Paid Claims',
-                'Ultimate Reported Claims'
-            ]:
-                display_value = VALUE_STYLE.format(value)
-
-            # Development factors displayed with decimal points.
-            elif colname in [
-                'Paid Claims CDF',
-                'Reported Claims CDF'
-            ]:
-                display_value = RATIO_STYLE.format(value)
-            else:
-                display_value = str(value)
-
-            return display_value
+            return self.format_value(index.row(), index.column())
 
         # Since this is an exhibit, we center the values vertically. Text is centered, numbers on the right.
         # This is just my personal style, we should move towards allowing customization.
@@ -177,6 +168,8 @@ class ExhibitModel(FAbstractTableModel):
         to its model.
         """
 
+        data = self._data
+
         # When role is AddColumnRole, value is sent as a 2-valued tuple, the first element is the name of the
         # column, and the second element is a list of the corresponding values.
         if role == AddColumnRole:
@@ -195,7 +188,8 @@ class ExhibitModel(FAbstractTableModel):
                 else:
                     column_name = column_name + '.1'
 
-            self._data[column_name] = column_values
+            data = self._data.copy()
+            data[column_name] = column_values
 
         # Swaps two columns. Need to consider if we are swapping groups with nested columns or just the columns.
         # For this role, the values provided are the two ExhibitOutputTreeItems selected for swapping. These
@@ -211,7 +205,7 @@ class ExhibitModel(FAbstractTableModel):
 
                 a, b = cols.index(colname_a), cols.index(colname_b)
                 cols[b], cols[a] = cols[a], cols[b]
-                self._data = self._data[cols]
+                data = self._data[cols]
 
             # At least one column is a column group.
             else:
@@ -233,7 +227,7 @@ class ExhibitModel(FAbstractTableModel):
                 cols[prior_idx:prior_idx] = labels
                 cols[curr_idx:curr_idx] = prior_labels
 
-                self._data = self._data[cols]
+                data = self._data[cols]
 
         # Happens when selected item is at the top or bottom of the exhibit output tree. In this case,
         # we need to rotate all the columns to the left or right.
@@ -269,10 +263,9 @@ class ExhibitModel(FAbstractTableModel):
                     print(subcols)
                 cols[idx:idx] = subcols
 
-            self._data = self._data[cols]
+            data = self._data[cols]
 
-        self.dataChanged.emit(index, index)  # noqa
-        self.layoutChanged.emit()  # noqa
+        self.update_data(data)
 
         return True
 
@@ -1,4 +1,4 @@
-import chainladder as cl
+import logging
 import numpy as np
 import pandas as pd
 
@@ -13,10 +13,20 @@ from faslr.base_table import (
 
 from faslr.constants import (
     LDF_AVERAGES,
+    REFIT_DELAY,
     TEMP_LDF_LIST
 )
 
-from faslr.utilities import df_set_false
+from faslr.worker import Worker
+
+from faslr.utilities import (
+    array_fingerprint,
+    cdf_ultimate,
+    df_set_false,
+    DEVELOPMENT_CACHE,
+    ldf_averages,
+    triangle_values
+)
 
 from pandas import DataFrame
 
@@ -25,6 +35,8 @@ from PyQt6.QtCore import (
     QModelIndex,
     Qt,
     QSize,
+    QThreadPool,
+    QTimer,
     QVariant
 )
 
@@ -112,10 +124,12 @@ class FactorModel(FAbstractTableModel):
 
         self.n_triangle_columns = self.triangle.shape[3] - 1
 
-        # Extract data from the triangle that gets displayed in the tab.
-        self._data = self.get_display_data()
+        # Cumulative values of the triangle, used to average the link ratios and to calculate the ultimates
+        # without fitting chainladder estimators.
+        self.triangle_values = triangle_values(triangle=self.triangle)
 
-        self.value_type = value_type
+        # Identifies the triangle in the keys of DEVELOPMENT_CACHE.
+        self.fingerprint = array_fingerprint(self.triangle_values)
 
         # excl_frame is a dataframe that is the same size of the triangle which uses
         # boolean values to indicate which factors in the corresponding triangle should be excluded
@@ -123,16 +137,32 @@ class FactorModel(FAbstractTableModel):
         self.excl_frame = self.link_frame.copy()
         self.excl_frame = df_set_false(df=self.excl_frame)
 
+        # NumPy copy of excl_frame, kept in sync by toggle_exclude, so that the exclusions can be looked up without
+        # going through pandas indexing.
+        self.excl_mask = np.zeros(self.excl_frame.shape, dtype=bool)
+
+        # Edits to the selected LDFs are debounced and refit on the thread pool, see schedule_refit.
+        self.thread_pool = QThreadPool.globalInstance()
+        self.refit_job = 0
+        self.refit_key = None
+        self.refit_running = False
+        self.refit_workers = {}
+
+        self.refit_timer = QTimer()
+        self.refit_timer.setSingleShot(True)
+        self.refit_timer.setInterval(REFIT_DELAY)
+        self.refit_timer.timeout.connect(self.start_refit) # noqa
+
+        # Extract data from the triangle that gets displayed in the tab.
+        self._data = self.get_display_data()
+
+        self.value_type = value_type
+
         # Get the position of a blank row to be inserted between the end of the triangle
         # and before the development factors
 
         self.ldf_row = self.triangle_spacer_row
 
-        self.selected_spacer_row = self.triangle_spacer_row + 1
-
-        self.selected_row_num = self.selected_spacer_row + 1
-        self.cdf_row_num = self.selected_row_num + 1
-
     def data(
             self,
             index: QModelIndex,
@@ -141,8 +171,8 @@ class FactorModel(FAbstractTableModel):
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
+            value = self.value(index.row(), index.column())
+            col = self.column_name(index.column())
 
             if col == "Ultimate Loss":
                 if index.row() > self.n_triangle_rows:
@@ -185,7 +215,7 @@ class FactorModel(FAbstractTableModel):
             return Qt.AlignmentFlag.AlignRight
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            if self._data.columns[index.column()] != "Ultimate Loss":
+            if self.column_name(index.column()) != "Ultimate Loss":
                 # Case when the index is on the lower diagonal
                 if (index.column() >= self.n_triangle_rows - index.row()) and \
                         (index.row() < self.triangle_spacer_row):
@@ -195,9 +225,8 @@ class FactorModel(FAbstractTableModel):
                     if self.heatmap_checked:
                         return QColor(self.heatmap_frame.iloc[[index.row()], [index.column()]].squeeze())
                     else:
-                        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
                         # Change color if factor is excluded
-                        if exclude:
+                        if self.excl_mask[index.row(), index.column()]:
                             return EXCL_FACTOR_COLOR
                         else:
                             return MAIN_TRIANGLE_COLOR
@@ -216,8 +245,7 @@ class FactorModel(FAbstractTableModel):
                 (index.column() < self.n_triangle_columns):
 
             font = QFont()
-            exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
-            if exclude:
+            if self.excl_mask[index.row(), index.column()]:
                 font.setStrikeOut(True)
             else:
                 font.setStrikeOut(False)
@@ -243,10 +271,10 @@ class FactorModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_label(p_int)
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.index_label(p_int)
 
     def toggle_exclude(
             self,
@@ -255,12 +283,10 @@ class FactorModel(FAbstractTableModel):
         """
         Sets values of the exclusion frame to True or False to indicate whether a link ratio should be excluded.
         """
-        exclude = self.excl_frame.iloc[[index.row()], [index.column()]].squeeze()
+        exclude = not self.excl_mask[index.row(), index.column()]
 
-        if exclude:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = False
-        else:
-            self.excl_frame.iloc[[index.row()], [index.column()]] = True
+        self.excl_mask[index.row(), index.column()] = exclude
+        self.excl_frame.iloc[index.row(), index.column()] = exclude
 
     def select_factor(
             self,
@@ -269,7 +295,7 @@ class FactorModel(FAbstractTableModel):
 
         self.selected_row.iloc[[0], [index.column()]] = self._data.iloc[[index.row()], [index.column()]].copy()
 
-        self.recalculate_factors()
+        self.recalculate_selected()
 
     def select_ldf_row(
             self,
@@ -277,47 +303,241 @@ class FactorModel(FAbstractTableModel):
     ) -> None:
 
         self.selected_row.iloc[[0]] = self._data.iloc[[index.row()], 0:self.link_frame.shape[1]]
-        self.recalculate_factors()
+        self.recalculate_selected()
 
     def clear_selected_ldfs(self) -> None:
 
         self.selected_row.iloc[[0]] = np.nan
-        self.recalculate_factors()
+        self.recalculate_selected()
 
     def delete_ldf(
             self,
             index: QModelIndex
     ) -> None:
         self.selected_row.iloc[[0], [index.column()]] = np.nan
-        self.recalculate_factors()
+        self.recalculate_selected()
+
+    def refresh_heatmap(self) -> None:
+        """
+        Repaints the background of the link ratios after the heatmap is switched on or off.
+        """
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(self.triangle_spacer_row - 1, self.n_triangle_columns - 1),
+            [Qt.ItemDataRole.BackgroundRole]
+        )
 
     def recalculate_factors(self) -> None:
         """
-        Method to update the view and LDFs as the user strikes out link ratios.
+        Method to update the view and LDFs as the user strikes out link ratios. Refits every column, use
+        recalculate_column when only a single column is affected.
         """
-        drop_list = []
-        for i in range(self.link_frame.shape[0]):
-            for j in range(self.link_frame.shape[1]):
+        self.update_data(self.get_display_data())
 
-                exclude = self.excl_frame.iloc[[i], [j]].squeeze()
+    def recalculate_column(
+            self,
+            column: int
+    ) -> None:
+        """
+        Updates the LDF averages of a single development column. Striking out a link ratio only affects the
+        averages of its own column, and the selected LDFs are not tied to the averages, so the rest of the
+        display data can be left alone.
+        """
+        factors = self.calculate_column_factors(column=column)
 
-                if exclude:
+        self.factor_frame.iloc[:, column] = factors
+        self._data.iloc[self.ldf_row:self.ldf_row + self.num_ldf_types, column] = factors
 
-                    row_drop = str(self.link_frame.iloc[i].name)
-                    col_drop = int(str(self.link_frame.columns[j]).split('-')[0])
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(0, column),
+            self.index(self.selected_spacer_row - 1, column)
+        )
 
-                    drop_list.append((row_drop, col_drop))
+    def calculate_column_factors(
+            self,
+            column: int
+    ) -> np.ndarray:
+        """
+        Calculates each selected LDF average for a single development column, leaving out the excluded link
+        ratios.
+        """
+        averages = self.get_averages()
+        excluded = self.excl_mask[:, column:column + 1]
+
+        factors = DEVELOPMENT_CACHE.get(
+            key=("ldf_averages", self.fingerprint, column, array_fingerprint(excluded), tuple(averages)),
+            compute=lambda: ldf_averages(
+                values=self.triangle_values[:, column:column + 2],
+                averages=averages,
+                excluded=excluded
+            )
+        )
 
-                else:
+        return factors[:, 0].copy()
+
+    def get_averages(self) -> list:
+        """
+        Returns the (average type, number of years) pairs of the selected LDF averages, for use with ldf_averages.
+        """
+        df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
+
+        return [
+            (LDF_AVERAGES[average], int(n_years))
+            for average, n_years in zip(df_ldfs_to_calc["Type"], df_ldfs_to_calc["Number of Years"])
+        ]
+
+    def calculate_cdf_ultimate(self) -> tuple:
+        """
+        Calculates the CDFs to ultimate from the selected LDFs and the resulting ultimate for each origin period.
+        """
+        ldfs = self.selected_row.iloc[0].to_numpy(dtype=float)
+
+        return DEVELOPMENT_CACHE.get(
+            key=("cdf_ultimate", self.fingerprint, array_fingerprint(ldfs)),
+            compute=lambda: cdf_ultimate(
+                values=self.triangle_values,
+                ldfs=ldfs
+            )
+        )
+
+    def recalculate_selected(self) -> None:
+        """
+        Updates the CDFs and ultimates after the selected LDFs change. Any refit that is still pending from
+        earlier edits is cancelled, since its result would be out of date.
+        """
+        self.cancel_refit()
+
+        cdfs, ultimates = self.calculate_cdf_ultimate()
+
+        self.apply_selected(
+            cdfs=cdfs,
+            ultimates=ultimates
+        )
+
+    def schedule_refit(self) -> None:
+        """
+        Recalculates the CDFs and ultimates on the thread pool once the selected LDFs have gone unedited for
+        REFIT_DELAY milliseconds, so that a burst of edits results in a single refit.
+        """
+        self.cancel_refit()
+        self.refit_timer.start()
+
+    def cancel_refit(self) -> None:
+        """
+        Stops any scheduled refit, and makes the result of any refit already running be discarded.
+        """
+        self.refit_timer.stop()
+        self.refit_job += 1
+
+        self.refit_running = False
 
-                    pass
+        # Refits that haven't started yet can be taken off the queue, ones that are running are left to finish.
+        for job_id, worker in list(self.refit_workers.items()):
+            if worker.done or self.thread_pool.tryTake(worker):
+                del self.refit_workers[job_id]
 
-        self._data = self.get_display_data(drop_list=drop_list)
+    def start_refit(self) -> None:
 
-    def get_display_data(
+        ldfs = self.selected_row.iloc[0].to_numpy(dtype=float)
+        key = ("cdf_ultimate", self.fingerprint, array_fingerprint(ldfs))
+
+        if key in DEVELOPMENT_CACHE:
+            self.recalculate_selected()
+            return
+
+        self.cancel_refit()
+        self.refit_key = key
+
+        # The worker gets a copy of the selected LDFs, so later edits can't change them while it runs.
+        worker = Worker(
+            self.refit_job,
+            cdf_ultimate,
+            values=self.triangle_values,
+            ldfs=ldfs
+        )
+        worker.signals.finished.connect(self.finish_refit) # noqa
+        worker.signals.error.connect(self.fail_refit) # noqa
+
+        self.refit_workers[self.refit_job] = worker
+        self.refit_running = True
+        self.thread_pool.start(worker)
+
+    def finish_refit(
+            self,
+            job_id: int,
+            result: tuple
+    ) -> None:
+
+        # The worker is done, so the reference to it can be dropped.
+        self.refit_workers.pop(job_id, None)
+
+        # Discard results that were superseded by later edits.
+        if job_id != self.refit_job:
+            return
+
+        self.refit_running = False
+
+        DEVELOPMENT_CACHE.put(self.refit_key, result)
+
+        cdfs, ultimates = result
+
+        self.apply_selected(
+            cdfs=cdfs,
+            ultimates=ultimates
+        )
+
+    def fail_refit(
             self,
-            drop_list: list = None
-    ) -> DataFrame:
+            job_id: int,
+            error: Exception
+    ) -> None:
+
+        self.refit_workers.pop(job_id, None)
+
+        if job_id == self.refit_job:
+            self.refit_running = False
+            logging.error("Refit of the selected LDFs failed.", exc_info=error)
+
+    def refit_pending(self) -> bool:
+        """
+        Whether the CDFs and ultimates are yet to catch up with the latest edit to the selected LDFs.
+        """
+        return self.refit_timer.isActive() or self.refit_running
+
+    def apply_selected(
+            self,
+            cdfs: np.ndarray,
+            ultimates: np.ndarray
+    ) -> None:
+        """
+        Writes the selected LDFs, CDFs and ultimates to the display data. The changes are made to a copy which
+        then replaces the display data, so the view never sees a partial update.
+        """
+        data = self._data.copy()
+
+        data.iloc[self.selected_row_num, 0:self.selected_row.shape[1]] = self.selected_row.iloc[0].to_numpy()
+        data.iloc[self.cdf_row_num, 0:self.cdf_row.shape[1]] = cdfs
+
+        ultimate_column = data.shape[1] - 1
+        data.iloc[0:ultimates.shape[0], ultimate_column] = ultimates
+
+        self.cdf_row.iloc[0] = cdfs
+        self._data = data
+
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(0, ultimate_column),
+            self.index(ultimates.shape[0] - 1, ultimate_column)
+        )
+        # noinspection PyUnresolvedReferences
+        self.dataChanged.emit(
+            self.index(self.selected_row_num, 0),
+            self.index(self.cdf_row_num, ultimate_column)
+        )
+
+    def get_display_data(self) -> DataFrame:
         """
         Concatenates the link ratio triangle and LDFs below it to be displayed in the GUI.
         """
@@ -326,29 +546,23 @@ class FactorModel(FAbstractTableModel):
         df_ldfs_to_calc = self.ldf_types[self.ldf_types["Selected"] == True]  # noqa e712
         self.num_ldf_types = df_ldfs_to_calc.shape[0]
 
-        factor_frame = pd.DataFrame()
-
-        for i in range(self.num_ldf_types):
-            ldf_name = df_ldfs_to_calc["Label"].iloc[i]
-            ldf_years = int(df_ldfs_to_calc["Number of Years"].iloc[i])
-            average = df_ldfs_to_calc['Type'].iloc[i]
+        averages = self.get_averages()
+        excluded = self.excl_mask.copy()
 
-            development = cl.Development(
-                drop=drop_list,
-                n_periods=[ldf_years] * ratios.shape[1],
-                average=LDF_AVERAGES[average]
+        factors = DEVELOPMENT_CACHE.get(
+            key=("ldf_averages", self.fingerprint, array_fingerprint(excluded), tuple(averages)),
+            compute=lambda: ldf_averages(
+                values=self.triangle_values,
+                averages=averages,
+                excluded=excluded
             )
+        )
 
-            factors = development.fit(X=self.triangle)
-
-            # noinspection PyUnresolvedReferences
-            factor_row = factors.ldf_.to_frame(origin_as_datetime=False)
-            factor_row = factor_row.rename(index={'(All)': ldf_name})
-
-            if i == 0:
-                factor_frame = factor_row
-            else:
-                factor_frame = pd.concat([factor_frame, factor_row])
+        factor_frame = pd.DataFrame(
+            data=factors.copy(),
+            index=df_ldfs_to_calc["Label"].to_list(),
+            columns=ratios.columns
+        )
 
         self.factor_frame = factor_frame
 
@@ -360,35 +574,24 @@ class FactorModel(FAbstractTableModel):
             columns=ratios.columns
         )
 
-        # fit factors
-        patterns = {}
-        for i in range(ratios.shape[1]):
-            col = int(str(self.link_frame.columns[i]).split('-')[0])
-            patterns[col] = self.selected_row.iloc[[0], [i]].squeeze().copy()
+        cdfs, ultimates = self.calculate_cdf_ultimate()
 
-        selected_dev = cl.DevelopmentConstant(
-            patterns=patterns,
-            style="ldf"
-        ).fit_transform(self.triangle)
-
-        selected_model = cl.Chainladder().fit(selected_dev)
-        # noinspection PyUnresolvedReferences
-        ultimate_frame = selected_model.ultimate_.to_frame(origin_as_datetime=False)
+        ultimate_frame = pd.DataFrame(
+            {"Ultimate Loss": ultimates.copy()},
+            index=self.triangle.latest_diagonal.to_frame(origin_as_datetime=False).index
+        )
 
-        self.cdf_row.iloc[[0]] = selected_dev.cdf_.to_frame(origin_as_datetime=False).iloc[[0]]
+        self.cdf_row.iloc[0] = cdfs
 
         # ratios["To Ult"] = np.nan
         ratios[""] = np.nan
 
         ratios = pd.concat([ratios, ultimate_frame], axis=1)
-        ratios.columns = [*ratios.columns[:-1], "Ultimate Loss"]
 
         self.selected_spacer_row = self.triangle_spacer_row + self.num_ldf_types
         self.selected_row_num = self.selected_spacer_row + 1
         self.cdf_row_num = self.selected_row_num + 1
 
-        index = QModelIndex()
-
         res = pd.concat([
             ratios,
             blank_row,
@@ -398,14 +601,6 @@ class FactorModel(FAbstractTableModel):
             self.cdf_row
         ])
 
-        # noinspection PyUnresolvedReferences
-        self.dataChanged.emit(
-            index,
-            index
-        )
-        # noinspection PyUnresolvedReferences
-        self.layoutChanged.emit()
-
         return res
 
     def setData(
@@ -423,19 +618,19 @@ class FactorModel(FAbstractTableModel):
                 value = np.nan
                 # return False
 
+            # Show the edit straight away, the CDFs and ultimates follow once the refit finishes.
             self.selected_row.iloc[0, index.column()] = value
-            self.recalculate_factors()
-            self.get_display_data()
+            self._data.iloc[self.selected_row_num, index.column()] = value
             self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
+
+            self.schedule_refit()
             return True
         elif refresh:
+            self.cancel_refit()
             self.recalculate_factors()
-            self.get_display_data()
-            self.dataChanged.emit(index, index) # noqa
-            # noinspection PyUnresolvedReferences
-            self.layoutChanged.emit()
+            return True
+
+        return False
 
 
 class FactorView(FTableView):
@@ -546,7 +741,7 @@ class FactorView(FTableView):
             if index.row() < index.model().triangle_spacer_row - 2 and \
                     index.column() <= index.model().n_triangle_columns:
                 index.model().toggle_exclude(index=index)
-                index.model().recalculate_factors()
+                index.model().recalculate_column(column=index.column())
             # Case when the user clicks on an LDF average, select it.
             elif (index.model().selected_spacer_row > index.row() > index.model().triangle_spacer_row - 1) and \
                     (index.column() < index.model().n_triangle_columns):
@@ -559,7 +754,7 @@ class FactorView(FTableView):
 
         for index in selection:
             index.model().toggle_exclude(index=index)
-            index.model().recalculate_factors(index=index)
+            index.model().recalculate_column(column=index.column())
 
     def custom_menu_event(
             self,
@@ -828,7 +1023,6 @@ class LDFAverageBox(QDialog):
             ldf_dialog.exec()
 
     def accept_changes(self):
-        self.parent.get_display_data()
         index = QModelIndex()
         self.parent.setData(
             index=index,
@@ -9,6 +9,8 @@ from .index import (
     IndexInventoryView
 )
 
+from .trend import TrendEngine
+
 from .index_matrix import (
     IndexMatrixModel,
     IndexMatrixView,
@@ -13,14 +13,18 @@ from faslr.base_table import (
     FTableView
 )
 
-from faslr.connection import connect_db
+from faslr.connection import session_scope
 
 from faslr.common import FOKCancel
 
-from faslr.constants import IndexConstantRole
+from faslr.constants import (
+    INDEX_GRAINS,
+    IndexConstantRole
+)
 
 from faslr.schema import (
     IndexTable,
+    IndexValuesBlob,
     IndexValuesTable
 )
 
@@ -29,7 +33,15 @@ from faslr.style.triangle import (
     PERCENT_STYLE
 )
 
-from faslr.utilities import subset_dict
+from faslr.utilities import (
+    array_fingerprint,
+    subset_dict
+)
+
+from faslr.utilities.storage import (
+    pack_arrays,
+    unpack_arrays
+)
 
 from PyQt6.QtCore import (
     QModelIndex,
@@ -69,7 +81,8 @@ class FIndex:
             name: Optional[str] = None,
             description: Optional[str] = None,
             from_id: Optional[int] = None,
-            db: Optional[str] = None
+            db: Optional[str] = None,
+            grain: Optional[str] = None
     ):
         """
         Represents an index, and all the things you can do with it (i.e., on-level rate index). There are two ways
@@ -79,7 +92,8 @@ class FIndex:
         Parameters
         ----------
         origin: Optional[list]
-            The years corresponding to the origin dimension of the triangle to which the index applies.
+            The years corresponding to the origin dimension of the triangle to which the index applies. Quarterly and
+            monthly indexes take periods instead, e.g., a PeriodIndex or strings such as '2020-01'.
         changes: Optional[list]
             A list of changes per year of origin.
         name: Optional[str]
@@ -90,12 +104,19 @@ class FIndex:
             If supplied, initializes an index by querying data from the db via its index id.
         db: Optional[str]
             The database path from which the index data is extracted, used in conjunction with from_id.
+        grain: Optional[str]
+            The grain of the periods of the index, one of the keys of INDEX_GRAINS, i.e., 'Y', 'Q' or 'M'. Inferred
+            from the origin if not supplied: periods keep their own grain and anything else is taken to be years.
         """
 
+        # Values derived from origin and changes, such as the matrix, by name. Cleared when either is replaced.
+        self._derived = {}
+
         # Case when data are supplied to the arguments.
         if (origin is not None) and (changes is not None):
             self.name = name
             self.description = description
+            self.grain = infer_grain(origin=origin) if grain is None else grain
             self.origin = origin
             self.changes = changes
         # Case when extracting the index from the ID.
@@ -104,6 +125,7 @@ class FIndex:
             self.id = from_id
             self.name = index_dict['Name']
             self.description = index_dict['Description']
+            self.grain = index_dict['Grain']
             self.origin = index_dict['Origin']
             self.changes = index_dict['Changes']
         else:
@@ -115,6 +137,102 @@ class FIndex:
                 """
             )
 
+    @classmethod
+    def load_many(
+            cls,
+            ids: Optional[list] = None,
+            db: Optional[str] = None
+    ) -> List[FIndex]:
+        """
+        Loads several indexes from the database at once. The index records, along with the changes of those saved in
+        compact storage, and the values of the others are each pulled with a single query, and the values are split
+        up by index id, rather than running two queries per index.
+
+        Parameters
+        ----------
+        ids: Optional[list]
+            The ids of the indexes to load. If None, every index in the database is loaded.
+        db: Optional[str]
+            The database from which the indexes are extracted. Defaults to the application database.
+
+        Returns
+        -------
+        A list of FIndex, in the order of ids, or by index id if ids is None. Ids not found in the database are
+        skipped.
+        """
+
+        if db is None:
+            db = core.db
+
+        if ids is not None:
+            ids = [int(x) for x in ids]
+
+        with session_scope(db_path=db) as session:
+
+            index_query = session.query(
+                IndexTable.index_id,
+                IndexTable.name,
+                IndexTable.description,
+                IndexValuesBlob.grain,
+                IndexValuesBlob.start,
+                IndexValuesBlob.data
+            ).outerjoin(
+                IndexValuesBlob
+            ).order_by(IndexTable.index_id)
+
+            values_query = session.query(
+                IndexValuesTable.index_id,
+                IndexValuesTable.year,
+                IndexValuesTable.change
+            ).order_by(
+                IndexValuesTable.index_id,
+                IndexValuesTable.year
+            )
+
+            if ids is not None:
+                index_query = index_query.filter(IndexTable.index_id.in_(ids))
+                values_query = values_query.filter(IndexValuesTable.index_id.in_(ids))
+
+            index_records = index_query.all()
+            value_records = values_query.all()
+
+        if value_records:
+            value_ids, years, changes = (list(x) for x in zip(*value_records))
+        else:
+            value_ids, years, changes = [], [], []
+
+        # The values are sorted by index id, so each index's values are a contiguous slice.
+        value_ids = np.asarray(value_ids, dtype=np.int64)
+        starts = np.searchsorted(value_ids, [r.index_id for r in index_records], side='left')
+        ends = np.searchsorted(value_ids, [r.index_id for r in index_records], side='right')
+
+        findexes = {}
+        for record, start, end in zip(index_records, starts, ends):
+
+            if record.data is not None:
+                origin, index_changes = unpack_index_values(
+                    grain=record.grain,
+                    start=record.start,
+                    blob=record.data
+                )
+            else:
+                origin, index_changes = years[start:end], changes[start:end]
+
+            findex = cls(
+                origin=origin,
+                changes=index_changes,
+                name=record.name,
+                description=record.description,
+                grain=record.grain
+            )
+            findex.id = record.index_id
+            findexes[record.index_id] = findex
+
+        if ids is None:
+            return list(findexes.values())
+
+        return [findexes[x] for x in ids if x in findexes]
+
     @staticmethod
     def get_index_from_id(
             id_no: int,
@@ -134,28 +252,96 @@ class FIndex:
             db = core.db
 
         res = {} # Holds the result.
-        session, connection = connect_db(db_path=db)
+        with session_scope(db_path=db) as session:
+
+            index_record, values_blob = session.query(
+                IndexTable,
+                IndexValuesBlob
+            ).outerjoin(
+                IndexValuesBlob
+            ).filter(IndexTable.index_id == id_no).one()
+
+            res['Name']: str = index_record.name
+            res['Description']: str = index_record.description
+
+            # Indexes saved in compact storage have their changes in a single blob.
+            if values_blob is not None:
+                res['Grain'] = values_blob.grain
+                res['Origin'], res['Changes'] = unpack_index_values(
+                    grain=values_blob.grain,
+                    start=values_blob.start,
+                    blob=values_blob.data
+                )
 
-        index_record = session.query(IndexTable).filter(IndexTable.index_id == id_no).one()
+                return res
 
-        res['Name']: str = index_record.name
-        res['Description']: str = index_record.description
+            values_query = (
+                session.query(IndexValuesTable)
+                    .filter(IndexValuesTable.index_id == id_no)
+                    .order_by(IndexValuesTable.year)
+            )
 
-        values_query = (
-            session.query(IndexValuesTable)
-                .filter(IndexValuesTable.index_id == id_no)
-                .order_by(IndexValuesTable.year)
-        )
+            origin = [r.year for r in values_query]
+            changes = [r.change for r in values_query]
 
-        origin = [r.year for r in values_query]
-        changes = [r.change for r in values_query]
+            res['Grain'] = 'Y'
+            res['Origin'] = origin
+            res['Changes'] = changes
 
-        res['Origin'] = origin
-        res['Changes'] = changes
+        return res
 
-        connection.close()
+    def save(
+            self,
+            db: Optional[str] = None,
+            scope: str = 'Global'
+    ) -> int:
+        """
+        Saves the index to the database in compact storage, i.e., an index record and a single blob holding all of
+        its changes, and sets its id. The periods of the index must be consecutive.
 
-        return res
+        Parameters
+        ----------
+        db: Optional[str]
+            The database to save the index to. Defaults to the application database.
+        scope: str
+            'Global' or 'Project'.
+
+        Returns
+        -------
+        The id of the saved index.
+        """
+
+        if db is None:
+            db = core.db
+
+        periods = self.periods
+        if len(periods) and not periods.equals(pd.period_range(start=periods[0], periods=len(periods))):
+            raise ValueError("Only indexes with consecutive periods can be saved.")
+
+        with session_scope(db_path=db) as session:
+
+            index_record = IndexTable(
+                name=self.name,
+                description=self.description,
+                scope=scope
+            )
+            session.add(index_record)
+            session.flush()
+
+            session.add(
+                IndexValuesBlob(
+                    index_id=index_record.index_id,
+                    grain=self.grain,
+                    start=str(periods[0]) if len(periods) else None,
+                    data=pack_arrays({'changes': self.changes})
+                )
+            )
+
+            session.commit()
+
+            self.id = index_record.index_id
+
+        return self.id
 
 
     @staticmethod
@@ -177,69 +363,191 @@ class FIndex:
             A list of applicable changes, in factor form - i.e., 1 + change.
         """
 
-        idx = years.index(base_yr)
-        res = {}
-        for x in range(len(years)):
-            if years[x] < base_yr:
-                adj = float(np.array(index[x + 1:idx + 1]).prod()) ** - 1
-            else:
-                adj = np.array(index[idx + 1:x + 1]).prod()
-            res[str(years[x])] = adj
-        return res
+        idx = pd.Index(years).get_loc(base_yr)
+
+        # The factor from the base year to any other year is the ratio of their running products.
+        cumulative = np.cumprod(np.asarray(index, dtype=float))
+        adjustments = cumulative / cumulative[idx]
+
+        return dict(zip([str(year) for year in years], adjustments.tolist()))
+
+    @property
+    def origin(self) -> np.ndarray:
+        """
+        The years of the index, as a read-only array. Assigning new years replaces the array.
+        """
+
+        return self._origin
+
+    @origin.setter
+    def origin(self, origin: list | np.ndarray) -> None:
+
+        self._origin = read_only_array(index_origin(origin=origin, grain=self.grain))
+        self._derived = {}
+
+    @property
+    def grain(self) -> str:
+        """
+        The grain of the periods of the index, one of the keys of INDEX_GRAINS.
+        """
+
+        return self._grain
+
+    @grain.setter
+    def grain(self, grain: str) -> None:
+
+        if grain not in INDEX_GRAINS:
+            raise ValueError("Invalid index grain: " + str(grain) + ". It should be one of " +
+                             ", ".join(INDEX_GRAINS.keys()) + ".")
+
+        # Convert an origin that has already been set to the new grain, so that the periods stay in step with it.
+        if hasattr(self, '_origin'):
+            origin = index_origin(origin=self._origin, grain=grain)
+
+            if not pd.Index(origin).is_unique:
+                raise ValueError("Changing the grain to " + grain + " would give the index duplicate periods. Use " +
+                                 "aggregate() to convert an index to a coarser grain.")
+
+            self._origin = read_only_array(origin)
+
+        self._grain = grain
+        self._derived = {}
+
+    @property
+    def periods(self) -> pd.PeriodIndex:
+        """
+        The origin of the index as a PeriodIndex, including for annual indexes whose origin is kept as years.
+        """
+
+        return self.derived(
+            name='periods',
+            compute=lambda: pd.PeriodIndex(
+                pd.Index(self.origin).astype(str) if self.grain == 'Y' else self.origin,
+                freq=self.grain
+            )
+        )
+
+    @property
+    def changes(self) -> np.ndarray:
+        """
+        The change for each year, as a read-only array of floats. Assigning new changes replaces the array.
+        """
+
+        return self._changes
+
+    @changes.setter
+    def changes(self, changes: list | np.ndarray) -> None:
+
+        self._changes = read_only_array(changes, dtype=float)
+        self._derived = {}
+
+    def derived(
+            self,
+            name: str,
+            compute: typing.Callable[[], typing.Any]
+    ) -> typing.Any:
+        """
+        Returns the value derived from the origin and changes under name, calling compute to calculate it the first
+        time it is needed.
+        """
+
+        if name not in self._derived:
+            self._derived[name] = compute()
+
+        return self._derived[name]
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Hash of the years and changes of the index, for use in cache keys. Indexes with the same years and changes
+        have the same hash, whatever their names.
+        """
+
+        return self.derived(
+            name='content_hash',
+            compute=lambda: array_fingerprint(self.origin.astype(str), self.changes)
+        )
+
+    @property
+    def factor_values(self) -> np.ndarray:
+        """
+        Read-only array of the factors that bring each year to the latest year in the self.origin.
+        """
+
+        return self.derived(
+            name='factor_values',
+            compute=lambda: read_only_array(latest_level_factors(changes=self.changes))
+        )
+
+    @property
+    def level_values(self) -> np.ndarray:
+        """
+        Read-only array of the running product of 1 + change, i.e., the level of each year relative to the year
+        before the first one. The ratio of the levels of two years is the factor between them.
+        """
+
+        return self.derived(
+            name='level_values',
+            compute=lambda: read_only_array(np.cumprod(1 + self.changes))
+        )
+
+    @property
+    def matrix_values(self) -> np.ndarray:
+        """
+        Read-only array of the factors that bring each year, along the rows, to the level of every other year, along
+        the columns.
+        """
+
+        return self.derived(
+            name='matrix_values',
+            compute=lambda: read_only_array(self.level_values[None, :] / self.level_values[:, None])
+        )
 
     @property
     def df(self) -> DataFrame:
         """
-        Returns a pandas DataFrame representation of the Index.
+        Returns a pandas DataFrame representation of the Index. The frame is built once, and each call returns a copy
+        of it that the caller is free to modify.
         """
 
-        df_idx = pd.DataFrame(
-            data={
-                'Origin': self.origin,
-                'Change': self.changes,
-                'Factor': self.factors
-            }
+        df_idx = self.derived(
+            name='df',
+            compute=lambda: pd.DataFrame(
+                data={
+                    'Origin': self.origin,
+                    'Change': self.changes,
+                    'Factor': self.factor_values
+                }
+            )
         )
 
-        return df_idx
+        return df_idx.copy()
 
     @property
     def factors(self) -> list:
         """
         Returns a list of factors that brings each year to the latest year in the self.origin.
         """
-        row_count = len(self.origin)
-        factors = [1] * row_count
-        for i in range(row_count - 1, -1, -1):
-            if i == row_count - 1:
-                pass
-            else:
-                factors[i] = factors[i + 1] * (1 + self.changes[i + 1])
 
-        return factors
+        return self.factor_values.tolist()
 
     @property
     def matrix(self) -> DataFrame:
         """
         Matrix representation of the index. A matrix of factors that brings each year to the level of every other year.
+        Like df, the matrix is built once and each call returns a copy.
         """
-        d: list = []  # holds the data used to initialize the resulting dataframe
-
-        incremental_factors = [x + 1.0 for x in self.changes]
 
-        for year in self.origin:
-            d += [self.relative_index(
-                base_yr=year,
-                years=self.origin,
-                index=incremental_factors
-            )]
-
-        df_matrix: DataFrame = pd.DataFrame(
-            data=d,
-            index=self.origin
+        df_matrix: DataFrame = self.derived(
+            name='matrix',
+            compute=lambda: pd.DataFrame(
+                data=self.matrix_values,
+                index=self.origin,
+                columns=[str(year) for year in self.origin]
+            )
         )
 
-        return df_matrix
+        return df_matrix.copy()
 
     @property
     def meta_dict(self) -> dict:
@@ -263,13 +571,68 @@ class FIndex:
         :type values: list
         """
 
-        func = lambda x: np.asarray(x) * np.asarray(values)
-
-        res = self.matrix.apply(func)
+        # Each row of the matrix brings the value of its year to the level of the other years.
+        res = pd.DataFrame(
+            data=self.matrix_values * np.asarray(values, dtype=float)[:, None],
+            index=self.origin,
+            columns=[str(year) for year in self.origin]
+        )
 
         return res
 
 
+    def aggregate(
+            self,
+            grain: str = 'Y',
+            weights: Optional[list | np.ndarray] = None,
+            name: Optional[str] = None,
+            description: Optional[str] = None
+    ) -> FIndex:
+        """
+        Converts the index to a coarser grain, e.g., a monthly index to the annual origin periods of a triangle. The
+        level of each coarse period is the average of the levels of the periods within it, weighted by exposure if
+        weights are supplied, and the changes of the new index are those between consecutive levels. The first
+        change is relative to the level before the first period of this index.
+
+        Parameters
+        ----------
+        grain: str
+            The grain to aggregate to, one of the keys of INDEX_GRAINS no finer than the grain of this index.
+        weights: Optional[list | np.ndarray]
+            The exposure of each period of this index. If None, the levels are averaged with equal weights.
+        name: Optional[str]
+            The name of the new index, defaults to the name of this one.
+        description: Optional[str]
+            The description of the new index, defaults to the description of this one.
+        """
+
+        grains = list(INDEX_GRAINS.keys())
+        if grain not in grains or grains.index(grain) > grains.index(self.grain):
+            raise ValueError("An index can only be aggregated to a grain no finer than its own.")
+
+        if weights is None:
+            weights = np.ones(len(self.changes))
+        else:
+            weights = np.asarray(weights, dtype=float)
+
+            if weights.shape != self.changes.shape:
+                raise ValueError("Weights must have one value for each period of the index.")
+
+        # Number each coarse period, then total up the weighted levels of the periods within it.
+        codes, coarse_periods = pd.factorize(self.periods.asfreq(grain, how='end'), sort=True)
+
+        level = np.bincount(codes, weights=weights * self.level_values) / np.bincount(codes, weights=weights)
+
+        changes = level / np.concatenate([[1.0], level[:-1]]) - 1
+
+        return FIndex(
+            origin=coarse_periods,
+            changes=changes,
+            name=self.name if name is None else name,
+            description=self.description if description is None else description,
+            grain=grain
+        )
+
     def compose(
             self,
             findexes: list[FIndex],
@@ -286,26 +649,16 @@ class FIndex:
         :type description: The resulting description of the new index.
         """
 
-        # Gather all the changes as a list of lists.
-        all_changes = [self.changes] + [x.changes for x in findexes]
-
-        # Basically get a big list of 1 + change for all the changes.
-        intermediate_factors = []
-        for changes in all_changes:
-            intermediate_factors += [[1 + x for x in changes]]
-
-        # Multiply everything together pairwise.
-        combined_changes: list = np.multiply.reduce(intermediate_factors).tolist()
-
-        # Then subtract 1 from each element to get the consolidated index changes.
-        combined_changes = [x - 1 for x in combined_changes]
+        # Multiply 1 + change of all the indexes together, then subtract 1 to get the consolidated index changes.
+        combined_changes = np.prod([1 + x.changes for x in [self] + findexes], axis=0) - 1
 
         # Construct the new index using these changes.
         return FIndex(
             name=name,
             description=description,
             origin=self.origin,
-            changes=combined_changes
+            changes=combined_changes,
+            grain=self.grain
         )
 
     def __repr__(self) -> str:
@@ -354,21 +707,19 @@ class IndexTableModel(FAbstractTableModel):
         else:
             self._data = pd.DataFrame(columns=['Change', 'Factor'])
 
+        self.formatters = {'Factor': RATIO_STYLE.format}
+        self.default_formatter = PERCENT_STYLE.format
+
     def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
+            value = self.value(index.row(), index.column())
 
             if np.isnan(value):
                 return ""
             else:
-                if col == "Factor":
-                    value = RATIO_STYLE.format(value)
-                else:
-                    value = PERCENT_STYLE.format(value)
-                return value
+                return self.format_value(index.row(), index.column())
 
     def headerData(
             self,
@@ -380,10 +731,10 @@ class IndexTableModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_label(p_int)
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.index_label(p_int)
 
     def setData(
             self,
@@ -474,15 +825,7 @@ class IndexInventory(QDialog):
             self.indexes: list = indexes
             self.validate_indexes()
         else:
-            # Get number of indexes in database.
-            session, connection = connect_db(db_path=core.db)
-            n_index = session.query(IndexTable).count()
-            connection.close()
-
-            self.indexes = []
-            for i in range(n_index):
-                index_to_add = FIndex(from_id=i+1)
-                self.indexes += [index_to_add]
+            self.indexes = FIndex.load_many(db=core.db)
 
         self.layout = QVBoxLayout()
 
@@ -542,12 +885,16 @@ class IndexInventory(QDialog):
                 if selected_idx.column() >= 1:
                     continue
 
-                idx_id: int = self.inventory_model.data(
-                    index=selected_idx,
-                    role=Qt.ItemDataRole.DisplayRole
-                )
+                # Indexes loaded from the database already have their values, so they don't need to be queried again.
+                findex = self.indexes[selected_idx.row()]
+
+                if not isinstance(findex, FIndex):
+                    idx_id: int = self.inventory_model.data(
+                        index=selected_idx,
+                        role=Qt.ItemDataRole.DisplayRole
+                    )
 
-                findex = FIndex(from_id=idx_id)
+                    findex = FIndex(from_id=idx_id)
 
                 idx_item = FStandardIndexItem(findex=findex)
 
@@ -592,10 +939,9 @@ class IndexInventoryModel(FAbstractTableModel):
             'Description'
         ]
 
-        self._data = pd.DataFrame(columns=idx_meta_columns)
-
-        # Create DataFrame of index metadata.
-        for idx in indexes:
+        # Create DataFrame of index metadata, gathering the columns first so that the frame is built once.
+        meta = {column: [] for column in idx_meta_columns}
+        for idx in indexes or []:
             if type(idx) == FIndex:
                 idx = idx.meta_dict
 
@@ -603,8 +949,10 @@ class IndexInventoryModel(FAbstractTableModel):
                 input_dict=idx,
                 keys=idx_meta_columns
             )
-            df_idx = pd.DataFrame(idx_dict)
-            self._data = pd.concat([self._data, df_idx])
+            for column in idx_meta_columns:
+                meta[column] += list(idx_dict[column])
+
+        self._data = pd.DataFrame(meta, columns=idx_meta_columns)
 
     def data(self, index: QModelIndex, role: int = ...) -> typing.Any:
 
@@ -639,13 +987,98 @@ def calculate_index_factors(index: DataFrame) -> DataFrame:
     index: DataFrame
         A DataFrame containing index changes.
     """
-    row_count = len(index)
-    factors = [1] * row_count
-    for i in range(row_count - 1, -1, -1):
-        if i == row_count - 1:
-            pass
-        else:
-            factors[i] = factors[i + 1] * (1 + index['Change'].iloc[i + 1])
-    index['Factor'] = factors
+    index['Factor'] = latest_level_factors(changes=index['Change'])
 
     return index
+
+
+def infer_grain(origin: list | np.ndarray | pd.PeriodIndex) -> str:
+    """
+    Returns the grain of an index origin. Periods keep their own grain, while anything else, such as integers, is
+    taken to be years.
+    """
+
+    origin = pd.Index(origin)
+
+    if isinstance(origin, pd.PeriodIndex):
+        return origin.freqstr[0]
+
+    return 'Y'
+
+
+def index_origin(
+        origin: list | np.ndarray | pd.PeriodIndex,
+        grain: str
+) -> np.ndarray:
+    """
+    Converts the origin of an index to the form it is kept in. Annual indexes are kept as years, for consistency with
+    the origin of a triangle, while quarterly and monthly indexes are kept as periods.
+    """
+
+    origin = pd.Index(origin)
+
+    if grain != 'Y':
+        return pd.PeriodIndex(origin, freq=grain).to_numpy()
+
+    if isinstance(origin, pd.PeriodIndex):
+        return np.asarray(origin.year)
+
+    return origin.to_numpy()
+
+
+def unpack_index_values(
+        grain: str,
+        start: str,
+        blob: bytes
+) -> tuple:
+    """
+    Rebuilds the origin and changes of an index saved in compact storage, from the grain, first period and blob of
+    its IndexValuesBlob record.
+    """
+
+    changes = unpack_arrays(blob)['changes']
+
+    if start is None:
+        return [], changes
+
+    periods = pd.period_range(start=start, periods=len(changes), freq=grain)
+
+    if grain == 'Y':
+        return periods.year, changes
+
+    return periods, changes
+
+
+def read_only_array(
+        values: list | np.ndarray,
+        dtype: typing.Optional[type] = None
+) -> np.ndarray:
+    """
+    Copies values into an array that can't be written to, so that values derived from it can be kept.
+    """
+
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+
+    return array
+
+
+def latest_level_factors(changes: list | np.ndarray) -> np.ndarray:
+    """
+    Calculates the factors that bring each period to the level of the latest one, i.e., the product of 1 + change
+    over every later period.
+
+    Parameters
+    ----------
+    changes: list | np.ndarray
+        The change for each period, in order.
+    """
+
+    growth = 1 + np.asarray(changes, dtype=float)
+
+    factors = np.ones(len(growth))
+
+    # Multiply the changes together from the latest period backwards.
+    factors[:-1] = np.cumprod(growth[:0:-1])[::-1]
+
+    return factors
@@ -0,0 +1,135 @@
+"""
+Contains the engine that applies the composite premium and loss trends to a model's premiums and claims.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from faslr.constants import TREND_SIDES
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma no coverage
+    from faslr.index import FIndex
+    from numpy.typing import ArrayLike
+    from pandas import DataFrame
+    from typing import (
+        Literal,
+        Optional
+    )
+
+
+class TrendEngine:
+    """
+    Calculates the trended and adjusted loss ratios of a model, i.e., the loss ratio of each year brought to the
+    level of every other year.
+
+    Composing several indexes multiplies their levels together, so each side is kept as a single array of the
+    running product of 1 + change of all its indexes. Bringing year i to the level of year j multiplies the claims
+    by loss[j] / loss[i] and the premium by premium[j] / premium[i], which makes the loss ratio matrix the outer
+    product of a vector over the rows and a vector over the columns. Replacing the indexes of one side only
+    recalculates that side's levels.
+
+    Indexes at a finer grain than the origin, such as monthly rate changes applied to accident years, are aggregated
+    to the grain of the origin with FIndex.aggregate and matched to the origin by period.
+
+    Parameters
+    ----------
+    origin: ArrayLike
+        The origin years, used to label the rows and columns of the loss ratios.
+    claims: ArrayLike
+        The claims of each year.
+    premium: ArrayLike
+        The premium of each year.
+    claim_indexes: Optional[list[FIndex]]
+        The indexes applied to the claims.
+    premium_indexes: Optional[list[FIndex]]
+        The indexes applied to the premium.
+    grain: str
+        The grain of the origin, one of the keys of INDEX_GRAINS.
+    """
+    def __init__(
+            self,
+            origin: ArrayLike,
+            claims: ArrayLike,
+            premium: ArrayLike,
+            claim_indexes: Optional[list[FIndex]] = None,
+            premium_indexes: Optional[list[FIndex]] = None,
+            grain: str = 'Y'
+    ):
+
+        self.origin = list(origin)
+        self.grain = grain
+        self.claims = np.asarray(claims, dtype=float)
+        self.premium = np.asarray(premium, dtype=float)
+
+        # Composite level of each side, by side.
+        self.levels = {}
+
+        self.set_indexes(side='loss', indexes=claim_indexes)
+        self.set_indexes(side='premium', indexes=premium_indexes)
+
+    def set_indexes(
+            self,
+            side: Literal['premium', 'loss'],
+            indexes: Optional[list[FIndex]]
+    ) -> None:
+        """
+        Replaces the indexes applied to one side. With no indexes, the side is left untrended.
+        """
+
+        if side not in TREND_SIDES:
+            raise ValueError("Invalid trend side provided. It should either be 'premium' or 'loss'.")
+
+        level = np.ones(len(self.origin))
+
+        for findex in indexes or []:
+
+            level = level * self.origin_level(findex=findex)
+
+        self.levels[side] = level
+
+    def origin_level(
+            self,
+            findex: FIndex
+    ) -> np.ndarray:
+        """
+        Returns the level of an index for each origin period. An index at the grain of the origin is taken to have
+        one change per origin period, in order. Finer indexes are aggregated and matched to the origin by period.
+        """
+
+        if findex.grain == self.grain:
+
+            if len(findex.level_values) != len(self.origin):
+                raise ValueError("Index " + str(findex.name) + " does not have one change for each origin year.")
+
+            return findex.level_values
+
+        aggregated = findex.aggregate(grain=self.grain)
+
+        positions = pd.Index(aggregated.periods).get_indexer(
+            pd.PeriodIndex(pd.Index(self.origin).astype(str), freq=self.grain)
+        )
+
+        if (positions < 0).any():
+            raise ValueError("Index " + str(findex.name) + " does not cover every origin period.")
+
+        return aggregated.level_values[positions]
+
+    def loss_ratios(self) -> DataFrame:
+        """
+        Returns the matrix of adjusted loss ratios, with the year being adjusted along the rows and the year it is
+        brought to along the columns.
+        """
+
+        relative_level = self.levels['loss'] / self.levels['premium']
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rows = self.claims / (self.premium * relative_level)
+
+        return pd.DataFrame(
+            data=rows[:, None] * relative_level[None, :],
+            index=self.origin,
+            columns=[str(year) for year in self.origin]
+        )
@@ -22,6 +22,8 @@ from faslr.model import (
     FModelWidget
 )
 
+from faslr.methods.benktander_engine import BenktanderEngine
+
 from faslr.methods.expected_loss import (
     ExpectedLossAprioriWidget,
     ExpectedLossRatioWidget
@@ -385,19 +387,19 @@ class BenktanderAprioriModel(FAbstractTableModel):
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-            self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-            self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-            self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-            self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-            self._data['BF Reported IBNR'] = self._data['Ultimate BF Reported'] - self._data['Reported Losses']
-            self._data['BF Paid IBNR'] = self._data['Ultimate BF Paid'] - self._data['Reported Losses']
-            self._data['BF Reported Unpaid Claims'] = self._data['Ultimate BF Reported'] - self._data['Paid Losses']
-            self._data['BF Paid Unpaid Claims'] = self._data['Ultimate BF Paid'] - self._data['Paid Losses']
-
-            self.dataChanged.emit(index, index)
-            self.layoutChanged.emit()
+            data = self._data.copy()
+            data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
+            data['Expected Claims'] = data['Selected Loss Ratio'] * data['On-Level Earned Premium']
+            data['Expected Unreported'] = data['% Unreported'] * data['Expected Claims']
+            data['Expected Unpaid'] = data['% Unpaid'] * data['Expected Claims']
+            data['Ultimate BF Reported'] = data['Expected Unreported'] + data['Reported Losses']
+            data['Ultimate BF Paid'] = data['Expected Unpaid'] + data['Paid Losses']
+            data['BF Reported IBNR'] = data['Ultimate BF Reported'] - data['Reported Losses']
+            data['BF Paid IBNR'] = data['Ultimate BF Paid'] - data['Reported Losses']
+            data['BF Reported Unpaid Claims'] = data['Ultimate BF Reported'] - data['Paid Losses']
+            data['BF Paid Unpaid Claims'] = data['Ultimate BF Paid'] - data['Paid Losses']
+
+            self.update_data(data)
 
         return True
 
@@ -621,11 +623,16 @@ class BenktanderIBNRModel(FIBNRModel):
         self._data['Paid CDF'] = apriori_model._data['Paid CDF']
         self._data['% Unreported'] = apriori_model._data['% Unreported']
         self._data['% Unpaid'] = apriori_model._data['% Unpaid']
-        self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data['Ultimate BF Reported'] * self._data['% Unreported']
-        self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                             self._data['% Unpaid']
-        self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-        self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
+        self._data['Ultimate GB Reported'] = np.nan
+        self._data['Ultimate GB Paid'] = np.nan
+        self._data['GB Reported IBNR'] = np.nan
+        self._data['GB Paid IBNR'] = np.nan
+
+        self.engine = self.make_engine()
+        self._data = self.iterate(
+            data=self._data,
+            iterations=1
+        )
 
     def data(self, index, role=...) -> Any:
 
@@ -656,39 +663,52 @@ class BenktanderIBNRModel(FIBNRModel):
 
             iterations = self.parent.toolbox.iterations_spinbox.value()
 
-            apriori_model = self.parent.parent.bf_tab.apriori_model
+            # The expected claims change with the selected loss ratios, so the engine is rebuilt from the B-F result.
+            self.engine = self.make_engine()
 
+            data = self.iterate(
+                data=self._data.copy(),
+                iterations=iterations
+            )
 
-            self._data['Ultimate BF Reported'] = apriori_model._data['Ultimate BF Reported']
-            self._data['Ultimate BF Paid'] = apriori_model._data['Ultimate BF Paid']
-            self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data['Ultimate BF Reported'] * \
-                                                 self._data['% Unreported']
-            self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                             self._data['% Unpaid']
-            self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-            self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
+            self.update_data(data)
+
+        return True
 
-            i = 1
+    def make_engine(self) -> BenktanderEngine:
+        """
+        Creates the engine for the reported and paid claims from the B-F result, with reported claims in the first
+        row of its arrays and paid claims in the second.
+        """
 
-            while i < iterations:
+        apriori_data = self.parent.parent.bf_tab.apriori_model._data
 
-                self._data['Ultimate BF Reported'] = self._data['Ultimate GB Reported']
-                self._data['Ultimate BF Paid'] = self._data['Ultimate GB Paid']
-                self._data['Ultimate GB Reported'] = self._data['Reported Losses'] + self._data[
-                    'Ultimate BF Reported'] * \
-                                                     self._data['% Unreported']
-                self._data['Ultimate GB Paid'] = self._data['Paid Losses'] + self._data['Ultimate BF Paid'] * \
-                                                 self._data['% Unpaid']
-                self._data['GB Reported IBNR'] = self._data['Ultimate GB Reported'] - self._data['Reported Losses']
-                self._data['GB Paid IBNR'] = self._data['Ultimate GB Paid'] - self._data['Reported Losses']
+        return BenktanderEngine(
+            losses=apriori_data[['Reported Losses', 'Paid Losses']].to_numpy().T,
+            cdfs=apriori_data[['Reported CDF', 'Paid CDF']].to_numpy().T,
+            expected=apriori_data['Expected Claims'].to_numpy()
+        )
 
-                i += 1
+    def iterate(
+            self,
+            data: DataFrame,
+            iterations: int
+    ) -> DataFrame:
+        """
+        Fills in the ultimates after the given number of iterations past the B-F result, along with the ultimates
+        of the iteration before, which serve as its expected claims.
+        """
 
+        (bf_reported, bf_paid), (gb_reported, gb_paid) = self.engine.path(iterations=iterations + 1)[-2:]
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+        data['Ultimate BF Reported'] = bf_reported
+        data['Ultimate BF Paid'] = bf_paid
+        data['Ultimate GB Reported'] = gb_reported
+        data['Ultimate GB Paid'] = gb_paid
+        data['GB Reported IBNR'] = data['Ultimate GB Reported'] - data['Reported Losses']
+        data['GB Paid IBNR'] = data['Ultimate GB Paid'] - data['Reported Losses']
 
-        return True
+        return data
 
 class BenktanderIBNRToolbox(QWidget):
     def __init__(
@@ -702,8 +722,9 @@ class BenktanderIBNRToolbox(QWidget):
         self.layout = QHBoxLayout()
         self.iterations_label = QLabel("Iterations:")
         self.iterations_spinbox = QSpinBox()
-        self.iterations_spinbox.setValue(1)
         self.iterations_spinbox.setMinimum(1)
+        self.iterations_spinbox.setMaximum(999)
+        self.iterations_spinbox.setValue(1)
         self.layout.addWidget(self.iterations_label)
         self.layout.addWidget(self.iterations_spinbox)
         self.setLayout(self.layout)
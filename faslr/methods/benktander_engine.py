@@ -0,0 +1,80 @@
+"""
+Contains the engine that calculates the ultimates of the Benktander method for any number of iterations.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma no coverage
+    from numpy.typing import ArrayLike
+
+
+class BenktanderEngine:
+    """
+    Calculates the ultimate claims of the iterated Bornhuetter-Ferguson, or Benktander, method.
+
+    Each iteration replaces the expected claims with the previous ultimate, U_k = L + q * U_(k-1), where L is the
+    claims to date and q = 1 - 1 / CDF is the expected percentage unreported or unpaid, starting from the a priori
+    expected claims U_0. Unrolling the recursion gives the closed form U_k = C + q^k * (U_0 - C), where C = L * CDF
+    is the chain ladder ultimate, so any number of iterations costs the same few array operations. The first
+    iteration is the Bornhuetter-Ferguson ultimate and the second is the Benktander ultimate, and the ultimates
+    converge to the chain ladder ultimate as the number of iterations grows.
+
+    The arguments are broadcast against each other, so reported and paid claims can be calculated together by
+    stacking them along a leading axis.
+
+    Parameters
+    ----------
+    losses: ArrayLike
+        The claims to date of each origin period.
+    cdfs: ArrayLike
+        The CDFs to ultimate of each origin period. CDFs below 1 are treated as 1.
+    expected: ArrayLike
+        The a priori expected claims of each origin period, e.g., the selected loss ratio times the on-level premium.
+    """
+    def __init__(
+            self,
+            losses: ArrayLike,
+            cdfs: ArrayLike,
+            expected: ArrayLike
+    ):
+
+        self.losses = np.asarray(losses, dtype=float)
+        self.cdfs = np.maximum(1, np.asarray(cdfs, dtype=float))
+        self.expected = np.asarray(expected, dtype=float)
+
+        self.unreported = 1 - 1 / self.cdfs
+        self.chainladder = self.losses * self.cdfs
+
+    def ultimates(
+            self,
+            iterations: int
+    ) -> np.ndarray:
+        """
+        Returns the ultimates after the given number of iterations, where 0 gives the a priori expected claims and 1
+        the Bornhuetter-Ferguson ultimates.
+        """
+
+        if iterations < 0:
+            raise ValueError("The number of iterations cannot be negative.")
+
+        return self.chainladder + self.unreported ** iterations * (self.expected - self.chainladder)
+
+    def path(
+            self,
+            iterations: int
+    ) -> np.ndarray:
+        """
+        Returns the ultimates of every iteration from 1 to the given number, with the iterations along the first
+        axis, e.g., for charting how quickly the ultimates converge to the chain ladder ultimates.
+        """
+
+        if iterations < 1:
+            raise ValueError("The number of iterations must be at least 1.")
+
+        shape = np.broadcast(self.chainladder, self.expected).shape
+        powers = np.arange(1, iterations + 1).reshape((-1,) + (1,) * len(shape))
+
+        return self.chainladder + self.unreported ** powers * (self.expected - self.chainladder)
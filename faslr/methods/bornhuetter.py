@@ -453,18 +453,18 @@ class BornhuetterIBNRModel(FIBNRModel):
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Expected Claims'] = self._data['Selected Loss Ratio'] * self._data['On-Level Earned Premium']
-            self._data['Expected Unreported'] = self._data['% Unreported'] * self._data['Expected Claims']
-            self._data['Expected Unpaid'] = self._data['% Unpaid'] * self._data['Expected Claims']
-            self._data['Ultimate BF Reported'] = self._data['Expected Unreported'] + self._data['Reported Losses']
-            self._data['Ultimate BF Paid'] = self._data['Expected Unpaid'] + self._data['Paid Losses']
-            self._data['BF Reported IBNR'] = self._data['Ultimate BF Reported'] - self._data['Reported Losses']
-            self._data['BF Paid IBNR'] = self._data['Ultimate BF Paid'] - self._data['Reported Losses']
-            self._data['BF Reported Unpaid Claims'] = self._data['Ultimate BF Reported'] - self._data['Paid Losses']
-            self._data['BF Paid Unpaid Claims'] = self._data['Ultimate BF Paid'] - self._data['Paid Losses']
-
-            self.dataChanged.emit(index, index)
-            self.layoutChanged.emit()
+            data = self._data.copy()
+            data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
+            data['Expected Claims'] = data['Selected Loss Ratio'] * data['On-Level Earned Premium']
+            data['Expected Unreported'] = data['% Unreported'] * data['Expected Claims']
+            data['Expected Unpaid'] = data['% Unpaid'] * data['Expected Claims']
+            data['Ultimate BF Reported'] = data['Expected Unreported'] + data['Reported Losses']
+            data['Ultimate BF Paid'] = data['Expected Unpaid'] + data['Paid Losses']
+            data['BF Reported IBNR'] = data['Ultimate BF Reported'] - data['Reported Losses']
+            data['BF Paid IBNR'] = data['Ultimate BF Paid'] - data['Reported Losses']
+            data['BF Reported Unpaid Claims'] = data['Ultimate BF Reported'] - data['Paid Losses']
+            data['BF Paid Unpaid Claims'] = data['Ultimate BF Paid'] - data['Paid Losses']
+
+            self.update_data(data)
 
         return True
\ No newline at end of file
@@ -95,7 +95,7 @@ class DevelopmentTab(QWidget):
                 self.factor_model.triangle,
                 cmap="coolwarm"
             )
-            self.factor_model.layoutChanged.emit() # noqa
         else:
             self.factor_model.heatmap_checked = False
-            self.factor_model.layoutChanged.emit() # noqa
+
+        self.factor_model.refresh_heatmap()
@@ -16,11 +16,14 @@ from faslr.common.model import (
     FSelectionModel
 )
 
-from faslr.constants import UpdateIndexRole
+from faslr.constants import (
+    TREND_SIDES,
+    UpdateIndexRole
+)
 
 from faslr.grid_header import GridTableView
 
-from faslr.index import FIndex
+from faslr.index import TrendEngine
 
 from faslr.model import (
     FModelWidget,
@@ -62,6 +65,7 @@ from typing import (
 
 if TYPE_CHECKING:
     from chainladder import Chainladder
+    from faslr.index import FIndex
     from numpy.typing import ArrayLike
     from pandas import (
         DataFrame,
@@ -523,22 +527,20 @@ class ExpectedLossRatioModel(FSelectionModel):
             self.origin = origin
             self.claims = claims
             self.premium = premium
-            # Create composite indexes
-            self.comp_loss_trend = self.compose_trend(origin=origin, indexes=claim_indexes)
-
-            self.comp_prem_trend = self.compose_trend(origin=origin, indexes=premium_indexes)
-
-            adj_loss_ratios = self.calculate_loss_ratios(
+            # Holds the composite premium and loss trends.
+            self.trend = TrendEngine(
+                origin=origin,
                 claims=claims,
                 premium=premium,
-                loss_trend=self.comp_loss_trend,
-                prem_trend=self.comp_prem_trend
+                claim_indexes=claim_indexes,
+                premium_indexes=premium_indexes
             )
+
+            adj_loss_ratios = self.trend.loss_ratios()
         else:
             self.origin = []
             self.claims = []
-            self.comp_prem_trend = None
-            self.comp_prem_trend = None
+            self.trend = None
             adj_loss_ratios = pd.DataFrame()
 
         super().__init__(
@@ -561,60 +563,6 @@ class ExpectedLossRatioModel(FSelectionModel):
             else:
                 return PERCENT_STYLE.format(value)
 
-    @staticmethod
-    def compose_trend(
-            origin: list,
-            indexes: list
-    ) -> FIndex:
-        """
-        Combines multiple indexes into a single index.
-
-        Parameters
-        ----------
-        origin: list
-            The origin of the triangle.
-        indexes: list
-            The indexes to be combined.
-        """
-        # No indexes supplied, return default index of just 1 for all factors.
-        if (indexes is None) or len(indexes) == 0:
-            comp_index = FIndex(origin=origin, changes=[0] * len(origin))
-        # Multiple indexes, compose them together.
-        elif len(indexes) > 1:
-            comp_index = indexes[0].compose(indexes[1:])
-        # Single index, leave as-is.
-        else:
-            comp_index = indexes[0]
-
-        return comp_index
-
-    @staticmethod
-    def calculate_loss_ratios(
-            claims: ArrayLike,
-            premium: ArrayLike,
-            loss_trend: FIndex,
-            prem_trend: FIndex
-    ) -> DataFrame:
-        """
-        Calculates trended and adjusted loss ratios.
-
-        Parameters
-        ----------
-        claims: ArrayLike
-        premium: ArrayLike
-        loss_trend: FIndex
-            The loss trend applied to the claims.
-        prem_trend: FIndex
-            The premium trend applied to the premiums.
-        """
-
-        trended_loss_matrix: DataFrame = loss_trend.apply_matrix(values=claims)
-        on_level_premium_matrix: DataFrame = prem_trend.apply_matrix(values=premium)
-
-        adj_loss_ratios: DataFrame = trended_loss_matrix.div(on_level_premium_matrix)
-
-        return adj_loss_ratios
-
     def update_indexes(
             self,
             indexes: list,
@@ -630,36 +578,18 @@ class ExpectedLossRatioModel(FSelectionModel):
             A string indication what type of indexes are being applied. They will either be 'premium' or 'loss' indexes.
         """
 
-        # Compose the new premium or loss trend. Then apply it to construct the new trended and adjusted loss ratios.
-        composite_index: FIndex = self.compose_trend(
-            origin=self.origin,
+        if prem_loss not in TREND_SIDES:
+            raise ValueError("Invalid value provided to prem_loss. It should either be 'premium' or 'loss'.")
+
+        # Only the side that changed is recomposed, the other side's trend is kept as it is.
+        self.trend.set_indexes(
+            side=prem_loss,
             indexes=indexes
         )
 
-        # If new composite trend is premium, apply it along with the existing composite loss trend.
-        if prem_loss == 'premium':
-            adj_loss_ratios = self.calculate_loss_ratios(
-                claims=self.claims,
-                premium=self.premium,
-                loss_trend=self.comp_loss_trend,
-                prem_trend=composite_index
-            )
-            self.comp_prem_trend = composite_index
-        # If new composite trend is loss, apply it along with the existing composite premium trend.
-        elif prem_loss == 'loss':
-            adj_loss_ratios = self.calculate_loss_ratios(
-                claims=self.claims,
-                premium=self.premium,
-                loss_trend=composite_index,
-                prem_trend=self.comp_prem_trend
-            )
-            self.comp_loss_trend = composite_index
-        else:
-            raise ValueError("Invalid value provided to prem_loss. It should either be 'premium' or 'loss'.")
-
         self.setData(
             role=UpdateIndexRole,
-            value=adj_loss_ratios,
+            value=self.trend.loss_ratios(),
             index=QModelIndex()
         )
 
@@ -712,12 +642,12 @@ class ExpectedLossIBNRModel(FIBNRModel):
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
-            self._data['Ultimate Loss'] = self._data['On-Level Earned Premium'] * self._data['Selected Loss Ratio']
-            self._data['IBNR'] = self._data['Ultimate Loss'] - self._data['Reported Losses']
-            self._data['Unpaid Claims'] = self._data['Ultimate Loss'] - self._data['Paid Losses']
+            data = self._data.copy()
+            data['Selected Loss Ratio'] = self.parent_model.selected_ratios_row.T['Selected Averages']
+            data['Ultimate Loss'] = data['On-Level Earned Premium'] * data['Selected Loss Ratio']
+            data['IBNR'] = data['Ultimate Loss'] - data['Reported Losses']
+            data['Unpaid Claims'] = data['Ultimate Loss'] - data['Paid Losses']
 
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+            self.update_data(data)
 
         return True
\ No newline at end of file
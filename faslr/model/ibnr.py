@@ -83,14 +83,15 @@ class FIBNRModel(FAbstractTableModel):
         self.parent: FIBNRWidget = parent
         self.parent_model = self.parent.parent.selection_tab.selection_model
 
-        self._data: DataFrame = self.parent_model.selected_ratios_row.T
+        # Copied, since the transpose can share memory with the selected ratios, which are edited in place.
+        self._data: DataFrame = self.parent_model.selected_ratios_row.T.copy()
 
     def data(self, index, role = ...) -> Any:
 
         if role == Qt.ItemDataRole.DisplayRole:
 
-            value = self._data.iloc[index.row(), index.column()]
-            col = self._data.columns[index.column()]
+            value = self.value(index.row(), index.column())
+            col = self.column_name(index.column())
 
             if np.isnan(value):
                 return ""
@@ -109,17 +110,14 @@ class FIBNRModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_label(p_int)
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.index_label(p_int)
 
     def setData(self, index, value, role = ...) -> bool:
 
         if role == Qt.ItemDataRole.EditRole:
-            self._data = self.parent_model.selected_ratios_row.T
-
-        self.dataChanged.emit(index, index)
-        self.layoutChanged.emit()
+            self.update_data(self.parent_model.selected_ratios_row.T.copy())
 
         return True
\ No newline at end of file
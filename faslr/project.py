@@ -4,8 +4,11 @@ Contains classes to display and interact with project information located to the
 from __future__ import annotations
 
 import faslr.core as core
+import sqlalchemy as sa
 
-from faslr.connection import connect_db
+from faslr.connection import session_scope
+
+from faslr.constants import PROJECT_FETCH_SIZE
 
 from faslr.country import CountryTab
 
@@ -48,6 +51,8 @@ from PyQt6.QtWidgets import (
     QTreeView
 )
 
+from sqlalchemy.orm import Session
+
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
@@ -55,6 +60,78 @@ if TYPE_CHECKING:  # pragma: no coverage
     from faslr.__main__ import MainWindow
 
 
+def country_query(offset: int) -> sa.Select:
+    """
+    Returns the statement that selects a batch of countries for the project tree, along with their project ids and
+    number of states.
+    """
+
+    n_states = sa.select(
+        sa.func.count(StateTable.state_id)
+    ).where(
+        StateTable.country_id == CountryTable.country_id
+    ).scalar_subquery()
+
+    return sa.select(
+        CountryTable.country_name,
+        CountryTable.project_id,
+        n_states
+    ).order_by(
+        CountryTable.country_id
+    ).offset(offset).limit(PROJECT_FETCH_SIZE)
+
+
+def state_query(
+        country_id: str,
+        offset: int
+) -> sa.Select:
+    """
+    Returns the statement that selects a batch of the states of a country, given its project id, along with their
+    project ids and number of LOBs.
+    """
+
+    n_lobs = sa.select(
+        sa.func.count(LOBTable.lob_id)
+    ).where(
+        LOBTable.location_id == StateTable.location_id
+    ).scalar_subquery()
+
+    return sa.select(
+        StateTable.state_name,
+        StateTable.project_id,
+        n_lobs
+    ).join(
+        CountryTable,
+        CountryTable.country_id == StateTable.country_id
+    ).where(
+        CountryTable.project_id == country_id
+    ).order_by(
+        StateTable.state_id
+    ).offset(offset).limit(PROJECT_FETCH_SIZE)
+
+
+def lob_query(
+        state_id: str,
+        offset: int
+) -> sa.Select:
+    """
+    Returns the statement that selects a batch of the LOBs of a state, given its project id, along with their
+    project ids.
+    """
+
+    return sa.select(
+        LOBTable.lob_type,
+        LOBTable.project_id
+    ).join(
+        StateTable,
+        StateTable.location_id == LOBTable.location_id
+    ).where(
+        StateTable.project_id == state_id
+    ).order_by(
+        LOBTable.lob_id
+    ).offset(offset).limit(PROJECT_FETCH_SIZE)
+
+
 class ProjectDialog(QDialog):
     def __init__(
             self,
@@ -116,161 +193,114 @@ class ProjectDialog(QDialog):
             main_window: MainWindow
     ) -> None:
 
-        # connect to the database
-        session, connection = connect_db(db_path=core.db)
-
-        # Take values from the form
-        country_text = self.country_edit.text()
-        state_text = self.state_edit.text()
-        lob_text = self.lob_edit.text()
-
-        # Create an entries for the project tree
-        country = ProjectItem(
-            text=country_text,
-            segment_level="country",
-            set_bold=True
-        )
-
-        state = ProjectItem(
-            text=state_text,
-            segment_level="state"
-        )
-
-        lob = ProjectItem(
-            text=lob_text,
-            segment_level="lob",
-            text_color=QColor(
-                155,
-                0,
-                0
-            )
-        )
-
-        # Check if the country is already in the database
-        country_query = session.query(CountryTable).filter(CountryTable.country_name == country_text)
-
-        # new_project = ProjectTable()
-
-        # If the country is not already in the database, create a new entry for it
-        if country_query.first() is None:
-
-            # Generate project UUIDs for each of the three fields
-            country_uuid = str(uuid4())
-            state_uuid = str(uuid4())
-            lob_uuid = str(uuid4())
-
-            # Create location ids for country and state
-            new_country_location = LocationTable(hierarchy="country")
-
-            new_state_location = LocationTable(hierarchy="state")
+        project_model: ProjectModel = main_window.project_model
 
-            session.add(new_country_location)
-            session.add(new_state_location)
-
-            # flush the session to get the newly created location ids
-            session.flush()
+        # connect to the database
+        with session_scope(db_path=core.db) as session:
 
-            # Create state and country db entries
-            new_country = CountryTable(
-                country_name=country_text,
-                project_id=country_uuid,
-                location_id=new_country_location.location_id
-            )
+            # Take values from the form
+            country_text = self.country_edit.text()
+            state_text = self.state_edit.text()
+            lob_text = self.lob_edit.text()
 
-            new_state = StateTable(
-                state_name=state_text,
-                project_id=state_uuid,
-                location_id=new_state_location.location_id
-            )
-
-            # Create corresponding projects
-            new_country_project = ProjectTable(
-                project_id=country_uuid
+            # Create an entries for the project tree
+            country = ProjectItem(
+                text=country_text,
+                segment_level="country",
+                set_bold=True
             )
 
-            new_state_project = ProjectTable(
-                project_id=state_uuid
+            state = ProjectItem(
+                text=state_text,
+                segment_level="state"
             )
 
-            # fill out object hierarchy
-            new_country.state = [new_state]
-            new_country_project.country = [new_country]
-            new_state_project.state = [new_state]
-
-            # Add entries into the project tree
-            country.appendRow([state, QStandardItem(state_uuid)])
-            state.appendRow([lob, QStandardItem(lob_uuid)])
-
-            main_window.project_model.project_root.appendRow([
-                country,
-                QStandardItem(country_uuid)
-            ])
-
-            # Add entries to the database session
-            session.add(new_country_project)
-            session.add(new_state_project)
-
-            # define lob entry, we need to do this after state and country because we depend on the ids
-            new_lob_project = ProjectTable(
-                project_id=lob_uuid
+            lob = ProjectItem(
+                text=lob_text,
+                segment_level="lob",
+                text_color=QColor(
+                    155,
+                    0,
+                    0
+                )
             )
 
-            lob_location = new_state_location.location_id
+            # Check if the country is already in the database
+            country_query = session.query(CountryTable).filter(CountryTable.country_name == country_text)
 
-            new_lob = LOBTable(
-                lob_type=lob_text,
-                project_id=lob_uuid,
-                location_id=lob_location
-            )
-
-            new_lob.country = new_country
-            new_lob.state = new_state
-            new_lob_project.lob = [new_lob]
+            # new_project = ProjectTable()
 
-            session.add(new_lob_project)
+            # If the country is not already in the database, create a new entry for it
+            if country_query.first() is None:
 
-        # Otherwise, check if the state is already in the database
-        else:
-
-            existing_country = country_query.first()
-            country_id = existing_country.country_id
-            country_uuid = existing_country.project_id
-
-            # If the state is in the database, this query should return it
-            state_query = session.query(StateTable).filter(
-                StateTable.state_name == state_text
-            ).filter(
-                StateTable.country_id == country_id
-            )
-
-            # If the state isn't already in the database, create an entry for it
-            if state_query.first() is None:
-
-                # create project ids for state and lob only, since country uuid already exists
+                # Generate project UUIDs for each of the three fields
+                country_uuid = str(uuid4())
                 state_uuid = str(uuid4())
                 lob_uuid = str(uuid4())
 
+                # Create location ids for country and state
+                new_country_location = LocationTable(hierarchy="country")
+
                 new_state_location = LocationTable(hierarchy="state")
+
+                session.add(new_country_location)
                 session.add(new_state_location)
-                # flush the session to get the newly created location id
+
+                # flush the session to get the newly created location ids
                 session.flush()
 
-                # Create database entry for the state and its associated project
+                # Create state and country db entries
+                new_country = CountryTable(
+                    country_name=country_text,
+                    project_id=country_uuid,
+                    location_id=new_country_location.location_id
+                )
+
                 new_state = StateTable(
                     state_name=state_text,
                     project_id=state_uuid,
                     location_id=new_state_location.location_id
                 )
 
+                # Create corresponding projects
+                new_country_project = ProjectTable(
+                    project_id=country_uuid
+                )
+
                 new_state_project = ProjectTable(
                     project_id=state_uuid
                 )
 
-                new_state.country = existing_country
+                # fill out object hierarchy
+                new_country.state = [new_state]
+                new_country_project.country = [new_country]
+                new_state_project.state = [new_state]
+
+                # Add entries into the project tree
+                project_model.add_project_item(
+                    item=country,
+                    project_id=country_uuid
+                )
+                project_model.add_project_item(
+                    item=state,
+                    project_id=state_uuid,
+                    parent_id=country_uuid
+                )
+                project_model.add_project_item(
+                    item=lob,
+                    project_id=lob_uuid,
+                    parent_id=state_uuid
+                )
 
+                # Add entries to the database session
+                session.add(new_country_project)
                 session.add(new_state_project)
 
-                # Define the new LOB
+                # define lob entry, we need to do this after state and country because we depend on the ids
+                new_lob_project = ProjectTable(
+                    project_id=lob_uuid
+                )
+
                 lob_location = new_state_location.location_id
 
                 new_lob = LOBTable(
@@ -279,70 +309,118 @@ class ProjectDialog(QDialog):
                     location_id=lob_location
                 )
 
-                new_lob_project = ProjectTable(
-                    project_id=lob_uuid
-                )
-
-                new_lob.country = existing_country
+                new_lob.country = new_country
                 new_lob.state = new_state
                 new_lob_project.lob = [new_lob]
 
                 session.add(new_lob_project)
 
-                # populate the project tree
-                # find the existing country and append the new state to it
-                country_tree_item = main_window.project_model.findItems(
-                    country_uuid,
-                    Qt.MatchFlag.MatchExactly,
-                    1
+            # Otherwise, check if the state is already in the database
+            else:
+
+                existing_country = country_query.first()
+                country_id = existing_country.country_id
+                country_uuid = existing_country.project_id
+
+                # If the state is in the database, this query should return it
+                state_query = session.query(StateTable).filter(
+                    StateTable.state_name == state_text
+                ).filter(
+                    StateTable.country_id == country_id
                 )
 
-                if country_tree_item:
-                    ix = main_window.project_model.indexFromItem(country_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([state, QStandardItem(state_uuid)])
-                    state.appendRow([lob, QStandardItem(lob_uuid)])
+                # If the state isn't already in the database, create an entry for it
+                if state_query.first() is None:
 
-            # If the state already exists append the LOB to it
-            else:
-                existing_state = state_query.first()
-                state_uuid = existing_state.project_id
-                lob_uuid = str(uuid4())
+                    # create project ids for state and lob only, since country uuid already exists
+                    state_uuid = str(uuid4())
+                    lob_uuid = str(uuid4())
 
-                lob_location = existing_state.location_id
+                    new_state_location = LocationTable(hierarchy="state")
+                    session.add(new_state_location)
+                    # flush the session to get the newly created location id
+                    session.flush()
 
-                new_lob = LOBTable(
-                    lob_type=lob_text,
-                    project_id=lob_uuid,
-                    location_id=lob_location
-                )
+                    # Create database entry for the state and its associated project
+                    new_state = StateTable(
+                        state_name=state_text,
+                        project_id=state_uuid,
+                        location_id=new_state_location.location_id
+                    )
+
+                    new_state_project = ProjectTable(
+                        project_id=state_uuid
+                    )
 
-                new_lob.country = existing_country
-                new_lob.state = existing_state
+                    new_state.country = existing_country
 
-                new_lob_project = ProjectTable(
-                    project_id=lob_uuid
-                )
+                    session.add(new_state_project)
 
-                session.add(new_lob)
-                session.add(new_lob_project)
+                    # Define the new LOB
+                    lob_location = new_state_location.location_id
 
-                state_tree_item = main_window.project_model.findItems(
-                    state_uuid,
-                    Qt.MatchFlag.MatchRecursive,
-                    1
-                )
-                # state_tree_item = country_tree_item.findItems(state_uuid, Qt.MatchExactly, 1)
-                if state_tree_item:
-                    ix = main_window.project_model.indexFromItem(state_tree_item[0])
-                    ix_col_0 = main_window.project_model.sibling(ix.row(), 0, ix)
-                    it_col_0 = main_window.project_model.itemFromIndex(ix_col_0)
-                    it_col_0.appendRow([lob, QStandardItem(lob_uuid)])
+                    new_lob = LOBTable(
+                        lob_type=lob_text,
+                        project_id=lob_uuid,
+                        location_id=lob_location
+                    )
+
+                    new_lob_project = ProjectTable(
+                        project_id=lob_uuid
+                    )
+
+                    new_lob.country = existing_country
+                    new_lob.state = new_state
+                    new_lob_project.lob = [new_lob]
+
+                    session.add(new_lob_project)
+
+                    # populate the project tree
+                    # find the existing country and append the new state to it
+                    if country_uuid in project_model.project_items:
+                        project_model.add_project_item(
+                            item=state,
+                            project_id=state_uuid,
+                            parent_id=country_uuid
+                        )
+                        project_model.add_project_item(
+                            item=lob,
+                            project_id=lob_uuid,
+                            parent_id=state_uuid
+                        )
+
+                # If the state already exists append the LOB to it
+                else:
+                    existing_state = state_query.first()
+                    state_uuid = existing_state.project_id
+                    lob_uuid = str(uuid4())
+
+                    lob_location = existing_state.location_id
+
+                    new_lob = LOBTable(
+                        lob_type=lob_text,
+                        project_id=lob_uuid,
+                        location_id=lob_location
+                    )
+
+                    new_lob.country = existing_country
+                    new_lob.state = existing_state
+
+                    new_lob_project = ProjectTable(
+                        project_id=lob_uuid
+                    )
 
-        session.commit()
+                    session.add(new_lob)
+                    session.add(new_lob_project)
 
-        connection.close()
+                    if state_uuid in project_model.project_items:
+                        project_model.add_project_item(
+                            item=lob,
+                            project_id=lob_uuid,
+                            parent_id=state_uuid
+                        )
+
+            session.commit()
 
         # main_window.project_pane.expandAll()
 
@@ -478,116 +556,346 @@ class ProjectTreeView(QTreeView):
         uuid: str = self.get_uuid()
         current_item: ProjectItem = self.get_project_item()
         # connect to the database
-        session, connection = connect_db(db_path=core.db)
+        with session_scope(db_path=core.db) as session:
         
-        # delete the item from the database with uuid
-
-        # Case when selection is a country.
-        if current_item.segment_level == 'country':
+            # delete the item from the database with uuid
 
-            country = session.query(CountryTable).filter(CountryTable.project_id == uuid)
-            country_first = country.first()
-            location_id = country_first.location_id
-            location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
-            session.delete(location)
-        else:
-            # Case when selection is an LOB.
-            if current_item.segment_level == 'lob':
-                lob = session.query(LOBTable).filter(LOBTable.project_id == uuid).one()
-                session.delete(lob)
+            # Case when selection is a country.
+            if current_item.segment_level == 'country':
 
-            # Case when selection is a state
-            else:
-                state = session.query(StateTable).filter(StateTable.project_id == uuid)
-                state_first = state.first()
-                location_id = state_first.location_id
+                country = session.query(CountryTable).filter(CountryTable.project_id == uuid)
+                country_first = country.first()
+                location_id = country_first.location_id
                 location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
                 session.delete(location)
+            else:
+                # Case when selection is an LOB.
+                if current_item.segment_level == 'lob':
+                    lob = session.query(LOBTable).filter(LOBTable.project_id == uuid).one()
+                    session.delete(lob)
 
-        session.commit()
-        
-        "remove all rows from qtreeview and refresh"
-        self.model().removeRows(0, self.model().rowCount())
-        """
-    Upon connection to an existing database, populates the project tree in the left-hand pane of the
-    main window based on what projects have been saved to the database.
+                # Case when selection is a state
+                else:
+                    state = session.query(StateTable).filter(StateTable.project_id == uuid)
+                    state_first = state.first()
+                    location_id = state_first.location_id
+                    location = session.query(LocationTable).filter(LocationTable.location_id == location_id).one()
+                    session.delete(location)
+
+            session.commit()
+
+        self.model().remove_project_item(project_id=uuid)
+
+
+class ProjectModel(QStandardItemModel):
     """
+    Holds the project tree, with countries at the top level, their states below them, and the LOBs of each state
+    below those. Each row holds a ProjectItem and the project id of the item.
 
-    # Open up the connection to the database
-        
-        # Query all the countries
-        countries = session.query(
-            CountryTable.country_id,
-            CountryTable.country_name,
-            CountryTable.project_id
-        ).all()
+    The tree is loaded lazily. Only the number of children of each node is known up front, and the children
+    themselves are fetched from the database, PROJECT_FETCH_SIZE rows at a time, when the view asks for them through
+    canFetchMore and fetchMore, e.g., when a node is expanded or scrolled to the end. The items that have been fetched
+    are also kept in a dictionary by project id, so that projects can be added and removed without searching the tree.
+    """
+    def __init__(self):
+        super().__init__()
 
-        # Append each row one at a time, brute force method. For each country, add state rows, and
-        # for each state, add LOB rows.
+        self.setHorizontalHeaderLabels(["Project", "Project_UUID"])
 
-        for country_id, country, country_uuid in countries:
+        self.project_root = self.invisibleRootItem()
 
-            country_item = ProjectItem(
-                text=country,
-                set_bold=True
+        self.db_path = None
+
+        # Fetched items by project id.
+        self.project_items = {}
+
+        # Number of children in the database of each node that has any, by project id. The root is under None.
+        self.child_counts = {}
+
+    def load_projects(
+            self,
+            db_path: str
+    ) -> None:
+        """
+        Replaces the tree with the projects saved in a database. Only the first batch of countries is fetched, along
+        with the number of states in each, the rest of the tree is fetched when the view asks for it.
+        """
+
+        self.clear_projects()
+
+        self.db_path = db_path
+
+        with session_scope(db_path=db_path) as session:
+            self.set_child_count(
+                project_id=None,
+                count=session.query(CountryTable).count()
             )
 
-            country_row = [
-                country_item,
-                QStandardItem(country_uuid)
-            ]
-
-            states = session.query(
-                StateTable.state_id,
-                StateTable.state_name,
-                StateTable.project_id
-            ).filter(
-                StateTable.country_id == country_id
+        self.fetchMore(QModelIndex())
+
+    def project_id(
+            self,
+            index: QModelIndex
+    ) -> str | None:
+        """
+        Returns the project id of the row of an index, or None for the root.
+        """
+
+        if not index.isValid():
+            return None
+
+        return index.siblingAtColumn(1).data()
+
+    def hasChildren(
+            self,
+            parent: QModelIndex = QModelIndex()
+    ) -> bool:
+
+        if parent.isValid() and parent.column() != 0:
+            return False
+
+        project_id = self.project_id(parent)
+
+        if project_id in self.child_counts:
+            return self.child_counts[project_id] > 0
+
+        return super().hasChildren(parent)
+
+    def canFetchMore(
+            self,
+            parent: QModelIndex
+    ) -> bool:
+
+        if parent.isValid() and parent.column() != 0:
+            return False
+
+        project_id = self.project_id(parent)
+        parent_item = self.itemFromIndex(parent) if parent.isValid() else self.project_root
+
+        return parent_item.rowCount() < self.child_counts.get(project_id, 0)
+
+    def fetchMore(
+            self,
+            parent: QModelIndex
+    ) -> None:
+        """
+        Fetches the next batch of children of a node from the database.
+        """
+
+        if not self.canFetchMore(parent):
+            return
+
+        project_id = self.project_id(parent)
+        parent_item = self.itemFromIndex(parent) if parent.isValid() else self.project_root
+
+        with session_scope(db_path=self.db_path) as session:
+
+            if parent_item is self.project_root:
+                rows = self.fetch_countries(session=session, offset=parent_item.rowCount())
+            elif parent_item.segment_level == 'country':
+                rows = self.fetch_states(session=session, country_id=project_id, offset=parent_item.rowCount())
+            else:
+                rows = self.fetch_lobs(session=session, state_id=project_id, offset=parent_item.rowCount())
+
+        for item, child_id, count in rows:
+            self.append_project_item(
+                parent=parent_item,
+                item=item,
+                project_id=child_id
             )
 
-            for state_id, state, state_uuid in states:
+            if count is not None:
+                self.set_child_count(project_id=child_id, count=count)
 
-                state_item = ProjectItem(
-                    state,
-                )
+    def fetch_countries(
+            self,
+            session: Session,
+            offset: int
+    ) -> list:
+        """
+        Returns a batch of countries, along with their project ids and number of states.
+        """
 
-                state_row = [state_item, QStandardItem(state_uuid)]
+        countries = session.execute(country_query(offset=offset))
+
+        return [
+            (
+                ProjectItem(
+                    text=country,
+                    segment_level='country',
+                    set_bold=True
+                ),
+                country_uuid,
+                count
+            ) for country, country_uuid, count in countries
+        ]
+
+    def fetch_states(
+            self,
+            session: Session,
+            country_id: str,
+            offset: int
+    ) -> list:
+        """
+        Returns a batch of the states of a country, along with their project ids and number of LOBs.
+        """
 
-                lobs = session.query(
-                    LOBTable.lob_type, LOBTable.project_id
-                ).join(
-                    LocationTable
-                ).join(
-                    StateTable
-                ).filter(
-                    StateTable.country_id == country_id
-                ).filter(
-                    StateTable.state_id == state_id
-                )
+        states = session.execute(state_query(country_id=country_id, offset=offset))
 
-                for lob, lob_uuid in lobs:
-                    lob_item = ProjectItem(
-                        lob,
-                        text_color=QColor(0, 77, 122)
-                    )
+        return [
+            (
+                ProjectItem(
+                    text=state,
+                    segment_level='state'
+                ),
+                state_uuid,
+                count
+            ) for state, state_uuid, count in states
+        ]
 
-                    lob_row = [lob_item, QStandardItem(lob_uuid)]
+    def fetch_lobs(
+            self,
+            session: Session,
+            state_id: str,
+            offset: int
+    ) -> list:
+        """
+        Returns a batch of the LOBs of a state, along with their project ids.
+        """
 
-                    state_item.appendRow(lob_row)
+        lobs = session.execute(lob_query(state_id=state_id, offset=offset))
+
+        return [
+            (
+                ProjectItem(
+                    text=lob,
+                    segment_level='lob',
+                    text_color=QColor(0, 77, 122)
+                ),
+                lob_uuid,
+                None
+            ) for lob, lob_uuid in lobs
+        ]
+
+    def set_child_count(
+            self,
+            project_id: str | None,
+            count: int
+    ) -> None:
+        """
+        Records the number of children of a node, which is shown in its tooltip.
+        """
 
-                country_item.appendRow(state_row)
+        self.child_counts[project_id] = count
 
-            self.parent.project_model.project_root.appendRow(country_row)
+        item = self.project_items.get(project_id)
 
-        self.parent.project_pane.expandAll()
+        if item is not None:
+            label = 'states' if item.segment_level == 'country' else 'LOBs'
+            item.setToolTip("{0} {1}".format(count, label))
 
-        connection.close()
+    def add_project_item(
+            self,
+            item: ProjectItem,
+            project_id: str,
+            parent_id: str = None
+    ) -> None:
+        """
+        Adds a project that has just been saved to the database to the tree. If the parent has children that are
+        yet to be fetched, or the parent itself has yet to be fetched, the project is left to be fetched along with
+        them.
+
+        Parameters
+        ----------
+        item: ProjectItem
+            The item to display for the project.
+        project_id: str
+            The project id of the item.
+        parent_id: str
+            The project id of the item to add the project under. Added to the top level if None.
+        """
 
+        # The project is fetched along with its parent.
+        if parent_id is not None and parent_id not in self.project_items:
+            return
 
-class ProjectModel(QStandardItemModel):
-    def __init__(self):
-        super().__init__()
+        parent = self.project_root if parent_id is None else self.project_items[parent_id]
 
-        self.setHorizontalHeaderLabels(["Project", "Project_UUID"])
+        fetched = parent.rowCount() >= self.child_counts.get(parent_id, 0)
 
-        self.project_root = self.invisibleRootItem()
+        self.set_child_count(
+            project_id=parent_id,
+            count=self.child_counts.get(parent_id, 0) + 1
+        )
+
+        if fetched:
+            self.append_project_item(
+                parent=parent,
+                item=item,
+                project_id=project_id
+            )
+
+            if item.segment_level != 'lob':
+                self.set_child_count(project_id=project_id, count=0)
+
+    def append_project_item(
+            self,
+            parent: QStandardItem,
+            item: ProjectItem,
+            project_id: str
+    ) -> None:
+
+        parent.appendRow([item, QStandardItem(project_id)])
+
+        self.project_items[project_id] = item
+
+    def remove_project_item(
+            self,
+            project_id: str
+    ) -> None:
+        """
+        Removes a project, along with the projects beneath it, from the tree.
+        """
+
+        item = self.project_items[project_id]
+
+        self.forget_project_item(item=item)
+
+        parent = item.parent()
+        if parent is None:
+            parent = self.project_root
+            parent_id = None
+        else:
+            parent_id = self.project_id(parent.index())
+
+        parent.removeRow(item.row())
+
+        self.set_child_count(
+            project_id=parent_id,
+            count=self.child_counts[parent_id] - 1
+        )
+
+    def forget_project_item(
+            self,
+            item: QStandardItem
+    ) -> None:
+        """
+        Drops an item and its descendants from project_items and child_counts.
+        """
+
+        for row in range(item.rowCount()):
+            self.forget_project_item(item=item.child(row, 0))
+
+        project_id = self.project_id(item.index())
+
+        self.project_items.pop(project_id, None)
+        self.child_counts.pop(project_id, None)
+
+    def clear_projects(self) -> None:
+        """
+        Removes every project from the tree.
+        """
+
+        self.project_root.removeRows(0, self.project_root.rowCount())
+        self.project_items.clear()
+        self.child_counts.clear()
@@ -0,0 +1,180 @@
+"""
+Contains the cache that keeps the results calculated from a project view in the database, so that reopening the
+view reads them back instead of recalculating them.
+"""
+from __future__ import annotations
+
+import hashlib
+
+from faslr.connection import session_scope
+
+from faslr.schema import ProjectViewResult
+
+from faslr.utilities.cache import triangle_fingerprint
+
+from faslr.utilities.storage import (
+    pack_arrays,
+    unpack_arrays
+)
+
+from typing import (
+    Callable,
+    Hashable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:  # pragma no coverage
+    from chainladder import Triangle
+
+
+class ViewResultCache:
+    """
+    Stores results calculated from the data of a project view in the project_view_result table. Each result is a
+    dictionary of NumPy arrays, stored under a key made from the hash of the view's data and the key supplied by
+    the caller, which should identify the calculation and its parameters, e.g., ('valuation correlation',
+    'Paid Claims', 0.1).
+
+    The results of the view are read in a single query the first time one is needed. Those calculated from
+    different data, if any were left behind, are deleted at the same time, although the triggers on the view's
+    data normally delete them as soon as the data change.
+
+    Parameters
+    ----------
+    db_path: str
+        The path to the database holding the view.
+    view_id: int
+        The id of the view.
+    data_hash: str
+        Identifies the data of the view, e.g., the output of triangle_fingerprint.
+    """
+    def __init__(
+            self,
+            db_path: str,
+            view_id: int,
+            data_hash: str
+    ):
+
+        self.db_path = db_path
+        self.view_id = view_id
+        self.data_hash = data_hash
+        self.hits = 0
+        self.misses = 0
+
+        # Results read from or written to the database, by stored key. None until the first lookup.
+        self._results = None
+
+    @classmethod
+    def from_triangle(
+            cls,
+            db_path: str,
+            view_id: int,
+            triangle: Triangle
+    ) -> ViewResultCache:
+        """
+        Creates the cache for a view from the triangle built from its data.
+        """
+
+        return cls(
+            db_path=db_path,
+            view_id=view_id,
+            data_hash=triangle_fingerprint(triangle)
+        )
+
+    def stored_key(
+            self,
+            key: Hashable
+    ) -> str:
+        """
+        Combines the hash of the view's data with the caller's key into the key under which the result is stored.
+        """
+
+        return hashlib.sha1((self.data_hash + repr(key)).encode()).hexdigest()
+
+    def load(self) -> None:
+        """
+        Reads the stored results of the view calculated from its current data, and deletes any others.
+        """
+
+        with session_scope(db_path=self.db_path) as session:
+
+            session.query(ProjectViewResult).filter(
+                ProjectViewResult.view_id == self.view_id,
+                ProjectViewResult.data_hash != self.data_hash
+            ).delete(synchronize_session=False)
+
+            session.commit()
+
+            records = session.query(
+                ProjectViewResult.key,
+                ProjectViewResult.data
+            ).filter(
+                ProjectViewResult.view_id == self.view_id
+            ).all()
+
+        self._results = {record.key: unpack_arrays(record.data) for record in records}
+
+    def get(
+            self,
+            key: Hashable,
+            compute: Callable[[], dict]
+    ) -> dict:
+        """
+        Returns the result stored under key, calling compute to calculate and store it if there isn't one.
+        """
+
+        if self._results is None:
+            self.load()
+
+        stored_key = self.stored_key(key)
+
+        if stored_key in self._results:
+            self.hits += 1
+            return self._results[stored_key]
+
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+
+        return result
+
+    def put(
+            self,
+            key: Hashable,
+            result: dict
+    ) -> None:
+
+        if self._results is None:
+            self.load()
+
+        stored_key = self.stored_key(key)
+
+        with session_scope(db_path=self.db_path) as session:
+            session.merge(
+                ProjectViewResult(
+                    view_id=self.view_id,
+                    key=stored_key,
+                    data_hash=self.data_hash,
+                    data=pack_arrays(result)
+                )
+            )
+            session.commit()
+
+        self._results[stored_key] = result
+
+
+def cached_result(
+        results: ViewResultCache | None,
+        key: Hashable,
+        compute: Callable[[], dict]
+) -> dict:
+    """
+    Looks the result up in results if a cache is supplied, and otherwise just calculates it.
+    """
+
+    if results is None:
+        return compute()
+
+    return results.get(
+        key=key,
+        compute=compute
+    )
@@ -1,3 +1,5 @@
+import sqlalchemy as sa
+
 from datetime import datetime
 from sqlalchemy.orm import declarative_base
 from sqlalchemy import (
@@ -7,9 +9,13 @@ from sqlalchemy import (
     DateTime,
     Integer,
     ForeignKey,
+    Index,
+    LargeBinary,
     String,
 )
 
+from sqlalchemy.engine.base import Connection
+
 from sqlalchemy.orm import (
     relationship
 )
@@ -65,7 +71,8 @@ class CountryTable(Base):
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     location_id = Column(
@@ -73,10 +80,14 @@ class CountryTable(Base):
         ForeignKey(
             'location.location_id',
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
-    country_name = Column(String)
+    country_name = Column(
+        String,
+        index=True
+    )
 
     location = relationship(
         "LocationTable",
@@ -112,6 +123,11 @@ class CountryTable(Base):
 class StateTable(Base):
     __tablename__ = 'state'
 
+    # Looks up the states of a country, optionally by name.
+    __table_args__ = (
+        Index('ix_state_country_id_state_name', 'country_id', 'state_name'),
+    )
+
     state_id = Column(
         Integer,
         primary_key=True
@@ -122,7 +138,8 @@ class StateTable(Base):
         ForeignKey(
             "location.location_id",
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
     country_id = Column(
@@ -135,7 +152,8 @@ class StateTable(Base):
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     state_name = Column(String)
@@ -188,12 +206,14 @@ class LOBTable(Base):
         ForeignKey(
             'location.location_id',
             ondelete="CASCADE"
-        )
+        ),
+        index=True
     )
 
     project_id = Column(
         String,
-        ForeignKey('project.project_id')
+        ForeignKey('project.project_id'),
+        index=True
     )
 
     location = relationship(
@@ -345,7 +365,8 @@ class ProjectViewTable(Base):
 
     project_id = Column(
         String,
-        ForeignKey("project.project_id")
+        ForeignKey("project.project_id"),
+        index=True
     )
 
     project = relationship(
@@ -379,7 +400,8 @@ class ProjectViewData(Base):
 
     view_id = Column(
         Integer,
-        ForeignKey('project_view.view_id')
+        ForeignKey('project_view.view_id'),
+        index=True
     )
 
     accident_year = Column(
@@ -403,6 +425,59 @@ class ProjectViewData(Base):
     )
 
 
+class ProjectViewBlob(Base):
+    """
+    Holds the data of a project view saved in columnar storage, as a compressed blob of column arrays written by
+    faslr.utilities.storage.pack_frame. The names of the origin, development and value columns are kept in
+    ProjectViewTable.
+    """
+    __tablename__ = 'project_view_blob'
+
+    view_id = Column(
+        Integer,
+        ForeignKey('project_view.view_id'),
+        primary_key=True
+    )
+
+    data = Column(
+        LargeBinary
+    )
+
+
+class ProjectViewResult(Base):
+    """
+    Holds results calculated from the data of a project view, such as diagnostics, so that they don't have to be
+    recalculated each time the view is opened. Each result is a compressed blob of NumPy arrays, stored under a key
+    made from a hash of the view's data and the parameters of the calculation. The results of a view are deleted by
+    the triggers in RESULT_TRIGGERS whenever its data change.
+    """
+    __tablename__ = 'project_view_result'
+
+    view_id = Column(
+        Integer,
+        ForeignKey('project_view.view_id'),
+        primary_key=True
+    )
+
+    key = Column(
+        String,
+        primary_key=True
+    )
+
+    data_hash = Column(
+        String
+    )
+
+    created = Column(
+        DateTime,
+        default=datetime.now
+    )
+
+    data = Column(
+        LargeBinary
+    )
+
+
 class IndexTable(Base):
     __tablename__ = 'index'
 
@@ -450,6 +525,11 @@ class IndexTable(Base):
 class IndexValuesTable(Base):
     __tablename__ = 'index_values'
 
+    # Fetches the values of an index in order of year.
+    __table_args__ = (
+        Index('ix_index_values_index_id_year', 'index_id', 'year'),
+    )
+
     value_id = Column(
         Integer,
         primary_key=True
@@ -478,3 +558,104 @@ class IndexValuesTable(Base):
                    self.year,
                    self.change
                )
+
+
+class IndexValuesBlob(Base):
+    """
+    Holds the changes of an index saved in compact storage, as a compressed blob of arrays written by
+    faslr.utilities.storage.pack_arrays, rather than one IndexValuesTable row per change. The periods of the index
+    are consecutive at the given grain, starting from start, e.g., '1975-01' for a monthly index.
+    """
+    __tablename__ = 'index_values_blob'
+
+    index_id = Column(
+        Integer,
+        ForeignKey('index.index_id'),
+        primary_key=True
+    )
+
+    grain = Column(
+        String
+    )
+
+    start = Column(
+        String
+    )
+
+    data = Column(
+        LargeBinary
+    )
+
+
+def create_missing_indexes(connection: Connection) -> list:
+    """
+    Brings the indexes of a database created by an earlier version of FASLR up to date by creating the indexes
+    declared in this module that it does not have yet. Tables that do not exist are left alone.
+
+    Parameters
+    ----------
+    connection: Connection
+        A connection to the database.
+
+    Returns
+    -------
+    The names of the indexes that were created.
+    """
+
+    inspector = sa.inspect(connection)
+    existing_tables = set(inspector.get_table_names())
+
+    created = []
+    for table in Base.metadata.sorted_tables:
+
+        if table.name not in existing_tables:
+            continue
+
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+
+        for index in sorted(table.indexes, key=lambda x: x.name):
+            if index.name not in existing_indexes:
+                index.create(bind=connection)
+                created += [index.name]
+
+    return created
+
+
+# Delete the stored results of a view when its data are changed or removed, or when the view itself is about to be
+# deleted. Being triggers, they also catch changes made outside the ORM. Rows inserted into project_view_data are left
+# out, since a trigger run for every row slows down imports considerably. Results calculated before rows were added
+# to a view are still never used, because the rows change the hash of the view's data that the results are keyed on.
+RESULT_TRIGGER_EVENTS = [
+    ('project_view_data', 'AFTER UPDATE', 'OLD'),
+    ('project_view_data', 'AFTER DELETE', 'OLD'),
+    ('project_view_blob', 'AFTER INSERT', 'NEW'),
+    ('project_view_blob', 'AFTER UPDATE', 'OLD'),
+    ('project_view_blob', 'AFTER DELETE', 'OLD'),
+    ('project_view', 'BEFORE DELETE', 'OLD')
+]
+
+RESULT_TRIGGERS = {
+    'trg_{0}_{1}_result'.format(table, event.split()[1].lower()): """
+        CREATE TRIGGER IF NOT EXISTS trg_{0}_{1}_result {2} ON {0}
+        BEGIN
+            DELETE FROM project_view_result WHERE view_id = {3}.view_id;
+        END
+    """.format(table, event.split()[1].lower(), event, row)
+    for table, event, row in RESULT_TRIGGER_EVENTS
+}
+
+
+@sa.event.listens_for(Base.metadata, 'after_create')
+def create_result_triggers(
+        target,
+        connection: Connection,
+        **kw
+) -> None:
+    """
+    Creates the triggers in RESULT_TRIGGERS, after the tables they are defined on. Since create_all fires this even
+    when the tables already exist, databases created by earlier versions get the triggers the next time they are
+    opened.
+    """
+
+    for statement in RESULT_TRIGGERS.values():
+        connection.exec_driver_sql(statement)
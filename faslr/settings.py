@@ -8,8 +8,18 @@ import configparser
 import logging
 import os
 
+import faslr.core as core
+
+from faslr.connection import (
+    dispose_engines,
+    set_journal_mode
+)
+
 from faslr.constants import (
     CONFIG_PATH,
+    DB_JOURNAL_MODES,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_PROFILES,
     DEFAULT_DIALOG_PATH,
     QT_FILEPATH_OPTION,
     SETTINGS_LIST
@@ -133,17 +143,23 @@ class SettingsDialog(QDialog):
         self.startup_unconnected_container = QWidget()
         self.user_container = QWidget()
         self.plot_container = QWidget()
+        self.database_container = QWidget()
+
+        self.pragma_profile_buttons = {}
+        self.journal_mode_label = QLabel()
 
         self.startup_unconnected_layout()
         self.startup_connected_layout()
         self.user_layout()
         self.plot_layout()
+        self.database_layout()
 
         for widget in [
             self.startup_connected_container,
             self.startup_unconnected_container,
             self.user_container,
-            self.plot_container
+            self.plot_container,
+            self.database_container
         ]:
 
             self.configuration_layout.addWidget(widget)
@@ -184,6 +200,8 @@ class SettingsDialog(QDialog):
             self.configuration_layout.setCurrentIndex(2)
         elif index.data() == "Plots":
             self.configuration_layout.setCurrentIndex(3)
+        elif index.data() == "Database":
+            self.configuration_layout.setCurrentIndex(4)
 
     def startup_unconnected_layout(self) -> None:
         """
@@ -253,6 +271,82 @@ class SettingsDialog(QDialog):
 
         self.plot_container.setLayout(layout)
 
+    def database_layout(self) -> None:
+        """
+        Layout used to choose the PRAGMA profile applied to database connections, listing the PRAGMAs of each.
+        """
+
+        layout = QVBoxLayout()
+        button_layout = QVBoxLayout()
+
+        self.pragma_profile_group = QButtonGroup()
+        pragma_groupbox = QGroupBox("Connection Profile")
+
+        layout.addWidget(pragma_groupbox)
+        pragma_groupbox.setLayout(button_layout)
+        layout.addStretch()
+
+        current_profile = self.config.get('DATABASE', 'pragma_profile', fallback=DB_PRAGMA_PROFILE)
+
+        for name, pragmas in DB_PRAGMA_PROFILES.items():
+
+            button = QRadioButton(name)
+            button.setToolTip(
+                "\n".join(
+                    "{0} = {1}".format(pragma, value)
+                    for pragma, value in {'journal_mode': DB_JOURNAL_MODES[name], **pragmas}.items()
+                )
+            )
+            button.setChecked(name == current_profile)
+
+            # noinspection PyUnresolvedReferences
+            button.clicked.connect(
+                lambda checked=False, profile=name: self.set_pragma_profile(name=profile)
+            )
+
+            self.pragma_profile_group.addButton(button)
+            self.pragma_profile_buttons[name] = button
+            button_layout.addWidget(button)
+
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        self.journal_mode_label.setWordWrap(True)
+        layout.insertWidget(1, self.journal_mode_label)
+
+        self.database_container.setLayout(layout)
+
+    def set_pragma_profile(
+            self,
+            name: str
+    ) -> None:
+        """
+        Saves the PRAGMA profile to the configuration file, and closes the idle pooled connections so that new
+        connections use it. Also changes the journal mode of the open database, if any, letting the user know if it
+        is in use elsewhere and the journal mode could not be changed.
+        """
+
+        if not self.config.has_section('DATABASE'):
+            self.config.add_section('DATABASE')
+
+        self.config['DATABASE']['pragma_profile'] = name
+        with open(self.config_path, 'w') as configfile:
+            self.config.write(configfile)
+
+        core.set_pragma_profile(name)
+        dispose_engines()
+
+        self.journal_mode_label.clear()
+
+        if core.db is None or not os.path.isfile(core.db):
+            return
+
+        journal_mode = DB_JOURNAL_MODES[name]
+
+        if set_journal_mode(db_path=core.db) != journal_mode.lower():
+            self.journal_mode_label.setText(
+                "The database is in use by another window or process, so its journal mode could not be changed to "
+                + journal_mode + ". It will be changed the next time the database is opened."
+            )
 
     def reset_connection(self) -> None:
         """
@@ -2,6 +2,13 @@ import os
 import pytest
 import shutil
 
+from contextlib import contextmanager
+
+from faslr.connection import (
+    dispose_engine,
+    get_engine
+)
+
 from faslr.constants import (
     CONFIG_TEMPLATES_PATH,
     DEFAULT_DIALOG_PATH
@@ -9,6 +16,13 @@ from faslr.constants import (
 
 from pathlib import Path
 
+from sqlalchemy import event
+
+from typing import (
+    Callable,
+    Iterator
+)
+
 
 @pytest.fixture()
 def setup_config(tmp_path: Path) -> str:
@@ -43,4 +57,33 @@ def sample_db() -> str:
     shutil.copy(db_filename, test_db_filename)
     yield test_db_filename
 
+    dispose_engine(db_path=test_db_filename)
     os.remove(test_db_filename)
+
+
+@pytest.fixture()
+def recorded_statements() -> Callable:
+    """
+    Records the SQL statements sent to a database, e.g., to count the queries made by a model.
+
+    :return: A context manager that takes the path to the database and yields the list of statements sent to it
+        within its block.
+    """
+
+    @contextmanager
+    def record(db_path: str) -> Iterator[list]:
+
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany) -> None: # noqa
+            statements.append(statement)
+
+        engine = get_engine(db_path=db_path)
+        event.listen(engine, 'before_cursor_execute', record_statement)
+
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', record_statement)
+
+    return record
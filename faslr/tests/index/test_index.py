@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import chainladder as cl
+import numpy as np
 import pandas as pd
 import pytest
 
 import faslr.core as core
+
 from faslr.index import (
     calculate_index_factors,
+    FIndex,
     IndexInventory
 )
 
@@ -35,7 +38,10 @@ from PyQt6.QtWidgets import QApplication
 
 from pytestqt.qtbot import QtBot
 
-from typing import TYPE_CHECKING
+from typing import (
+    Callable,
+    TYPE_CHECKING
+)
 
 if TYPE_CHECKING:
     from pandas import DataFrame
@@ -157,6 +163,173 @@ def test_index_inventory(
     index_inventory.add_indexes()
 
 
+def test_load_many(
+        f_core,
+        recorded_statements: Callable
+) -> None:
+    """
+    Indexes loaded together should match those loaded one at a time, using two queries however many are loaded.
+    """
+
+    with recorded_statements(db_path=core.db) as statements:
+        findexes = FIndex.load_many(db=core.db)
+
+    assert len(statements) == 2
+    assert [x.id for x in findexes] == sorted(x.id for x in findexes)
+
+    for findex in findexes:
+        expectation = FIndex(from_id=findex.id, db=core.db)
+
+        assert findex.name == expectation.name
+        assert findex.description == expectation.description
+        np.testing.assert_array_equal(findex.origin, expectation.origin)
+        np.testing.assert_array_equal(findex.changes, expectation.changes)
+
+    # Requested ids come back in the order requested, and missing ids are skipped.
+    ids = [findexes[-1].id, 99999, findexes[0].id]
+
+    assert [x.id for x in FIndex.load_many(ids=ids, db=core.db)] == [findexes[-1].id, findexes[0].id]
+    assert FIndex.load_many(ids=[], db=core.db) == []
+
+
+def test_index_matrix() -> None:
+    """
+    Each entry of the matrix should be the product of 1 + change over the years between the row year and the column
+    year, inverted when bringing a year back to an earlier one.
+    """
+
+    findex = FIndex(
+        origin=tort_index['Origin'],
+        changes=tort_index['Change'],
+        name=tort_index['Name'][0],
+        description=tort_index['Description'][0]
+    )
+
+    growth = [1 + x for x in findex.changes]
+    n_years = len(findex.origin)
+
+    expectation = np.ones((n_years, n_years))
+    for i in range(n_years):
+        for j in range(n_years):
+            if j > i:
+                expectation[i, j] = np.prod(growth[i + 1:j + 1])
+            elif j < i:
+                expectation[i, j] = 1 / np.prod(growth[j + 1:i + 1])
+
+    matrix = findex.matrix
+
+    np.testing.assert_allclose(matrix.to_numpy(), expectation)
+    assert list(matrix.index) == list(findex.origin)
+    assert list(matrix.columns) == [str(x) for x in findex.origin]
+
+    # The last column brings each year to the latest one.
+    np.testing.assert_allclose(findex.factors, expectation[:, -1])
+
+    values = np.arange(1, n_years + 1)
+
+    np.testing.assert_allclose(findex.apply_matrix(values=list(values)).to_numpy(), expectation * values[:, None])
+
+
+def test_derived_values() -> None:
+    """
+    Derived values should be calculated once and kept until the origin or changes are replaced, and the arrays
+    they are calculated from should not be writable.
+    """
+
+    findex = FIndex(
+        origin=tort_index['Origin'],
+        changes=tort_index['Change'],
+        name=tort_index['Name'][0],
+        description=tort_index['Description'][0]
+    )
+
+    assert findex.matrix_values is findex.matrix_values
+
+    # Changes made to a returned frame don't reach the kept one.
+    matrix = findex.matrix
+    matrix.iloc[0, 0] = 100
+
+    assert findex.matrix.iloc[0, 0] == 1
+
+    with pytest.raises(ValueError):
+        findex.changes[0] = 0.5
+
+    content_hash = findex.content_hash
+
+    same = FIndex(
+        origin=list(findex.origin),
+        changes=list(findex.changes),
+        name='Copy',
+        description='Same years and changes.'
+    )
+
+    assert same.content_hash == content_hash
+
+    findex.changes = [0.1] * len(findex.origin)
+
+    assert findex.content_hash != content_hash
+    np.testing.assert_allclose(findex.factors, [1.1 ** x for x in range(len(findex.origin) - 1, -1, -1)])
+
+
+def test_index_grain(f_core) -> None:
+    """
+    A monthly index should survive a round trip through the database, and aggregating it to years should match the
+    average, or exposure-weighted average, of its monthly levels.
+    """
+
+    rng = np.random.default_rng(0)
+    periods = pd.period_range('2015-01', periods=36, freq='M')
+
+    findex = FIndex(
+        origin=periods,
+        changes=rng.uniform(-0.01, 0.02, len(periods)),
+        name='Monthly CPI',
+        description='Monthly changes.'
+    )
+
+    assert findex.grain == 'M'
+
+    index_id = findex.save(db=core.db)
+
+    for loaded in [FIndex(from_id=index_id, db=core.db), FIndex.load_many(ids=[index_id], db=core.db)[0]]:
+        assert loaded.grain == 'M'
+        assert loaded.content_hash == findex.content_hash
+
+    levels = pd.Series(findex.level_values, index=periods.year)
+    weights = np.arange(1, len(periods) + 1)
+
+    for exposure, expectation in [
+        (None, levels.groupby(level=0).mean()),
+        (weights, (levels * weights).groupby(level=0).sum() / pd.Series(weights, index=periods.year).groupby(level=0).sum())
+    ]:
+        annual = findex.aggregate(grain='Y', weights=exposure)
+
+        assert annual.grain == 'Y'
+        assert list(annual.origin) == [2015, 2016, 2017]
+        np.testing.assert_allclose(annual.level_values, expectation.to_numpy())
+
+    with pytest.raises(ValueError):
+        findex.aggregate(grain='Y').aggregate(grain='Q')
+
+    # Changing the grain converts the origin, and the values derived from it, to the new grain.
+    quarterly = findex.aggregate(grain='Y')
+    assert list(quarterly.periods.astype(str)) == ['2015', '2016', '2017']
+
+    quarterly.grain = 'Q'
+    assert list(quarterly.periods.astype(str)) == ['2015Q1', '2016Q1', '2017Q1']
+    assert list(quarterly.aggregate(grain='Y').origin) == [2015, 2016, 2017]
+
+    # Monthly periods would collapse onto the same years, which is what aggregate is for.
+    with pytest.raises(ValueError):
+        findex.grain = 'Y'
+
+    assert findex.grain == 'M'
+    assert findex.periods.equals(periods)
+
+    with pytest.raises(ValueError):
+        FIndex(origin=periods, changes=findex.changes, name='Weekly', description='', grain='W')
+
+
 def test_calculate_index_factors(
         df_tort_index: DataFrame
 ) -> None:
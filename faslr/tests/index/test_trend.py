@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from faslr.index import (
+    FIndex,
+    TrendEngine
+)
+
+from faslr.utilities.sample import (
+    ppa_loss_trend,
+    ppa_premium_trend,
+    tort_index
+)
+
+origin = ppa_loss_trend['Origin']
+claims = np.linspace(1e6, 2e6, len(origin))
+premium = np.linspace(2e6, 3e6, len(origin))
+
+
+def make_index(sample: dict) -> FIndex:
+
+    return FIndex(
+        origin=sample['Origin'],
+        changes=sample['Change'],
+        name=sample['Name'][0],
+        description=sample['Description'][0]
+    )
+
+
+def test_trend_engine() -> None:
+    """
+    The loss ratios should match those from composing the indexes and dividing the trended claims by the on-level
+    premium, and replacing one side's indexes should leave the other side as it was.
+    """
+
+    loss_indexes = [make_index(ppa_loss_trend), make_index(tort_index)]
+    premium_indexes = [make_index(ppa_premium_trend)]
+
+    engine = TrendEngine(
+        origin=origin,
+        claims=claims,
+        premium=premium,
+        claim_indexes=loss_indexes
+    )
+
+    premium_level = engine.levels['premium']
+    np.testing.assert_array_equal(premium_level, np.ones(len(origin)))
+
+    engine.set_indexes(
+        side='premium',
+        indexes=premium_indexes
+    )
+
+    expectation = loss_indexes[0].compose(loss_indexes[1:]).apply_matrix(values=list(claims)).div(
+        premium_indexes[0].apply_matrix(values=list(premium))
+    )
+
+    pd.testing.assert_frame_equal(engine.loss_ratios(), expectation)
+
+    loss_level = engine.levels['loss']
+
+    engine.set_indexes(
+        side='premium',
+        indexes=[]
+    )
+
+    assert engine.levels['loss'] is loss_level
+
+    with pytest.raises(ValueError):
+        engine.set_indexes(
+            side='exposure',
+            indexes=[]
+        )
+
+    with pytest.raises(ValueError):
+        engine.set_indexes(
+            side='loss',
+            indexes=[FIndex(origin=[2000], changes=[0.1], name='Short', description='Too few years.')]
+        )
+
+
+def test_trend_engine_grain() -> None:
+    """
+    A monthly index applied to accident years should give the same loss ratios as its annual aggregate.
+    """
+
+    periods = pd.period_range(str(origin[0]) + '-01', periods=12 * len(origin), freq='M')
+
+    monthly = FIndex(
+        origin=periods,
+        changes=np.full(len(periods), 0.004),
+        name='Monthly',
+        description='Monthly changes.'
+    )
+
+    engine = TrendEngine(origin=origin, claims=claims, premium=premium, claim_indexes=[monthly])
+    annual = TrendEngine(origin=origin, claims=claims, premium=premium, claim_indexes=[monthly.aggregate(grain='Y')])
+
+    pd.testing.assert_frame_equal(engine.loss_ratios(), annual.loss_ratios())
+
+    short = FIndex(origin=periods[:12], changes=np.zeros(12), name='Short', description='One year only.')
+
+    with pytest.raises(ValueError):
+        TrendEngine(origin=origin, claims=claims, premium=premium, claim_indexes=[short])
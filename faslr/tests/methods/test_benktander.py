@@ -0,0 +1,62 @@
+import chainladder as cl
+import numpy as np
+import pytest
+
+from faslr.methods.benktander_engine import BenktanderEngine
+
+from faslr.utilities import load_sample
+
+
+def test_benktander_engine() -> None:
+    """
+    The closed form should match chainladder's Benktander estimator for reported and paid claims together, match
+    the iterated recursion, and converge to the chain ladder ultimates.
+    """
+
+    triangle = load_sample('uspp_auto_incr_claim')
+    premium = triangle['Reported Claims'].latest_diagonal * 1.5
+    apriori = 0.7
+
+    losses = []
+    cdfs = []
+    expectations = {}
+
+    for column in ['Reported Claims', 'Paid Claims']:
+        development = cl.Development(n_periods=5, average='volume').fit_transform(triangle[column])
+        latest = triangle[column].latest_diagonal.values.ravel()
+
+        losses.append(latest)
+        cdfs.append(cl.Chainladder().fit(development).ultimate_.values.ravel() / latest)
+
+        for iterations in [1, 2, 5]:
+            expectations[column, iterations] = cl.Benktander(
+                apriori=apriori,
+                n_iters=iterations
+            ).fit(development, sample_weight=premium).ultimate_.values.ravel()
+
+    engine = BenktanderEngine(
+        losses=np.array(losses),
+        cdfs=np.array(cdfs),
+        expected=apriori * premium.values.ravel()
+    )
+
+    path = engine.path(iterations=5)
+
+    assert path.shape == (5, 2, len(losses[0]))
+
+    for (column, iterations), expectation in expectations.items():
+        row = ['Reported Claims', 'Paid Claims'].index(column)
+
+        np.testing.assert_allclose(engine.ultimates(iterations=iterations)[row], expectation)
+        np.testing.assert_allclose(path[iterations - 1, row], expectation)
+
+    ultimate = engine.expected
+    for iterations in range(1, 6):
+        ultimate = engine.losses + engine.unreported * ultimate
+
+        np.testing.assert_allclose(path[iterations - 1], ultimate)
+
+    np.testing.assert_allclose(engine.ultimates(iterations=500), engine.chainladder)
+
+    with pytest.raises(ValueError):
+        engine.path(iterations=0)
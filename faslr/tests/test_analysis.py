@@ -33,6 +33,17 @@ def test_analysis(qtbot) -> None:
     auto_tab.value_box.setCurrentText("Diagnostics")
     auto_tab.update_value_type()
 
+    # Switching back to link ratios should reuse the models that were already built.
+    ratio_model = auto_tab.triangle_models.get(
+        key=('Paid Claims', 'ratio'),
+        compute=lambda: None
+    )
+    hits = auto_tab.triangle_models.hits
+    auto_tab.value_box.setCurrentText("Link Ratios")
+
+    assert auto_tab.triangle_views['Paid Claims'].model() is ratio_model
+    assert auto_tab.triangle_models.hits == hits + len(auto_tab.column_list)
+
     auto_tab.resize(
         auto_tab.triangle_views['Paid Claims'].horizontalHeader().length() +
         auto_tab.triangle_views['Paid Claims'].verticalHeader().width(),
@@ -1,8 +1,12 @@
 from faslr.base_table import (
+    changed_blocks,
     FAbstractTableModel,
     FTableView
 )
 
+import numpy as np
+import pandas as pd
+
 from pytestqt.qtbot import QtBot
 
 from PyQt6.QtCore import Qt
@@ -21,6 +25,105 @@ def test_f_abstract_table_model(qtbot: QtBot) -> None:
     assert column_count_test == 0
 
 
+def test_f_abstract_table_model_snapshot(qtbot: QtBot) -> None:
+
+    table_model = FAbstractTableModel()
+    table_model.formatters = {'Ratio': '{0:,.3f}'.format}
+
+    table_model._data = pd.DataFrame( # noqa
+        data={
+            'Value': [1000, 2000],
+            'Ratio': [1.5, 2.25]
+        },
+        index=[2020, 2021]
+    )
+
+    assert table_model.value(1, 0) == 2000
+    assert table_model.column_name(1) == 'Ratio'
+    assert table_model.column_label(0) == 'Value'
+    assert table_model.index_label(1) == '2021'
+    assert table_model.format_value(0, 1) == '1.500'
+    assert table_model.format_value(0, 0) == '1000'
+
+    # In-place changes are picked up once the model signals them.
+    table_model._data.iloc[0, 1] = 3 # noqa
+
+    assert table_model.format_value(0, 1) == '1.500'
+
+    table_model.layoutChanged.emit() # noqa
+
+    assert table_model.format_value(0, 1) == '3.000'
+
+    # Assigning new data replaces the snapshot straight away.
+    table_model._data = pd.DataFrame(data={'Ratio': [4.0]}, index=['Total']) # noqa
+
+    assert table_model.format_value(0, 0) == '4.000'
+    assert table_model.index_label(0) == 'Total'
+
+
+def test_changed_blocks() -> None:
+
+    previous = np.array([
+        [1.0, np.nan, 'a'],
+        [2.0, 3.0, 'b'],
+        [4.0, 5.0, 'c'],
+        [6.0, 7.0, 'd']
+    ], dtype=object)
+
+    current = previous.copy()
+
+    assert changed_blocks(previous=previous, current=current) == []
+
+    current[0, 2] = 'z'
+    current[1, 1] = 8.0
+    current[3, 0] = np.nan
+
+    assert changed_blocks(previous=previous, current=current) == [(0, 1, 1, 2), (3, 0, 3, 0)]
+
+
+def test_f_abstract_table_model_update_data(qtbot: QtBot) -> None:
+
+    table_model = FAbstractTableModel()
+
+    table_model._data = pd.DataFrame( # noqa
+        data={
+            'Value': [1000.0, 2000.0, 3000.0],
+            'Ratio': [1.5, 2.25, np.nan]
+        },
+        index=[2020, 2021, 2022]
+    )
+
+    changes = []
+    layouts = []
+    table_model.dataChanged.connect( # noqa
+        lambda top_left, bottom_right: changes.append(
+            (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+        )
+    )
+    table_model.layoutChanged.connect(lambda: layouts.append(True)) # noqa
+
+    # Only the changed cell is reported when the shape is unchanged.
+    data = table_model._data.copy()
+    data.iloc[1, 1] = 2.5
+    table_model.update_data(data)
+
+    assert changes == [(1, 1, 1, 1)]
+    assert layouts == []
+    assert table_model.value(1, 1) == 2.5
+
+    # Nothing to report when the data are the same.
+    table_model.update_data(data.copy())
+
+    assert changes == [(1, 1, 1, 1)]
+
+    # Adding a row changes the layout.
+    table_model.update_data(pd.concat([data, pd.DataFrame({'Value': [1.0], 'Ratio': [1.0]}, index=[2023])]))
+
+    assert changes == [(1, 1, 1, 1)]
+    assert layouts == [True]
+    assert table_model.rowCount() == 4
+
+
 # def test_f_table_view_horizontal(qtbot: QtBot) -> None:
 #
 #     table_view = FTableView()
@@ -1,22 +1,39 @@
+import configparser
 import os
 import pytest
 
 from faslr.connection import (
     ConnectionDialog,
     FaslrConnection,
-    connect_db
+    connect_db,
+    dispose_engine,
+    dispose_engines,
+    get_engine,
+    session_scope,
+    set_journal_mode
 )
 
 from faslr.constants import (
     DB_NOT_FOUND_TEXT,
+    DB_JOURNAL_MODES,
+    DB_POOL_SIZE,
+    DB_PRAGMA_PROFILE,
+    DB_PRAGMA_PROFILES
 )
 
-from faslr.core import get_startup_db_path
+import faslr.core as core
+
+from faslr.core import (
+    get_pragma_profile,
+    get_startup_db_path
+)
 
 from faslr.constants import DEFAULT_DIALOG_PATH
 
 from faslr.__main__ import MainWindow
 
+from faslr.schema import CountryTable
+
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm.session import Session
@@ -305,3 +322,128 @@ def test_get_startup_db_path(
     startup_db = get_startup_db_path(config_path=setup_config)
 
     assert startup_db == 'None'
+
+
+def test_get_engine(sample_db: str) -> None:
+    """
+    The same engine should be shared by every connection to a database, with connections returned to its pool once
+    the sessions using them are closed.
+    """
+
+    engine = get_engine(db_path=sample_db)
+
+    assert get_engine(db_path=sample_db) is engine
+    assert not engine.echo
+    assert engine.pool.size() == DB_POOL_SIZE
+
+    with FaslrConnection(db_path=sample_db) as faslr_connection:
+        assert faslr_connection.engine is engine
+        faslr_connection.connection.exec_driver_sql("SELECT 1")
+        assert engine.pool.checkedout() == 1
+
+    assert engine.pool.checkedout() == 0
+
+    with session_scope(db_path=sample_db) as session:
+        assert session.query(CountryTable).count() > 0
+        assert engine.pool.checkedout() == 1
+
+    assert engine.pool.checkedout() == 0
+
+    # Connections are also returned when the work done in the session fails.
+    with pytest.raises(ZeroDivisionError):
+        with session_scope(db_path=sample_db) as session:
+            session.query(CountryTable).count()
+            1 / 0 # noqa
+
+    assert engine.pool.checkedout() == 0
+
+    dispose_engine(db_path=sample_db)
+
+    assert get_engine(db_path=sample_db) is not engine
+
+
+@pytest.mark.parametrize('profile', list(DB_PRAGMA_PROFILES))
+def test_pragma_profile(
+        sample_db: str,
+        profile: str,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Every connection made by the engine should have the PRAGMAs of the selected profile, and the database its journal
+    mode.
+    """
+
+    monkeypatch.setattr(core, 'pragma_profile', profile)
+    dispose_engines()
+
+    assert set_journal_mode(db_path=sample_db) == DB_JOURNAL_MODES[profile].lower()
+
+    with get_engine(db_path=sample_db).connect() as connection:
+        journal_mode = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+        foreign_keys = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+
+    assert journal_mode == DB_JOURNAL_MODES[profile].lower()
+    assert synchronous == {'NORMAL': 1, 'FULL': 2}[DB_PRAGMA_PROFILES[profile]['synchronous']]
+    assert foreign_keys == 1
+
+    if profile == 'Concurrent':
+
+        # Readers can still read while a write is in progress.
+        with get_engine(db_path=sample_db).connect() as writer, \
+                get_engine(db_path=sample_db).connect() as reader:
+            writer.exec_driver_sql("UPDATE country SET country_name = country_name")
+            assert reader.exec_driver_sql("SELECT COUNT(*) FROM country").scalar() > 0
+            writer.rollback()
+
+    dispose_engine(db_path=sample_db)
+
+
+def test_pragma_profile_in_use(
+        sample_db: str,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Switching from the 'Concurrent' to the 'Default' profile while a connection is checked out should keep the
+    database in WAL mode, rather than locking out new connections, until the database is no longer in use.
+    """
+
+    monkeypatch.setattr(core, 'pragma_profile', 'Concurrent')
+    dispose_engines()
+
+    assert set_journal_mode(db_path=sample_db) == 'wal'
+
+    connection = get_engine(db_path=sample_db).connect()
+    connection.exec_driver_sql("SELECT COUNT(*) FROM country").scalar()
+
+    monkeypatch.setattr(core, 'pragma_profile', 'Default')
+    dispose_engines()
+
+    assert set_journal_mode(db_path=sample_db) == 'wal'
+
+    with get_engine(db_path=sample_db).connect() as other:
+        assert other.exec_driver_sql("SELECT COUNT(*) FROM country").scalar() > 0
+        assert other.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+        assert other.exec_driver_sql("PRAGMA busy_timeout").scalar() == DB_PRAGMA_PROFILES['Default']['busy_timeout']
+
+    connection.invalidate()
+    connection.close()
+    dispose_engines()
+
+    assert set_journal_mode(db_path=sample_db) == 'delete'
+
+    dispose_engine(db_path=sample_db)
+
+
+def test_get_pragma_profile(setup_config: str) -> None:
+
+    assert get_pragma_profile(config_path=setup_config) == 'Concurrent'
+
+    # Config files written before the setting existed fall back to the default profile.
+    config = configparser.ConfigParser()
+    config.read(setup_config)
+    config.remove_section('DATABASE')
+    with open(setup_config, 'w') as configfile:
+        config.write(configfile)
+
+    assert get_pragma_profile(config_path=setup_config) == DB_PRAGMA_PROFILE
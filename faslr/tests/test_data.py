@@ -1,30 +1,57 @@
+import numpy as np
+import pandas as pd
 import pytest
 
+from chainladder import Triangle
+
+from faslr import schema
+
 from faslr.__main__ import (
     MainWindow
 )
 
+from faslr.connection import get_engine
+
+from faslr.constants import (
+    IMPORT_STAGES,
+    SAMPLE_DIALOG_PATH
+)
+
 import faslr.core as core
 from faslr.data import (
     DataPane,
-    DataImportWizard
+    DataImportWizard,
+    import_view,
+    load_view_triangle
 )
 
+from faslr.schema import (
+    ProjectViewBlob,
+    ProjectViewTable
+)
+
+from faslr.utilities.importing import ImportCancelled
+
+from faslr.utilities.storage import pack_frame
+
 from pynput.keyboard import (
     Key,
     Controller
 )
 
 from PyQt6.QtCore import (
+    QModelIndex,
     Qt,
     QTimer,
     QPoint
 )
 
-from PyQt6.QtWidgets import QApplication, QTabWidget
+from PyQt6.QtWidgets import QApplication, QMessageBox, QTabWidget
 
 from pytestqt.qtbot import QtBot
 
+from typing import Callable
+
 
 @pytest.fixture()
 def f_core(
@@ -405,3 +432,362 @@ def test_data_view_w_model(
     data_pane.data_view.customContextMenuRequested.emit(position)
 
     data_pane.data_view.doubleClicked.emit(idx)
+
+
+def test_load_view_triangle(sample_db: str) -> None:
+    """
+    A view saved in columnar storage should load the triangle it was saved from, with any number of value columns.
+    Views saved as rows should still load.
+    """
+
+    frame = pd.read_csv(SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv')
+    frame['Case Outstanding'] = frame['Reported Claims'] - frame['Paid Claims']
+
+    columns = ['Paid Claims', 'Reported Claims', 'Case Outstanding']
+
+    triangle = Triangle(
+        data=frame,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=columns,
+        cumulative=True
+    )
+
+    with get_engine(db_path=sample_db).begin() as connection:
+
+        schema.Base.metadata.create_all(connection)
+
+        view_id = connection.execute(
+            ProjectViewTable.__table__.insert().values(
+                name='Columnar',
+                origin='Accident Year',
+                development='Calendar Year',
+                columns=';'.join(columns),
+                cumulative=True
+            )
+        ).inserted_primary_key[0]
+
+        connection.execute(
+            ProjectViewBlob.__table__.insert().values(
+                view_id=view_id,
+                data=pack_frame(frame=frame)
+            )
+        )
+
+    loaded = load_view_triangle(
+        db_path=sample_db,
+        view_id=view_id
+    )
+
+    assert list(loaded.columns) == columns
+    np.testing.assert_allclose(
+        np.nan_to_num(loaded.values),
+        np.nan_to_num(triangle.values)
+    )
+
+    rows = load_view_triangle(
+        db_path=sample_db,
+        view_id=1
+    )
+
+    assert list(rows.columns) == ['Paid Loss', 'Reported Loss']
+
+
+def test_wizard_preview(
+        qtbot: QtBot,
+        f_core
+) -> None:
+    """
+    The wizard should only read a sample of the file up front, and should only rebuild the preview triangle when
+    the arguments change. The triangle is built on the thread pool.
+    """
+
+    wizard = DataImportWizard()
+    qtbot.addWidget(wizard)
+
+    file_path = SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv'
+    wizard.args_tab.open_file(filename=file_path)
+
+    assert wizard.args_tab.aggregate is None
+    assert wizard.args_tab.dropdowns['origin'].currentText() == 'Accident Year'
+
+    wizard.tab_container.setCurrentIndex(1)
+
+    qtbot.waitUntil(lambda: wizard.preview_tab.analysis_tab is not None, timeout=10000)
+
+    analysis_tab = wizard.preview_tab.analysis_tab
+    aggregate = wizard.args_tab.aggregate
+
+    assert analysis_tab is not None
+    assert len(aggregate) == len(pd.read_csv(file_path).drop_duplicates(['Accident Year', 'Calendar Year']))
+
+    # Switching back and forth keeps the preview.
+    wizard.tab_container.setCurrentIndex(0)
+    wizard.tab_container.setCurrentIndex(1)
+
+    assert wizard.preview_tab.analysis_tab is analysis_tab
+
+    # Changing the measure rebuilds the triangle from the same aggregated data.
+    wizard.tab_container.setCurrentIndex(0)
+    wizard.args_tab.incremental_btn.setChecked(True)
+    wizard.tab_container.setCurrentIndex(1)
+
+    qtbot.waitUntil(lambda: wizard.preview_tab.analysis_tab not in [None, analysis_tab], timeout=10000)
+
+    assert wizard.args_tab.aggregate is aggregate
+    assert wizard.preview_tab.cumulative is False
+
+
+def test_wizard_preview_error(
+        qtbot: QtBot,
+        f_core,
+        tmp_path
+) -> None:
+    """
+    A file that can't be aggregated should leave a message in the preview tab rather than raise.
+    """
+
+    file_path = tmp_path / 'text_values.csv'
+    pd.DataFrame(
+        {
+            'Accident Year': [2000, 2000, 2001],
+            'Calendar Year': [2000, 2001, 2001],
+            'Paid Claims': [1, 'unknown', 3]
+        }
+    ).to_csv(file_path, index=False)
+
+    wizard = DataImportWizard()
+    qtbot.addWidget(wizard)
+
+    wizard.args_tab.open_file(filename=str(file_path))
+    wizard.tab_container.setCurrentIndex(1)
+
+    preview_tab = wizard.preview_tab
+
+    qtbot.waitUntil(lambda: not preview_tab.preview_workers, timeout=10000)
+
+    assert preview_tab.analysis_tab is None
+    assert preview_tab.status_label.text().startswith("Could not build the triangle from the file")
+    assert wizard.args_tab.aggregate is None
+
+
+def count_views(db_path: str) -> tuple:
+
+    with get_engine(db_path=db_path).connect() as connection:
+        return tuple(
+            connection.exec_driver_sql("SELECT COUNT(*) FROM " + table).scalar()
+            for table in ['project_view', 'project_view_data', 'project_view_blob']
+        )
+
+
+@pytest.mark.parametrize('storage', ['columnar', 'rows'])
+def test_import_view(
+        sample_db: str,
+        storage: str
+) -> None:
+    """
+    An import should go through its stages in order, and a cancelled import should leave nothing behind, even
+    when it is cancelled after the rows have been written.
+    """
+
+    with get_engine(db_path=sample_db).begin() as connection:
+        schema.Base.metadata.create_all(connection)
+
+    arguments = dict(
+        db_path=sample_db,
+        file_path=SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv',
+        name='Auto',
+        description='Auto Steady State',
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Claims', 'Reported Claims'],
+        cumulative=True,
+        storage=storage
+    )
+
+    before = count_views(db_path=sample_db)
+
+    stages = []
+
+    def cancel_after_write() -> bool:
+        return stages[-1] == ('write', 0)
+
+    with pytest.raises(ImportCancelled):
+        import_view(
+            progress=lambda stage, fraction: stages.append((stage, fraction)),
+            cancelled=cancel_after_write,
+            **arguments
+        )
+
+    assert count_views(db_path=sample_db) == before
+
+    stages = []
+
+    result = import_view(
+        progress=lambda stage, fraction: stages.append((stage, fraction)),
+        **arguments
+    )
+
+    assert list(dict.fromkeys(stage for stage, fraction in stages)) == list(IMPORT_STAGES)
+    assert stages[-1] == ('write', 1)
+
+    loaded = load_view_triangle(
+        db_path=sample_db,
+        view_id=result['view_id']
+    )
+
+    np.testing.assert_allclose(
+        np.nan_to_num(loaded.values),
+        np.nan_to_num(result['triangle'].values)
+    )
+
+
+def test_start_import(
+        qtbot: QtBot,
+        f_core
+) -> None:
+    """
+    Imports run on the thread pool, and add the new view to the data view table when they finish.
+    """
+
+    with get_engine(db_path=core.db).begin() as connection:
+        schema.Base.metadata.create_all(connection)
+
+    data_pane = DataPane()
+    qtbot.addWidget(data_pane)
+
+    n_views = data_pane.data_model.rowCount()
+
+    arguments = dict(
+        file_path=SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv',
+        name='Auto',
+        description='Auto Steady State',
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Claims', 'Reported Claims'],
+        cumulative=True
+    )
+
+    worker = data_pane.start_import(**arguments)
+
+    with qtbot.waitSignal(worker.signals.finished, timeout=10000):
+        pass
+
+    assert data_pane.data_model.rowCount() == n_views + 1
+    assert data_pane.data_model.index(n_views, 1).data() == 'Auto'
+    assert not data_pane.import_workers and not data_pane.import_dialogs
+
+    # A cancelled import adds nothing.
+    worker = data_pane.start_import(**arguments)
+    worker.cancel()
+
+    with qtbot.waitSignal(worker.signals.cancelled, timeout=10000):
+        pass
+
+    assert data_pane.data_model.rowCount() == n_views + 1
+    assert count_views(db_path=core.db)[0] == n_views + 1
+
+
+def test_start_import_error(
+        qtbot: QtBot,
+        f_core,
+        tmp_path,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A failed import should tell the user why, since the wizard has already closed, and add nothing.
+    """
+
+    messages = []
+
+    monkeypatch.setattr(
+        QMessageBox,
+        'critical',
+        lambda parent, title, text: messages.append((parent, title, text))
+    )
+
+    file_path = tmp_path / 'text_values.csv'
+    pd.DataFrame(
+        {
+            'Accident Year': [2000, 2000, 2001],
+            'Calendar Year': [2000, 2001, 2001],
+            'Paid Claims': [1, 'unknown', 3]
+        }
+    ).to_csv(file_path, index=False)
+
+    with get_engine(db_path=core.db).begin() as connection:
+        schema.Base.metadata.create_all(connection)
+
+    data_pane = DataPane()
+    qtbot.addWidget(data_pane)
+
+    n_views = data_pane.data_model.rowCount()
+
+    worker = data_pane.start_import(
+        file_path=str(file_path),
+        name='Text',
+        description='Text in a value column',
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=['Paid Claims'],
+        cumulative=True
+    )
+
+    with qtbot.waitSignal(worker.signals.error, timeout=10000):
+        pass
+
+    assert len(messages) == 1
+
+    parent, title, text = messages[0]
+
+    assert parent is data_pane
+    assert title == "Import Failed"
+    assert "unknown" in text
+    assert data_pane.data_model.rowCount() == n_views
+    assert not data_pane.import_workers and not data_pane.import_dialogs
+
+
+def test_project_data_model(
+        qtbot: QtBot,
+        f_core,
+        monkeypatch: pytest.MonkeyPatch,
+        recorded_statements: Callable
+) -> None:
+    """
+    The data pane should only list the views of its own project, reading them a page at a time, and should only
+    read the columns it displays.
+    """
+
+    monkeypatch.setattr('faslr.data.PROJECT_VIEW_PAGE_SIZE', 2)
+
+    with get_engine(db_path=core.db).begin() as connection:
+
+        project_id = connection.exec_driver_sql("SELECT project_id FROM project_view WHERE view_id = 1").scalar()
+
+        for i in range(4):
+            connection.execute(
+                ProjectViewTable.__table__.insert().values(
+                    name='View ' + str(i),
+                    project_id=project_id if i % 2 else None
+                )
+            )
+
+    with recorded_statements(db_path=core.db) as statements:
+        data_pane = DataPane(project_id=project_id)
+        qtbot.addWidget(data_pane)
+
+    data_model = data_pane.data_model
+
+    assert data_model.n_views == 3
+    assert data_model.rowCount() == 2
+    assert not any('origin' in statement for statement in statements)
+
+    assert data_model.canFetchMore(QModelIndex())
+    data_model.fetchMore(QModelIndex())
+
+    assert data_model.rowCount() == 3
+    assert not data_model.canFetchMore(QModelIndex())
+    assert [data_model.index(row, 1).data() for row in range(3)] == ['Auto', 'View 1', 'View 3']
+
+    # Without a project, the views of every project are listed.
+    assert DataPane().data_model.n_views == 5
@@ -1,3 +1,4 @@
+import numpy as np
 import sys
 
 import pytest
@@ -11,6 +12,7 @@ from faslr.style.triangle import (
 )
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import QApplication
+from faslr.utilities import DEVELOPMENT_CACHE
 from faslr.utilities.sample import load_sample
 
 from pynput.keyboard import (
@@ -110,6 +112,176 @@ def test_factor_data(development_tab):
     assert first_back == MAIN_TRIANGLE_COLOR
 
 
+def test_exclude_ratio(development_tab: DevelopmentTab) -> None:
+    """
+    Striking out a link ratio should only update its own column, and should match a full refit of the triangle.
+    """
+
+    factor_model = development_tab.factor_model
+
+    idx = factor_model.index(0, 0)
+
+    factor_model.toggle_exclude(index=idx)
+    factor_model.recalculate_column(column=0)
+
+    assert factor_model.data(
+        index=idx,
+        role=Qt.ItemDataRole.BackgroundRole
+    ) == EXCL_FACTOR_COLOR
+
+    assert factor_model.data(
+        index=idx,
+        role=Qt.ItemDataRole.FontRole
+    ).strikeOut()
+
+    incremental = factor_model.factor_frame.copy()
+
+    factor_model.recalculate_factors()
+
+    assert np.allclose(
+        incremental.to_numpy(dtype=float),
+        factor_model.factor_frame.to_numpy(dtype=float)
+    )
+
+
+def test_factor_cache(development_tab: DevelopmentTab) -> None:
+    """
+    Striking out a link ratio and then restoring it should reuse the averages calculated before.
+    """
+
+    factor_model = development_tab.factor_model
+
+    idx = factor_model.index(1, 2)
+    before = factor_model.factor_frame.copy()
+
+    factor_model.toggle_exclude(index=idx)
+    factor_model.recalculate_column(column=2)
+    factor_model.toggle_exclude(index=idx)
+    factor_model.recalculate_column(column=2)
+
+    hits = DEVELOPMENT_CACHE.hits
+
+    factor_model.toggle_exclude(index=idx)
+    factor_model.recalculate_column(column=2)
+
+    assert DEVELOPMENT_CACHE.hits == hits + 1
+    assert factor_model.factor_frame.iloc[0, 2] != before.iloc[0, 2]
+
+    factor_model.toggle_exclude(index=idx)
+    factor_model.recalculate_column(column=2)
+
+    assert DEVELOPMENT_CACHE.hits == hits + 2
+    assert factor_model.factor_frame.equals(before)
+
+
+def test_recalculate_factors_signals(development_tab: DevelopmentTab) -> None:
+    """
+    Refitting all the factors should only report the cells that changed, without a layout change.
+    """
+
+    factor_model = development_tab.factor_model
+
+    changes = []
+    layouts = []
+    factor_model.dataChanged.connect( # noqa
+        lambda top_left, bottom_right: changes.append(
+            (top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+        )
+    )
+    factor_model.layoutChanged.connect(lambda: layouts.append(True)) # noqa
+
+    factor_model.toggle_exclude(index=factor_model.index(1, 2))
+    factor_model.recalculate_factors()
+
+    assert layouts == []
+    assert changes == [(factor_model.ldf_row, 2, factor_model.ldf_row + factor_model.num_ldf_types - 1, 2)]
+
+
+def test_edit_selected_ldf(qtbot: QtBot, development_tab: DevelopmentTab) -> None:
+    """
+    Edits to the selected LDFs should show straight away, with the ultimates following once the refit finishes.
+    Only the last of several quick edits should be refit.
+    """
+
+    factor_model = development_tab.factor_model
+
+    ultimate_idx = factor_model.index(1, 10)
+
+    for value in ["1.1", "1.2", "1.5"]:
+        factor_model.setData(
+            index=factor_model.index(factor_model.selected_row_num, 8),
+            value=value,
+            role=Qt.ItemDataRole.EditRole
+        )
+
+    assert factor_model.data(
+        index=factor_model.index(factor_model.selected_row_num, 8),
+        role=Qt.ItemDataRole.DisplayRole
+    ) == '1.500'
+
+    assert factor_model.refit_pending()
+
+    qtbot.waitUntil(lambda: not factor_model.refit_pending(), timeout=5000)
+
+    assert factor_model.data(
+        index=ultimate_idx,
+        role=Qt.ItemDataRole.DisplayRole
+    ) == '{0:,.0f}'.format(51000534 * 1.5)
+
+    # Finished refits don't keep their workers around.
+    assert factor_model.refit_workers == {}
+
+    # Going back to an earlier selection is a cache hit and doesn't need the thread pool.
+    factor_model.setData(
+        index=factor_model.index(factor_model.selected_row_num, 8),
+        value="",
+        role=Qt.ItemDataRole.EditRole
+    )
+
+    qtbot.waitUntil(lambda: not factor_model.refit_pending(), timeout=5000)
+
+    assert factor_model.data(
+        index=ultimate_idx,
+        role=Qt.ItemDataRole.DisplayRole
+    ) == '51,000,534'
+
+
+def test_select_ldf(development_tab: DevelopmentTab) -> None:
+    """
+    Selecting LDFs should update the CDFs and ultimates.
+    """
+
+    factor_model = development_tab.factor_model
+
+    factor_model.select_ldf_row(index=factor_model.index(factor_model.ldf_row, 0))
+
+    cdf = factor_model.data(
+        index=factor_model.index(factor_model.cdf_row_num, 8),
+        role=Qt.ItemDataRole.DisplayRole
+    )
+
+    assert cdf == factor_model.data(
+        index=factor_model.index(factor_model.selected_row_num, 8),
+        role=Qt.ItemDataRole.DisplayRole
+    )
+
+    ultimate = factor_model.data(
+        index=factor_model.index(1, 10),
+        role=Qt.ItemDataRole.DisplayRole
+    )
+
+    assert ultimate == '{0:,.0f}'.format(51000534 * factor_model.cdf_row.iloc[0, 8])
+
+    factor_model.clear_selected_ldfs()
+
+    ultimate = factor_model.data(
+        index=factor_model.index(1, 10),
+        role=Qt.ItemDataRole.DisplayRole
+    )
+
+    assert ultimate == '51,000,534'
+
+
 # def test_add_vol_wtd(qtbot: QtBot, development_tab: DevelopmentTab) -> None:
 #     """
 #     Opens the ldf average box and adds the three-ear vol wtd. average.
@@ -4,7 +4,10 @@ from faslr.__main__ import (
     MainWindow
 )
 
-from faslr.connection import populate_project_tree
+from faslr.connection import (
+    populate_project_tree,
+    session_scope
+)
 
 import faslr.core as core
 
@@ -13,6 +16,12 @@ from faslr.project import (
     ProjectTreeView
 )
 
+from faslr.schema import (
+    CountryTable,
+    LOBTable,
+    StateTable
+)
+
 from pynput.keyboard import (
     Controller,
     Key
@@ -27,6 +36,8 @@ from PyQt6.QtWidgets import QApplication
 
 from pytestqt.qtbot import QtBot
 
+from typing import Callable
+
 
 @pytest.fixture()
 def main_window(
@@ -225,6 +236,109 @@ def test_add_project_existing_country_state(main_window: MainWindow) -> None:
     main_window.menu_bar.new_project()
 
 
+def test_load_projects(
+        main_window: MainWindow,
+        recorded_statements: Callable
+) -> None:
+    """
+    Only the countries should be fetched when the project tree is loaded, along with the number of states in each.
+    The states and LOBs are fetched when their parents are expanded.
+    """
+
+    project_model = main_window.project_model
+
+    with recorded_statements(db_path=core.db) as statements:
+        project_model.load_projects(db_path=core.db)
+
+    # One query for the number of countries and one for the countries themselves.
+    assert len(statements) == 2
+
+    with session_scope(db_path=core.db) as session:
+        n_countries = session.query(CountryTable).count()
+        first_country = session.query(CountryTable).order_by(CountryTable.country_id).first()
+        country_id = first_country.project_id
+        n_states = session.query(StateTable).filter(StateTable.country_id == first_country.country_id).count()
+
+    country = project_model.item(0, 0)
+
+    assert project_model.rowCount() == n_countries
+    assert project_model.child_counts[country_id] == n_states
+    assert country.rowCount() == 0
+    assert project_model.hasChildren(country.index())
+    assert project_model.canFetchMore(country.index())
+
+    project_model.fetchMore(country.index())
+
+    assert country.rowCount() == n_states
+    assert not project_model.canFetchMore(country.index())
+    assert {country.child(row, 0).segment_level for row in range(n_states)} == {'state'}
+
+    state = country.child(0, 0)
+    project_model.fetchMore(state.index())
+
+    with session_scope(db_path=core.db) as session:
+        n_lobs = session.query(LOBTable).join(
+            StateTable,
+            StateTable.location_id == LOBTable.location_id
+        ).filter(StateTable.project_id == country.child(0, 1).text()).count()
+
+    assert state.rowCount() == n_lobs
+    assert not project_model.hasChildren(state.child(0, 0).index())
+
+
+def test_fetch_more_batches(
+        main_window: MainWindow,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Children are fetched in batches of PROJECT_FETCH_SIZE.
+    """
+
+    monkeypatch.setattr('faslr.project.PROJECT_FETCH_SIZE', 1)
+
+    project_model = main_window.project_model
+    project_model.load_projects(db_path=core.db)
+
+    country = project_model.item(0, 0)
+    n_states = project_model.child_counts[project_model.project_id(country.index())]
+
+    assert project_model.rowCount() == 1
+
+    for batch in range(n_states):
+        assert project_model.canFetchMore(country.index())
+        project_model.fetchMore(country.index())
+        assert country.rowCount() == batch + 1
+
+    assert not project_model.canFetchMore(country.index())
+
+
+def test_make_project(
+        main_window: MainWindow,
+        project_dialog: ProjectDialog
+) -> None:
+    """
+    A new project under an existing country and state is appended to the tree, without rebuilding it.
+    """
+
+    project_model = main_window.project_model
+
+    country = project_model.item(0, 0)
+    project_model.fetchMore(country.index())
+    state = country.child(0, 0)
+    project_model.fetchMore(state.index())
+    n_lobs = state.rowCount()
+
+    project_dialog.country_edit.setText(country.text())
+    project_dialog.state_edit.setText(state.text())
+    project_dialog.lob_edit.setText("Aviation")
+    project_dialog.make_project(main_window=main_window)
+
+    assert project_model.item(0, 0) is country
+    assert state.rowCount() == n_lobs + 1
+    assert state.child(n_lobs, 0).text() == "Aviation"
+    assert project_model.project_items[state.child(n_lobs, 1).text()] is state.child(n_lobs, 0)
+
+
 def test_delete_project_country(main_window) -> None:
     """
     Test deleting a project at the country level.
@@ -247,11 +361,20 @@ def test_delete_project_state(main_window) -> None:
     """
 
     idx_country = main_window.project_model.index(0, 0)
+    main_window.project_model.fetchMore(idx_country)
     item_country = main_window.project_model.itemFromIndex(idx_country)
     idx_state = item_country.child(0).index()
+    item_state = item_country.child(0)
+    main_window.project_model.fetchMore(idx_state)
+    lob_uuids = [item_state.child(row, 1).text() for row in range(item_state.rowCount())]
+    n_states = item_country.rowCount()
     main_window.project_pane.setCurrentIndex(idx_state)
     main_window.project_pane.delete_project()
 
+    # The state and its LOBs are removed from the tree.
+    assert item_country.rowCount() == n_states - 1
+    assert not set(lob_uuids) & set(main_window.project_model.project_items)
+
 
 def test_delete_project_lob(main_window) -> None:
     """
@@ -262,13 +385,22 @@ def test_delete_project_lob(main_window) -> None:
     """
 
     idx_country = main_window.project_model.index(0, 0)
+    main_window.project_model.fetchMore(idx_country)
     item_country = main_window.project_model.itemFromIndex(idx_country)
     idx_state = item_country.child(0).index()
+    main_window.project_model.fetchMore(idx_state)
     item_state = main_window.project_model.itemFromIndex(idx_state)
     idx_lob = item_state.child(0).index()
+    lob_uuid = item_state.child(0, 1).text()
+    n_lobs = item_state.rowCount()
     main_window.project_pane.setCurrentIndex(idx_lob)
     main_window.project_pane.delete_project()
 
+    # Only the LOB is removed from the tree.
+    assert main_window.project_model.item(0, 0) is item_country
+    assert item_state.rowCount() == n_lobs - 1
+    assert lob_uuid not in main_window.project_model.project_items
+
 
 def test_project_tree_context(
         qtbot: QtBot,
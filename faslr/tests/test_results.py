@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chainladder import Triangle
+
+from faslr import schema
+
+from faslr.analysis import AnalysisTab
+
+from faslr.connection import (
+    get_engine,
+    session_scope
+)
+
+from faslr.constants import SAMPLE_DIALOG_PATH
+
+from faslr.results import ViewResultCache
+
+from faslr.schema import (
+    ProjectViewBlob,
+    ProjectViewResult,
+    ProjectViewTable
+)
+
+from faslr.utilities.storage import pack_frame
+
+from pytestqt.qtbot import QtBot
+
+COLUMNS = ['Paid Claims', 'Reported Claims']
+
+
+@pytest.fixture()
+def view(sample_db: str) -> tuple:
+    """
+    Saves a view in columnar storage and returns its id and triangle.
+    """
+
+    frame = pd.read_csv(SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv')
+
+    with get_engine(db_path=sample_db).begin() as connection:
+
+        schema.Base.metadata.create_all(connection)
+
+        view_id = connection.execute(
+            ProjectViewTable.__table__.insert().values(
+                name='Results',
+                origin='Accident Year',
+                development='Calendar Year',
+                columns=';'.join(COLUMNS),
+                cumulative=True
+            )
+        ).inserted_primary_key[0]
+
+        connection.execute(
+            ProjectViewBlob.__table__.insert().values(
+                view_id=view_id,
+                data=pack_frame(frame=frame)
+            )
+        )
+
+    triangle = Triangle(
+        data=frame,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=COLUMNS,
+        cumulative=True
+    )
+
+    yield view_id, triangle
+
+
+def count_results(
+        db_path: str,
+        view_id: int
+) -> int:
+
+    with session_scope(db_path=db_path) as session:
+        return session.query(ProjectViewResult).filter(ProjectViewResult.view_id == view_id).count()
+
+
+def test_view_result_cache(
+        sample_db: str,
+        view: tuple
+) -> None:
+    """
+    A result should be calculated once, read back by later caches of the same view, and recalculated after the
+    view's data change.
+    """
+
+    view_id, triangle = view
+    calls = []
+
+    def compute() -> dict:
+        calls.append(1)
+        return {'ldf': np.array([1.5, 1.2, 1.0])}
+
+    for _ in range(2):
+        results = ViewResultCache.from_triangle(
+            db_path=sample_db,
+            view_id=view_id,
+            triangle=triangle
+        )
+
+        result = results.get(
+            key=('ldf', 'volume', 3),
+            compute=compute
+        )
+
+        np.testing.assert_array_equal(result['ldf'], [1.5, 1.2, 1.0])
+
+    assert len(calls) == 1
+    assert results.hits == 1
+
+    # Results calculated from different data are neither returned nor kept.
+    other = ViewResultCache(
+        db_path=sample_db,
+        view_id=view_id,
+        data_hash='other'
+    )
+    other.get(key=('ldf', 'volume', 3), compute=compute)
+
+    assert len(calls) == 2
+    assert count_results(db_path=sample_db, view_id=view_id) == 1
+
+    # Changing the view's data deletes its results.
+    with get_engine(db_path=sample_db).begin() as connection:
+        connection.execute(
+            ProjectViewBlob.__table__.update().where(
+                ProjectViewBlob.view_id == view_id
+            ).values(data=b'')
+        )
+
+    assert count_results(db_path=sample_db, view_id=view_id) == 0
+
+
+def test_analysis_results(
+        qtbot: QtBot,
+        sample_db: str,
+        view: tuple
+) -> None:
+    """
+    Reopening a view should read its diagnostics back rather than recalculate them.
+    """
+
+    view_id, triangle = view
+
+    tabs = []
+    for _ in range(2):
+        results = ViewResultCache.from_triangle(
+            db_path=sample_db,
+            view_id=view_id,
+            triangle=triangle
+        )
+
+        tab = AnalysisTab(
+            triangle=triangle,
+            results=results
+        )
+        qtbot.addWidget(tab)
+
+        tabs.append(tab)
+
+    # Each column has an individual-years valuation test and two all-years tests.
+    assert results.misses == 0
+    assert results.hits == 3 * len(COLUMNS)
+
+    expected = AnalysisTab(triangle=triangle)
+    qtbot.addWidget(expected)
+
+    for column in COLUMNS:
+        pd.testing.assert_frame_equal(
+            tabs[1].mack_valuation_individual_groupboxes[column].individual_model._data,
+            expected.mack_valuation_individual_groupboxes[column].individual_model._data,
+            check_index_type=False
+        )
+
+        for groupboxes in ['mack_valuation_groupboxes', 'mack_development_groupboxes']:
+            assert getattr(tabs[1], groupboxes)[column].test_result_label.text() == \
+                getattr(expected, groupboxes)[column].test_result_label.text()
+
+    # A different critical value is calculated and stored alongside the others.
+    tabs[1].mack_valuation_individual_groupboxes['Paid Claims'].spin_box.setValue(0.2)
+
+    assert results.misses == 1
@@ -21,7 +21,21 @@
 #
 # connection.close()
 
+import pytest
+import re
+import sqlalchemy as sa
+
+from faslr.connection import get_engine
+
+from faslr.project import (
+    country_query,
+    lob_query,
+    state_query
+)
+
 from faslr.schema import (
+    Base,
+    create_missing_indexes,
     CountryTable,
     LocationTable,
     StateTable,
@@ -90,3 +104,89 @@ def test_index_values_table() -> None:
     index_values_table = IndexValuesTable()
 
     repr(index_values_table)
+
+
+# The queries run when the project tree is loaded, projects are created and deleted, and data views and indexes are
+# opened. Each should be able to use an index rather than scanning its table.
+hot_queries = {
+    'open_triangle': sa.select(
+        ProjectViewData.accident_year,
+        ProjectViewData.calendar_year,
+        ProjectViewData.paid_loss,
+        ProjectViewData.reported_loss
+    ).where(ProjectViewData.view_id == 1),
+    'project_tree_countries': country_query(offset=0),
+    'project_tree_states': state_query(country_id='uuid', offset=0),
+    'project_tree_lobs': lob_query(state_id='uuid', offset=0),
+    'make_project_country': sa.select(CountryTable).where(CountryTable.country_name == 'USA'),
+    'make_project_state': sa.select(StateTable).where(
+        StateTable.state_name == 'Texas'
+    ).where(StateTable.country_id == 1),
+    'delete_project_lob': sa.select(LOBTable).where(LOBTable.project_id == 'uuid'),
+    'project_views': sa.select(
+        ProjectViewTable.view_id,
+        ProjectViewTable.name,
+        ProjectViewTable.description,
+        ProjectViewTable.created,
+        ProjectViewTable.modified
+    ).where(ProjectViewTable.project_id == 'uuid').order_by(ProjectViewTable.view_id).limit(200).offset(200),
+    'index_from_id': sa.select(IndexValuesTable).where(IndexValuesTable.index_id == 1).order_by(IndexValuesTable.year)
+}
+
+
+# Steps that are expected in the plans of some queries. The top level of the project tree lists every country, and
+# each batch of children is sorted after the indexes have found the children of a single node.
+expected_steps = {
+    'project_tree_countries': ['SCAN country'],
+    'project_tree_states': ['USE TEMP B-TREE FOR ORDER BY'],
+    'project_tree_lobs': ['USE TEMP B-TREE FOR ORDER BY']
+}
+
+
+def query_plan(
+        connection: sa.Connection,
+        statement: sa.Select
+) -> list:
+    """
+    Returns the details of each step of the EXPLAIN QUERY PLAN output for a statement.
+    """
+
+    compiled = statement.compile(dialect=connection.dialect)
+    parameters = tuple(compiled.params[name] for name in compiled.positiontup)
+
+    rows = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + str(compiled), parameters).all()
+
+    return [row[-1] for row in rows]
+
+
+def is_full_scan(detail: str) -> bool:
+    # e.g., "SCAN state" rather than "SEARCH state USING INDEX ..." or "SCAN state USING COVERING INDEX ...".
+    return re.fullmatch(r"SCAN \S+", detail) is not None or "TEMP B-TREE" in detail
+
+
+@pytest.mark.parametrize('query', hot_queries.keys())
+def test_query_plan(
+        sample_db: str,
+        query: str
+) -> None:
+
+    def unexpected_steps(plan: list) -> list:
+        return [detail for detail in plan if detail not in expected_steps.get(query, [])]
+
+    with get_engine(db_path=sample_db).begin() as connection:
+
+        # Start from a database without the indexes, as created by an earlier version.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.exec_driver_sql('DROP INDEX IF EXISTS "{0}"'.format(index.name))
+
+        assert any(is_full_scan(detail) for detail in unexpected_steps(query_plan(connection, hot_queries[query])))
+
+        created = create_missing_indexes(connection=connection)
+
+        assert 'ix_project_view_data_view_id' in created
+        assert create_missing_indexes(connection=connection) == []
+
+        plan = unexpected_steps(query_plan(connection, hot_queries[query]))
+
+        assert not any(is_full_scan(detail) for detail in plan), plan
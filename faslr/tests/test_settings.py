@@ -3,10 +3,20 @@ import pytest
 
 from faslr.__main__ import MainWindow
 
-from faslr.constants import DEFAULT_DIALOG_PATH
+from faslr.connection import (
+    dispose_engine,
+    get_engine
+)
+
+from faslr.constants import (
+    DEFAULT_DIALOG_PATH,
+    SETTINGS_LIST
+)
 
 import faslr.core as core
 
+from faslr.core import get_pragma_profile
+
 from faslr.settings import (
     SettingsDialog,
     SettingsListModel
@@ -217,3 +227,45 @@ def test_reset_connection(
         Qt.MouseButton.LeftButton,
         delay=1
     )
+
+
+def test_settings_pragma_profile(
+        qtbot: QtBot,
+        setup_config: str,
+        settings_dialog: SettingsDialog,
+        sample_db: str,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Choosing a connection profile should save it to the config file and apply it to new connections. The user is told
+    if the journal mode of the open database can't be changed because it is in use.
+    """
+
+    monkeypatch.setattr(core, 'pragma_profile', core.pragma_profile)
+    monkeypatch.setattr(core, 'db', sample_db)
+
+    qtbot.addWidget(settings_dialog)
+
+    idx = settings_dialog.list_pane.model().index(SETTINGS_LIST.index("Database"))
+    settings_dialog.update_config_layout(index=idx)
+
+    assert settings_dialog.configuration_layout.currentWidget() is settings_dialog.database_container
+    assert settings_dialog.pragma_profile_buttons['Concurrent'].isChecked()
+
+    settings_dialog.pragma_profile_buttons['Concurrent'].click()
+
+    assert settings_dialog.journal_mode_label.text() == ""
+
+    connection = get_engine(db_path=sample_db).connect()
+    connection.exec_driver_sql("SELECT COUNT(*) FROM country").scalar()
+
+    settings_dialog.pragma_profile_buttons['Default'].click()
+
+    assert settings_dialog.pragma_profile_buttons['Default'].isChecked()
+    assert core.pragma_profile == 'Default'
+    assert get_pragma_profile(config_path=setup_config) == 'Default'
+    assert "could not be changed to DELETE" in settings_dialog.journal_mode_label.text()
+
+    connection.invalidate()
+    connection.close()
+    dispose_engine(db_path=sample_db)
@@ -185,6 +185,36 @@ def test_triangle_model_ratio(
     assert ratio_test == ratio_expectation
 
 
+def test_display_cache(
+        triangle_model: TriangleModel
+) -> None:
+    """
+    Check that the precomputed display strings and headers follow changes to the underlying data once the cache
+    is updated.
+    """
+
+    assert triangle_model.display_values.shape == (triangle_model.n_rows, triangle_model.n_columns)
+
+    assert triangle_model.headerData(
+        0,
+        Qt.Orientation.Vertical,
+        role=Qt.ItemDataRole.DisplayRole
+    ) == str(triangle_model._data.index[0]) # noqa
+
+    triangle_model._data.iloc[0, 5] = 1234567 # noqa
+    triangle_model.update_display_cache()
+
+    assert triangle_model.data(
+        triangle_model.index(0, 5),
+        role=Qt.ItemDataRole.DisplayRole
+    ) == '1,234,567'
+
+    assert triangle_model.data(
+        triangle_model.index(0, 5),
+        role=Qt.ItemDataRole.BackgroundRole
+    ) is None
+
+
 def test_strikeout(qtbot: QtBot) -> None:
     """
     Check whether double-clicking a link ratio strikes it out.
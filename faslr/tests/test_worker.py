@@ -0,0 +1,70 @@
+import time
+
+from faslr.worker import Worker
+
+from PyQt6.QtCore import QThreadPool
+
+from pytestqt.qtbot import QtBot
+
+
+def divide(
+        a: float,
+        b: float
+) -> float:
+    return a / b
+
+
+def test_worker(qtbot: QtBot) -> None:
+
+    worker = Worker(1, divide, 6, b=3)
+
+    with qtbot.waitSignal(worker.signals.finished, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(worker)
+
+    assert blocker.args == [1, 2]
+
+    qtbot.waitUntil(lambda: worker.done, timeout=5000)
+
+
+def test_worker_error(qtbot: QtBot) -> None:
+
+    worker = Worker(2, divide, 1, b=0)
+
+    with qtbot.waitSignal(worker.signals.error, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(worker)
+
+    assert blocker.args[0] == 2
+    assert isinstance(blocker.args[1], ZeroDivisionError)
+
+    qtbot.waitUntil(lambda: worker.done, timeout=5000)
+
+
+def test_worker_cancel(qtbot: QtBot) -> None:
+    """
+    A function that stops when the worker is cancelled should make the worker emit cancelled rather than error, and
+    should be able to report its progress.
+    """
+
+    def count(worker: Worker) -> None:
+
+        for i in range(1000):
+            worker.report_progress('count', i / 1000)
+            if worker.is_cancelled():
+                raise RuntimeError("Cancelled")
+
+            time.sleep(0.01)
+
+    worker = Worker(3, count)
+    worker.args = (worker,)
+
+    with qtbot.waitSignal(worker.signals.progress, timeout=5000) as blocker:
+        QThreadPool.globalInstance().start(worker)
+
+    assert blocker.args[:2] == [3, 'count']
+
+    with qtbot.waitSignal(worker.signals.cancelled, timeout=5000) as blocker:
+        worker.cancel()
+
+    assert blocker.args == [3]
+
+    qtbot.waitUntil(lambda: worker.done, timeout=5000)
@@ -0,0 +1,44 @@
+import numpy as np
+
+from faslr.utilities import (
+    array_fingerprint,
+    LRUCache
+)
+
+
+def test_lru_cache() -> None:
+
+    cache = LRUCache(maxsize=2)
+
+    assert cache.get('a', lambda: 1) == 1
+    assert cache.get('b', lambda: 2) == 2
+    assert cache.get('a', lambda: 3) == 1
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+    # 'b' is the least recently used and should be evicted.
+    cache.put('c', 3)
+
+    assert len(cache) == 2
+    assert 'a' in cache
+    assert 'b' not in cache
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_array_fingerprint() -> None:
+
+    values = np.array([[1.0, 2.0], [3.0, np.nan]])
+    mask = np.zeros((2, 2), dtype=bool)
+
+    assert array_fingerprint(values, mask) == array_fingerprint(values.copy(), mask.copy())
+    assert array_fingerprint(values) != array_fingerprint(values.reshape(1, 4))
+
+    mask[0, 0] = True
+
+    assert array_fingerprint(values, mask) != array_fingerprint(values, ~mask)
@@ -0,0 +1,144 @@
+import chainladder as cl
+import numpy as np
+import pandas as pd
+
+from faslr.constants import SAMPLE_DIALOG_PATH
+
+from faslr.utilities.importing import (
+    import_dtypes,
+    read_csv_aggregated,
+    read_csv_sample
+)
+
+from pathlib import Path
+
+us_auto = pd.read_csv(SAMPLE_DIALOG_PATH + 'friedland_us_auto_steady_state.csv')
+columns = ['Paid Claims', 'Reported Claims']
+
+
+def test_read_csv_sample(tmp_path: Path) -> None:
+
+    file_path = tmp_path / 'us_auto.csv'
+    us_auto.to_csv(file_path, index=False)
+
+    sample = read_csv_sample(
+        file_path=file_path,
+        n_rows=5
+    )
+
+    assert list(sample.columns) == list(us_auto.columns)
+    assert len(sample) == 5
+
+    dtypes = import_dtypes(
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=columns
+    )
+
+    assert dtypes == {
+        'Accident Year': str,
+        'Calendar Year': str,
+        'Paid Claims': 'float64',
+        'Reported Claims': 'float64'
+    }
+
+
+def test_read_csv_aggregated(tmp_path: Path) -> None:
+    """
+    Splitting each cell of a triangle into shuffled transactions, and streaming them in chunks much smaller than the
+    file, should aggregate back to the same triangle. Unmapped columns are not read.
+    """
+
+    transactions = us_auto.loc[us_auto.index.repeat(3)].copy()
+    transactions[columns] = transactions[columns] / 3
+    transactions['Claim Number'] = range(len(transactions))
+    transactions = transactions.sample(frac=1, random_state=1)
+
+    file_path = tmp_path / 'us_auto_transactions.csv'
+    transactions.to_csv(file_path, index=False)
+
+    aggregated = read_csv_aggregated(
+        file_path=file_path,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=columns,
+        chunk_size=7
+    )
+
+    assert list(aggregated.columns) == ['Accident Year', 'Calendar Year'] + columns
+    assert not aggregated.duplicated(['Accident Year', 'Calendar Year']).any()
+
+    def make_triangle(data: pd.DataFrame) -> cl.Triangle:
+        return cl.Triangle(
+            data=data,
+            origin='Accident Year',
+            development='Calendar Year',
+            columns=columns,
+            cumulative=True
+        )
+
+    np.testing.assert_allclose(
+        np.nan_to_num(make_triangle(aggregated).values),
+        np.nan_to_num(make_triangle(us_auto).values)
+    )
+
+
+def test_read_csv_aggregated_blank_year(tmp_path: Path) -> None:
+    """
+    A blank year past the rows that a single chunk would infer integer years from should be left out, as pandas
+    does, rather than failing to parse, and the years should still come back as integers.
+    """
+
+    rows = pd.DataFrame(
+        {
+            'Accident Year': np.tile(np.arange(2000, 2012), 100),
+            'Calendar Year': np.repeat(np.arange(2000, 2100), 12),
+            'Paid Claims': 1.0,
+            'Reported Claims': 2.0
+        }
+    )
+
+    blank = pd.DataFrame(
+        {
+            'Accident Year': [None],
+            'Calendar Year': [2000],
+            'Paid Claims': [5.0],
+            'Reported Claims': [5.0]
+        }
+    )
+
+    file_path = tmp_path / 'blank_year.csv'
+    pd.concat([rows, blank]).to_csv(file_path, index=False)
+
+    aggregated = read_csv_aggregated(
+        file_path=file_path,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=columns,
+        chunk_size=500
+    )
+
+    expectation = pd.read_csv(file_path).groupby(['Accident Year', 'Calendar Year'])[columns].sum().reset_index()
+
+    assert aggregated['Accident Year'].dtype == np.dtype('int64')
+    assert aggregated['Calendar Year'].dtype == np.dtype('int64')
+    np.testing.assert_array_equal(aggregated['Accident Year'].to_numpy(), expectation['Accident Year'].to_numpy())
+    np.testing.assert_array_equal(aggregated['Calendar Year'].to_numpy(), expectation['Calendar Year'].to_numpy())
+    np.testing.assert_allclose(aggregated[columns].to_numpy(), expectation[columns].to_numpy())
+
+
+def test_read_csv_aggregated_empty(tmp_path: Path) -> None:
+
+    file_path = tmp_path / 'empty.csv'
+    us_auto.head(0).to_csv(file_path, index=False)
+
+    aggregated = read_csv_aggregated(
+        file_path=file_path,
+        origin='Accident Year',
+        development='Calendar Year',
+        columns=columns,
+        dtype={'Accident Year': 'int64', 'Calendar Year': 'int64'}
+    )
+
+    assert aggregated.empty
+    assert list(aggregated.columns) == ['Accident Year', 'Calendar Year'] + columns
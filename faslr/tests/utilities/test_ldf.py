@@ -0,0 +1,121 @@
+import chainladder as cl
+import numpy as np
+import pytest
+
+from faslr.utilities import (
+    ldf_averages,
+    load_sample,
+    triangle_values
+)
+
+us_auto = load_sample('us_industry_auto')['Paid Claims']
+us_auto_values = triangle_values(triangle=us_auto)
+
+# Strike out the first link ratio in each of the first three development periods.
+excluded = np.zeros((9, 9), dtype=bool)
+excluded[0, 0:3] = True
+drop_list = [('1998', 12), ('1998', 24), ('1998', 36)]
+
+
+@pytest.mark.parametrize('average', ['volume', 'simple', 'regression'])
+@pytest.mark.parametrize('n_years', [0, 1, 3, 5, 9])
+def test_ldf_averages(
+        average: str,
+        n_years: int
+) -> None:
+
+    expectation = cl.Development(
+        average=average,
+        n_periods=n_years
+    ).fit(us_auto).ldf_.values[0, 0, 0]
+
+    expectation_drop = cl.Development(
+        average=average,
+        n_periods=n_years,
+        drop=drop_list
+    ).fit(us_auto).ldf_.values[0, 0, 0]
+
+    factors = ldf_averages(
+        values=us_auto_values,
+        averages=[(average, n_years)]
+    )
+
+    factors_drop = ldf_averages(
+        values=us_auto_values,
+        averages=[(average, n_years)],
+        excluded=excluded
+    )
+
+    np.testing.assert_allclose(factors[0], expectation)
+    np.testing.assert_allclose(factors_drop[0], expectation_drop)
+
+
+@pytest.mark.parametrize('n_years', [3, 5, 9])
+def test_medial_average(n_years: int) -> None:
+
+    expectation = cl.Development(
+        average='simple',
+        n_periods=n_years,
+        drop_high=1,
+        drop_low=1
+    ).fit(us_auto).ldf_.values[0, 0, 0]
+
+    factors = ldf_averages(
+        values=us_auto_values,
+        averages=[('medial', n_years)]
+    )
+
+    np.testing.assert_allclose(factors[0], expectation)
+
+
+def test_geometric_average() -> None:
+
+    ratios = us_auto.link_ratio.values[0, 0]
+
+    factors = ldf_averages(
+        values=us_auto_values,
+        averages=[('geometric', 3)]
+    )
+
+    expectation = [np.exp(np.log(ratios[:, j][~np.isnan(ratios[:, j])][-3:]).mean()) for j in range(9)]
+
+    np.testing.assert_allclose(factors[0], expectation)
+
+
+def test_ldf_averages_batch() -> None:
+    """
+    Averages calculated together should match those calculated one at a time, and a development period with all of
+    its link ratios excluded should have no average.
+    """
+
+    averages = [('volume', 9), ('simple', 3), ('medial', 5), ('geometric', 9), ('regression', 2)]
+
+    excluded_column = excluded.copy()
+    excluded_column[:, 8] = True
+
+    factors = ldf_averages(
+        values=us_auto_values,
+        averages=averages,
+        excluded=excluded_column
+    )
+
+    for i, average in enumerate(averages):
+        np.testing.assert_allclose(
+            factors[i],
+            ldf_averages(
+                values=us_auto_values,
+                averages=[average],
+                excluded=excluded_column
+            )[0]
+        )
+
+    assert np.isnan(factors[:, 8]).all()
+
+
+def test_invalid_average() -> None:
+
+    with pytest.raises(ValueError):
+        ldf_averages(
+            values=us_auto_values,
+            averages=[('harmonic', 3)]
+        )
@@ -1,6 +1,20 @@
-from faslr.utilities.queries import delete_country
+import pandas as pd
+import pytest
 
-from faslr.connection import FaslrConnection
+from faslr.utilities.queries import (
+    bulk_insert,
+    delete_country,
+    sqlite_pragmas
+)
+
+from faslr.connection import (
+    FaslrConnection,
+    get_engine
+)
+
+from faslr.schema import ProjectViewData
+
+from sqlalchemy.exc import IntegrityError
 
 
 def test_delete_country(sample_db: str) -> None:
@@ -13,3 +27,76 @@ def test_delete_country(sample_db: str) -> None:
         country_id=1,
         session=f_connection.session
     )
+
+
+def make_view_data(n_rows: int) -> pd.DataFrame:
+
+    return pd.DataFrame(
+        {
+            'view_id': 1,
+            'accident_year': [2000 + i % 10 for i in range(n_rows)],
+            'calendar_year': [2000 + i % 10 + i % 3 for i in range(n_rows)],
+            'paid_loss': [float(i) for i in range(n_rows)],
+            'reported_loss': [float(2 * i) for i in range(n_rows)]
+        }
+    )
+
+
+def count_view_data(connection) -> int:
+    return connection.exec_driver_sql(
+        "SELECT COUNT(*) FROM project_view_data WHERE view_id = 1 AND paid_loss >= 0"
+    ).scalar()
+
+
+def test_bulk_insert(sample_db: str) -> None:
+
+    data = make_view_data(n_rows=25)
+
+    with get_engine(db_path=sample_db).connect() as connection:
+
+        before = count_view_data(connection)
+        connection.rollback()
+
+        # Chunks smaller than the data, passed both as a single frame and as a sequence of frames.
+        n_rows = bulk_insert(
+            connection=connection,
+            table=ProjectViewData.__table__,
+            data=data,
+            chunk_size=10
+        )
+
+        n_rows_chunked = bulk_insert(
+            connection=connection,
+            table=ProjectViewData.__table__,
+            data=[data.iloc[:5], data.iloc[5:]],
+            chunk_size=10
+        )
+
+        assert n_rows == n_rows_chunked == 25
+        assert count_view_data(connection) == before + 50
+
+        connection.rollback()
+
+        # Nothing is inserted if one of the chunks fails, here due to a view that does not exist.
+        with pytest.raises(IntegrityError):
+            bulk_insert(
+                connection=connection,
+                table=ProjectViewData.__table__,
+                data=[data, data.assign(view_id=-1)]
+            )
+
+        assert count_view_data(connection) == before + 50
+
+
+def test_sqlite_pragmas(sample_db: str) -> None:
+
+    with get_engine(db_path=sample_db).connect() as connection:
+
+        synchronous = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+        connection.rollback()
+
+        with sqlite_pragmas(connection=connection, pragmas={'synchronous': 'OFF'}):
+            assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 0
+            connection.rollback()
+
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == synchronous
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from faslr.utilities.storage import (
+    pack_arrays,
+    pack_frame,
+    unpack_arrays,
+    unpack_frame
+)
+
+
+def test_pack_frame() -> None:
+    """
+    A frame should come back from its blob with the same columns, in the same order, and the same values.
+    """
+
+    frame = pd.DataFrame(
+        {
+            'Accident Year': [2000, 2000, 2001],
+            'Calendar Year': [2000, 2001, 2001],
+            'Paid Loss': [1.5, np.nan, 3.25],
+            'Segment': ['A', 'B', 'C'],
+            'Valuation': pd.to_datetime(['2000-12-31', '2001-12-31', '2001-12-31'])
+        }
+    )
+
+    blob = pack_frame(frame=frame)
+
+    assert isinstance(blob, bytes)
+
+    pd.testing.assert_frame_equal(
+        unpack_frame(blob=blob),
+        frame,
+        check_dtype=False
+    )
+
+
+def test_pack_empty_frame() -> None:
+
+    frame = pd.DataFrame({'Paid Loss': pd.Series([], dtype=float)})
+
+    pd.testing.assert_frame_equal(
+        unpack_frame(blob=pack_frame(frame=frame)),
+        frame
+    )
+
+
+def test_pack_arrays() -> None:
+
+    arrays = {
+        'values': np.array([[True, False], [False, True]]),
+        'index': np.array(['Status', '2001'], dtype=object),
+        'status': np.array(True)
+    }
+
+    unpacked = unpack_arrays(blob=pack_arrays(arrays=arrays))
+
+    assert list(unpacked.keys()) == list(arrays.keys())
+
+    for name, values in arrays.items():
+        np.testing.assert_array_equal(unpacked[name], values.astype(str) if values.dtype == object else values)
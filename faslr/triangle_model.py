@@ -1,3 +1,5 @@
+import numpy as np
+
 from faslr.base_table import (
     FAbstractTableModel,
     FTableView
@@ -19,8 +21,7 @@ from faslr.utilities import (
 )
 
 from PyQt6.QtCore import (
-    Qt,
-    QVariant
+    Qt
 )
 
 from PyQt6.QtGui import (
@@ -59,48 +60,55 @@ class TriangleModel(FAbstractTableModel):
         self.excl_frame = self._data.copy()
         self.excl_frame = df_set_false(df=self.excl_frame)
 
-    def data(
-            self,
-            index,
-            role=None
-    ):
+        # Qt calls data() for every visible cell whenever the view is repainted, so the display strings, header
+        # labels and lower diagonal are worked out once here and data() only has to look them up.
+        self.display_values = None
+        self.lower_diagonal = None
+        self.column_labels = None
+        self.index_labels = None
 
-        if role == Qt.ItemDataRole.DisplayRole:
+        self.update_display_cache()
 
-            value = self._data.iloc[index.row(), index.column()]
+    def update_display_cache(self) -> None:
+        """
+        Formats every value in the triangle for display, to be called whenever _data changes.
+        """
 
-            # Display blank when there are nans in the lower-right hand of the triangle.
-            if str(value) == "nan":
+        # "value" means stuff like losses and premiums, should have 2 decimal places.
+        # for "ratio", want to display 3 decimal places.
+        if self.value_type == "value":
+            style = VALUE_STYLE
+        else:
+            style = RATIO_STYLE
 
-                display_value = BLANK_TEXT
-            else:
-                # "value" means stuff like losses and premiums, should have 2 decimal places.
-                if self.value_type == "value":
+        values = self._data.to_numpy(dtype=float)
 
-                    display_value = VALUE_STYLE.format(value)
+        # Display blank when there are nans in the lower-right hand of the triangle.
+        self.display_values = np.array(
+            [BLANK_TEXT if np.isnan(value) else style.format(value) for value in values.ravel()],
+            dtype=object
+        ).reshape(values.shape)
 
-                # for "ratio", want to display 3 decimal places.
-                else:
+        rows, columns = np.indices(values.shape)
+        self.lower_diagonal = columns >= self.n_rows - rows
 
-                    display_value = RATIO_STYLE.format(value)
+        self.column_labels = [str(column) for column in self._data.columns]
+        self.index_labels = [str(label) for label in self._data.index]
 
-                display_value = str(display_value)
+    def data(
+            self,
+            index,
+            role=None
+    ):
 
-            self.setData(
-                self.index(
-                    index.row(),
-                    index.column()
-                ),
-                QVariant(Qt.AlignmentFlag.AlignRight),
-                Qt.ItemDataRole.TextAlignmentRole
-            )
+        if role == Qt.ItemDataRole.DisplayRole:
 
-            return display_value
+            return self.display_values[index.row(), index.column()]
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             return Qt.AlignmentFlag.AlignRight
 
-        if role == Qt.ItemDataRole.BackgroundRole and (index.column() >= self.n_rows - index.row()):
+        if role == Qt.ItemDataRole.BackgroundRole and self.lower_diagonal[index.row(), index.column()]:
 
             return LOWER_DIAG_COLOR
 
@@ -124,10 +132,10 @@ class TriangleModel(FAbstractTableModel):
         # section is the index of the column/row.
         if role == Qt.ItemDataRole.DisplayRole:
             if qt_orientation == Qt.Orientation.Horizontal:
-                return str(self._data.columns[p_int])
+                return self.column_labels[p_int]
 
             if qt_orientation == Qt.Orientation.Vertical:
-                return str(self._data.index[p_int])
+                return self.index_labels[p_int]
 
 
 class TriangleView(FTableView):
@@ -3,6 +3,13 @@ from faslr.utilities.gui import open_item_tab
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
+from faslr.utilities.cache import (
+    array_fingerprint,
+    DEVELOPMENT_CACHE,
+    LRUCache,
+    triangle_fingerprint
+)
+
 from faslr.utilities.chainladder import (
     fetch_cdf,
     fetch_latest_diagonal,
@@ -19,6 +26,12 @@ from faslr.utilities.dataframe import (
     df_set_false
 )
 
+from faslr.utilities.ldf import (
+    cdf_ultimate,
+    ldf_averages,
+    triangle_values
+)
+
 from faslr.utilities.sample import (
     auto_bi_olep,
     load_sample,
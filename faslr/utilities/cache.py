@@ -0,0 +1,125 @@
+"""
+Contains a size-bounded, least-recently-used cache for results that are expensive to recompute, such as fitted
+development factors and ultimates, along with the helpers used to build cache keys from NumPy arrays.
+"""
+from __future__ import annotations
+
+import hashlib
+import numpy as np
+
+from collections import OrderedDict
+
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    TYPE_CHECKING
+)
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+
+
+class LRUCache:
+    """
+    Maps keys to results, evicting the least recently used result once more than maxsize results are stored.
+    Keeps count of hits and misses so that the effectiveness of the cache can be checked.
+
+    Parameters
+    ----------
+    maxsize: int
+        The maximum number of results to keep.
+    """
+    def __init__(
+            self,
+            maxsize: int = 128
+    ):
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._results
+
+    def get(
+            self,
+            key: Hashable,
+            compute: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the result stored under key, calling compute to calculate and store it if there isn't one.
+        """
+
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        self.misses += 1
+        result = compute()
+        self.put(key, result)
+
+        return result
+
+    def put(
+            self,
+            key: Hashable,
+            result: Any
+    ) -> None:
+
+        self._results[key] = result
+        self._results.move_to_end(key)
+
+        while len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes all results and resets the hit and miss counts.
+        """
+
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def array_fingerprint(*arrays: np.ndarray) -> str:
+    """
+    Hashes the shapes and contents of one or more arrays, for use in cache keys.
+    """
+
+    digest = hashlib.sha1()
+
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+def triangle_fingerprint(triangle: Triangle) -> str:
+    """
+    Hashes the values of a triangle along with its column names and origin and development labels, so that two
+    triangles with the same numbers laid out differently get different fingerprints.
+    """
+
+    labels = [
+        list(triangle.columns),
+        [str(origin) for origin in triangle.origin],
+        [str(development) for development in triangle.development]
+    ]
+
+    return array_fingerprint(
+        np.asarray(triangle.values, dtype=float),
+        np.array(str(labels))
+    )
+
+
+# Shared by the models that calculate development factors, CDFs and ultimates.
+DEVELOPMENT_CACHE = LRUCache(maxsize=256)
@@ -0,0 +1,235 @@
+"""
+Contains the routines used to import triangle data from files. A file is sampled to fill in the import wizard, and
+then streamed in chunks that are aggregated to one row per origin and development period as they are read, so that
+large transactional extracts can be imported in bounded memory.
+"""
+from __future__ import annotations
+
+import os
+import pandas as pd
+
+from faslr.constants import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_SAMPLE_ROWS
+)
+
+from pandas import DataFrame
+
+from typing import Callable
+
+
+class ImportCancelled(Exception):
+    """
+    Raised by an import that has been asked to stop.
+    """
+
+
+def check_cancelled(cancelled: Callable[[], bool] = None) -> None:
+    """
+    Raises ImportCancelled if the import has been asked to stop.
+    """
+
+    if cancelled is not None and cancelled():
+        raise ImportCancelled()
+
+
+def read_csv_sample(
+        file_path: str,
+        n_rows: int = IMPORT_SAMPLE_ROWS,
+        **kwargs
+) -> DataFrame:
+    """
+    Reads the header and the first n_rows rows of a csv file.
+
+    Parameters
+    ----------
+    file_path: str
+        The path to the file.
+    n_rows: int
+        The number of rows to read.
+    **kwargs
+        Passed to pd.read_csv, e.g., usecols.
+    """
+
+    return pd.read_csv(
+        file_path,
+        nrows=n_rows,
+        **kwargs
+    )
+
+
+def import_dtypes(
+        origin: str,
+        development: str,
+        columns: list
+) -> dict:
+    """
+    Chooses the types to read the columns of a file with, so that every chunk is parsed the same way. The origin and
+    development columns are read as strings, since the types pandas would infer from one chunk, e.g., integers, may
+    not fit the rest of the file, e.g., if a later chunk has a blank year. Their types are inferred once the chunks
+    have been combined, see infer_key_types. The value columns are read as floats.
+
+    Parameters
+    ----------
+    origin: str
+        The name of the origin column.
+    development: str
+        The name of the development column.
+    columns: list
+        The names of the value columns.
+    """
+
+    dtypes = {
+        origin: str,
+        development: str
+    }
+
+    for column in columns:
+        dtypes[column] = 'float64'
+
+    return dtypes
+
+
+def read_csv_aggregated(
+        file_path: str,
+        origin: str,
+        development: str,
+        columns: list,
+        dtype: dict = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: Callable[[str, float], None] = None,
+        cancelled: Callable[[], bool] = None
+) -> DataFrame:
+    """
+    Streams a csv file in chunks and sums the value columns by origin and development period, which is how
+    chainladder combines duplicate rows when building a triangle. Only the mapped columns are read, and the partial
+    sums are combined whenever they grow past a chunk, so memory use does not grow with the length of the file.
+
+    Parameters
+    ----------
+    file_path: str
+        The path to the file.
+    origin: str
+        The name of the origin column.
+    development: str
+        The name of the development column.
+    columns: list
+        The names of the value columns.
+    dtype: dict
+        The types to read the columns with, see import_dtypes.
+    chunk_size: int
+        The number of rows to read at a time.
+    progress: Callable[[str, float], None]
+        Called with 'read' and the fraction of the file read after each chunk, and with 'aggregate' before and after
+        the partial sums are combined.
+    cancelled: Callable[[], bool]
+        Checked after each chunk, ImportCancelled is raised if it returns True.
+
+    Returns
+    -------
+    A DataFrame with the origin, development and value columns, with one row per origin and development period.
+    Rows with a blank origin or development period are left out, as they are by DataFrame.groupby.
+    """
+
+    keys = [origin, development]
+    usecols = list(dict.fromkeys(keys + columns))
+
+    if dtype is None:
+        dtype = import_dtypes(
+            origin=origin,
+            development=development,
+            columns=columns
+        )
+
+    if progress is None:
+        progress = ignore_progress
+
+    partials = []
+    n_partial_rows = 0
+
+    with open(file_path, 'rb') as handle, pd.read_csv(
+        handle,
+        usecols=usecols,
+        dtype=dtype,
+        chunksize=chunk_size
+    ) as reader:
+
+        size = max(os.fstat(handle.fileno()).st_size, 1)
+
+        for chunk in reader:
+
+            partial = chunk.groupby(keys, sort=False)[columns].sum(min_count=1)
+            partials.append(partial)
+            n_partial_rows += len(partial)
+
+            if len(partials) > 1 and n_partial_rows > chunk_size:
+                partials = [combine_partials(partials=partials)]
+                n_partial_rows = len(partials[0])
+
+            # The parser reads ahead, so the position of the file is only a rough measure of the rows parsed.
+            progress('read', min(handle.tell() / size, 1))
+            check_cancelled(cancelled=cancelled)
+
+    progress('read', 1)
+    progress('aggregate', 0)
+
+    if not partials:
+        aggregated = pd.DataFrame(columns=usecols)
+    else:
+        aggregated = infer_key_types(
+            aggregated=combine_partials(partials=partials).reset_index(),
+            keys=keys
+        )
+
+    progress('aggregate', 1)
+
+    return aggregated
+
+
+def ignore_progress(
+        stage: str,
+        fraction: float
+) -> None:
+    """
+    Stands in for a progress callback when none is given.
+    """
+
+
+def infer_key_types(
+        aggregated: DataFrame,
+        keys: list
+) -> DataFrame:
+    """
+    Converts the origin and development columns, read as strings, to numbers where every value is numeric, e.g.,
+    years, and to integers where every number is whole. Values that only differ as strings, e.g., 2001 and 2001.0,
+    are summed together once converted, and the result is sorted by origin and development period.
+    """
+
+    aggregated = aggregated.copy()
+
+    for key in keys:
+
+        try:
+            values = pd.to_numeric(aggregated[key])
+        except (ValueError, TypeError):
+            continue
+
+        if values.dtype.kind == 'f' and (values == values.round()).all():
+            values = values.astype('int64')
+
+        aggregated[key] = values
+
+    return aggregated.groupby(keys, sort=True).sum(min_count=1).reset_index()
+
+
+def combine_partials(partials: list) -> DataFrame:
+    """
+    Sums partial aggregates indexed by origin and development period.
+    """
+
+    if len(partials) == 1:
+        return partials[0]
+
+    combined = pd.concat(partials)
+
+    return combined.groupby(level=[0, 1], sort=False).sum(min_count=1)
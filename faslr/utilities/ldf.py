@@ -0,0 +1,163 @@
+"""
+Contains the routines used to average link ratios into LDFs without fitting a chainladder Development estimator.
+All the requested averages are calculated together from the same arrays, so adding an average costs a few array
+operations rather than another fit.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from chainladder import Triangle
+
+
+def triangle_values(triangle: Triangle) -> np.ndarray:
+    """
+    Extracts the cumulative values of a single-index, single-column triangle as a 2-D array with origin periods
+    along the rows and development periods along the columns. Zeros are treated as missing, consistent with
+    chainladder.
+    """
+
+    values = triangle.values[0, 0].astype(float)
+
+    return np.where(values == 0, np.nan, values)
+
+
+def ldf_averages(
+        values: np.ndarray,
+        averages: list,
+        excluded: np.ndarray = None
+) -> np.ndarray:
+    """
+    Calculates n-year averages of the link ratios of a triangle. The n-year window is taken over the latest n
+    link ratios of each development period before the excluded ratios are removed, matching cl.Development, and a
+    development period with no remaining link ratios has no average.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The cumulative values of the triangle, with origin periods along the rows and development periods along the
+        columns, e.g., the output of triangle_values.
+    averages: list
+        A list of (average type, number of years) pairs, one for each set of averages to calculate. The average
+        type is one of the values of LDF_AVERAGES, i.e., 'volume', 'simple', 'regression', 'geometric' or 'medial'.
+        A number of years that is less than 1, or covers every origin period, uses all the link ratios.
+    excluded: np.ndarray
+        Boolean array indicating which link ratios to leave out. May have fewer rows than values, in which case the
+        remaining origin periods are not excluded.
+
+    Returns
+    -------
+    An array with one row for each average and one column for each development period of the link ratios.
+    """
+
+    x = values[:, :-1]
+    y = values[:, 1:]
+
+    n_origins, n_columns = x.shape
+
+    available = ~np.isnan(x) & ~np.isnan(y)
+
+    included = available.copy()
+    if excluded is not None:
+        included[:excluded.shape[0], :excluded.shape[1]] &= ~excluded
+
+    # Position of each available link ratio counting back from the latest one in its development period.
+    recency = np.cumsum(available[::-1], axis=0)[::-1]
+
+    x = np.where(available, x, 0)
+    y = np.where(available, y, 0)
+    ratios = np.divide(y, x, out=np.ones_like(x), where=available)
+
+    factors = np.full((len(averages), n_columns), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, (average, n_years) in enumerate(averages):
+
+            n_years = int(n_years)
+
+            if 1 <= n_years < n_origins - 1:
+                weights = included & (recency <= n_years)
+            else:
+                weights = included
+
+            counts = weights.sum(axis=0)
+
+            if average == "volume":
+                factors[i] = (y * weights).sum(axis=0) / (x * weights).sum(axis=0)
+            elif average == "simple":
+                factors[i] = (ratios * weights).sum(axis=0) / counts
+            elif average == "regression":
+                factors[i] = (x * y * weights).sum(axis=0) / (x * x * weights).sum(axis=0)
+            elif average == "geometric":
+                factors[i] = np.exp((np.log(ratios) * weights).sum(axis=0) / counts)
+            elif average == "medial":
+                factors[i] = medial_average(
+                    ratios=ratios,
+                    weights=weights
+                )
+            else:
+                raise ValueError("Invalid average type specified: " + str(average))
+
+    return factors
+
+
+def medial_average(
+        ratios: np.ndarray,
+        weights: np.ndarray
+) -> np.ndarray:
+    """
+    Straight average of each column that leaves out the highest and lowest of the weighted link ratios. Columns with
+    fewer than three link ratios are averaged without leaving any out, consistent with chainladder's drop_high and
+    drop_low.
+    """
+
+    counts = weights.sum(axis=0)
+
+    # Sort the included ratios to the top of each column, with the excluded ones pushed to the bottom.
+    ordered = np.sort(np.where(weights, ratios, np.inf), axis=0)
+    position = np.arange(ordered.shape[0])[:, None]
+
+    trim = counts >= 3
+    keep = (position >= trim) & (position < counts - trim)
+
+    return np.where(keep, ordered, 0).sum(axis=0) / (counts - 2 * trim)
+
+
+def cdf_ultimate(
+        values: np.ndarray,
+        ldfs: np.ndarray
+) -> tuple:
+    """
+    Calculates the CDFs to ultimate from a set of selected LDFs and the resulting ultimate for each origin period,
+    matching cl.DevelopmentConstant followed by cl.Chainladder. Development periods without a selected LDF are
+    treated as fully developed.
+
+    Parameters
+    ----------
+    values: np.ndarray
+        The cumulative values of the triangle, with origin periods along the rows and development periods along the
+        columns, e.g., the output of triangle_values.
+    ldfs: np.ndarray
+        The selected LDF for each development period of the link ratios, NaN where there isn't one.
+
+    Returns
+    -------
+    A tuple of the CDFs for each development period of the link ratios and the ultimates for each origin period.
+    """
+
+    ldfs = np.where(np.isnan(ldfs), 1, ldfs)
+
+    cdfs = np.cumprod(ldfs[::-1])[::-1]
+
+    # Development period and value of the latest diagonal for each origin period.
+    observed = ~np.isnan(values)
+    latest_age = observed.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)
+    latest_diagonal = values[np.arange(observed.shape[0]), latest_age]
+
+    # Append a CDF of 1 for origin periods at the final development period.
+    ultimates = latest_diagonal * np.append(cdfs, 1)[latest_age]
+
+    return cdfs, ultimates
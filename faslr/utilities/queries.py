@@ -1,9 +1,27 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from contextlib import contextmanager
+
+from faslr.constants import BULK_INSERT_CHUNK_SIZE
+
 from faslr.schema import (
     LocationTable
 )
 
+from pandas import DataFrame
+
+from sqlalchemy import Table
+from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import Session
 
+from typing import (
+    Iterable,
+    Iterator
+)
+
 
 def delete_country(
         country_id: int,
@@ -13,3 +31,106 @@ def delete_country(
     country = session.query(LocationTable).filter(LocationTable.location_id == country_id).one()
     session.delete(country)
     session.commit()
+
+
+def bulk_insert(
+        connection: Connection,
+        table: Table,
+        data: DataFrame | Iterable[DataFrame],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE
+) -> int:
+    """
+    Inserts rows into a table through executemany, chunk_size rows at a time, which avoids building an ORM object
+    per row. Runs within the current transaction of the connection if there is one, otherwise within a
+    transaction of its own, so that either all the rows are inserted or none are.
+
+    Parameters
+    ----------
+    connection: Connection
+        The connection to insert the rows through.
+    table: Table
+        The table to insert into, e.g., ProjectViewData.__table__.
+    data: DataFrame | Iterable[DataFrame]
+        The rows to insert, with columns named after those of the table. May be passed as a sequence of DataFrames,
+        such as the chunks read by pd.read_csv, so that the whole data set never has to be held in memory.
+    chunk_size: int
+        The maximum number of rows to send to the database in one executemany.
+
+    Returns
+    -------
+    The number of rows inserted.
+    """
+
+    if isinstance(data, DataFrame):
+        data = [data]
+
+    start = time.perf_counter()
+    n_rows = 0
+
+    transaction = None if connection.in_transaction() else connection.begin()
+
+    try:
+        for frame in data:
+            for i in range(0, frame.shape[0], chunk_size):
+                records = frame.iloc[i:i + chunk_size].to_dict('records')
+                connection.execute(table.insert(), records)
+                n_rows += len(records)
+    except Exception:
+        if transaction is not None:
+            transaction.rollback()
+        raise
+    else:
+        if transaction is not None:
+            transaction.commit()
+
+    elapsed = time.perf_counter() - start
+
+    logging.info(
+        "Inserted %d rows into %s in %.2f seconds (%.0f rows/sec).",
+        n_rows,
+        table.name,
+        elapsed,
+        n_rows / elapsed if elapsed else 0
+    )
+
+    return n_rows
+
+
+@contextmanager
+def sqlite_pragmas(
+        connection: Connection,
+        pragmas: dict
+) -> Iterator[Connection]:
+    """
+    Sets PRAGMAs on a SQLite connection for the duration of the block, and restores their previous values
+    afterwards, since the connection goes back to a pool shared by the rest of the application. Some PRAGMAs,
+    such as synchronous, can't be changed inside a transaction, so the block must be entered outside one.
+
+    Parameters
+    ----------
+    connection: Connection
+        The connection to apply the PRAGMAs to.
+    pragmas: dict
+        Maps PRAGMA names to the values to set them to.
+    """
+
+    previous = {
+        name: connection.exec_driver_sql("PRAGMA " + name).scalar()
+        for name in pragmas
+    }
+
+    for name, value in pragmas.items():
+        connection.exec_driver_sql("PRAGMA {0} = {1}".format(name, value))
+
+    connection.commit()
+
+    try:
+        yield connection
+    finally:
+        if connection.in_transaction():
+            connection.rollback()
+
+        for name, value in previous.items():
+            connection.exec_driver_sql("PRAGMA {0} = {1}".format(name, value))
+
+        connection.commit()
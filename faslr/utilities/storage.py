@@ -0,0 +1,87 @@
+"""
+Contains the routines used to save a DataFrame as a single compressed blob of column arrays, so that it can be
+stored in one database row and read back in one fetch, without building an object per row.
+"""
+from __future__ import annotations
+
+import io
+import numpy as np
+import pandas as pd
+
+from pandas import DataFrame
+
+
+def pack_frame(frame: DataFrame) -> bytes:
+    """
+    Compresses the columns of a DataFrame into a blob of NumPy arrays, one per column, along with the column names.
+    The index is not kept. Columns of Python objects, such as strings, are stored as fixed-width strings, so that
+    the blob can be read back without unpickling.
+
+    Parameters
+    ----------
+    frame: DataFrame
+        The DataFrame to compress.
+
+    Returns
+    -------
+    The compressed blob, which unpack_frame turns back into a DataFrame.
+    """
+
+    arrays = {}
+    for i, column in enumerate(frame.columns):
+
+        values = frame[column].to_numpy()
+
+        if values.dtype == object:
+            values = values.astype(str)
+
+        arrays['column_' + str(i)] = values
+
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        names=np.array([str(column) for column in frame.columns], dtype=str),
+        **arrays
+    )
+
+    return buffer.getvalue()
+
+
+def unpack_frame(blob: bytes) -> DataFrame:
+    """
+    Rebuilds a DataFrame from a blob written by pack_frame.
+    """
+
+    with np.load(io.BytesIO(blob), allow_pickle=False) as arrays:
+
+        names = [str(name) for name in arrays['names']]
+
+        return pd.DataFrame(
+            {name: arrays['column_' + str(i)] for i, name in enumerate(names)},
+            columns=names
+        )
+
+
+def pack_arrays(arrays: dict) -> bytes:
+    """
+    Compresses a dictionary of NumPy arrays, keyed by name, into a blob. Arrays of Python objects are stored as
+    fixed-width strings, as in pack_frame.
+    """
+
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        **{name: values.astype(str) if values.dtype == object else values for name, values in arrays.items()}
+    )
+
+    return buffer.getvalue()
+
+
+def unpack_arrays(blob: bytes) -> dict:
+    """
+    Rebuilds the dictionary of arrays from a blob written by pack_arrays.
+    """
+
+    with np.load(io.BytesIO(blob), allow_pickle=False) as arrays:
+
+        return {name: arrays[name] for name in arrays.files}
@@ -0,0 +1,100 @@
+"""
+Runs calculations on a QThreadPool so that they don't block the GUI thread.
+"""
+import threading
+
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    pyqtSignal
+)
+
+from typing import Callable
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a Worker. QRunnable is not a QObject, so it can't emit signals itself. Each signal carries
+    the id of the job so that the receiver can tell whether the result is still wanted. Jobs that report their
+    progress emit the name of the current stage and the fraction of it that is done.
+    """
+    finished = pyqtSignal(int, object)
+    error = pyqtSignal(int, object)
+    progress = pyqtSignal(int, str, float)
+    cancelled = pyqtSignal(int)
+
+
+class Worker(QRunnable):
+    """
+    Calls a function on a thread from a QThreadPool and emits its result. Since the signals are created on the
+    GUI thread, the connected slots also run on the GUI thread, where it is safe to update the models.
+
+    The caller must keep a reference to the worker until it is done.
+
+    Long-running functions can be given report_progress and is_cancelled as callbacks. A function that sees that
+    the worker has been cancelled should raise an exception, and the worker then emits cancelled instead of error.
+
+    Parameters
+    ----------
+    job_id: int
+        Identifies the job in the signals emitted by the worker.
+    fn: Callable
+        The function to call. It should not touch any Qt objects.
+    """
+    def __init__(
+            self,
+            job_id: int,
+            fn: Callable,
+            *args,
+            **kwargs
+    ):
+        super().__init__()
+
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+        self.signals = WorkerSignals()
+
+        # Set once run has returned, after which the caller may drop its reference.
+        self.done = False
+
+        self.cancel_event = threading.Event()
+
+        # The caller keeps a reference to the worker until it is done, rather than handing it over to the pool.
+        # This lets the caller take it back off the queue with QThreadPool.tryTake.
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e: # noqa
+            if self.is_cancelled():
+                self.signals.cancelled.emit(self.job_id) # noqa
+            else:
+                self.signals.error.emit(self.job_id, e) # noqa
+        else:
+            self.signals.finished.emit(self.job_id, result) # noqa
+        finally:
+            self.done = True
+
+    def cancel(self) -> None:
+        """
+        Asks the function to stop. Safe to call from any thread.
+        """
+
+        self.cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+
+        return self.cancel_event.is_set()
+
+    def report_progress(
+            self,
+            stage: str,
+            fraction: float
+    ) -> None:
+
+        self.signals.progress.emit(self.job_id, stage, fraction) # noqa